@@ -0,0 +1,146 @@
+import atexit
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import ClassVar
+
+from base.constants import MEGABYTE
+from base.griptape_cloud_settings import get_cache_directory, get_int_setting
+from base.json_store import load_json, save_json
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DOWNLOAD_CACHE_MAX_SIZE_MB = 2048
+INDEX_FILE_NAME = "index.json"
+
+
+@dataclass
+class CachedAssetEntry:
+    content_hash: str
+    remote_updated_at: str | None
+
+
+@dataclass
+class CachedBlobEntry:
+    size: int
+    last_used: float
+
+
+class AssetDownloadCache:
+    """Content-addressed, size-bounded on-disk cache of downloaded assets.
+
+    Blobs are stored once per content hash, however many assets share that content. Each asset records the hash of
+    its content and the remote `updated_at` it was downloaded at, so a cached copy is only served while the remote
+    asset is unchanged. When the cache grows past its size limit, the least recently used blobs are evicted.
+
+    Cache hits only update the index in memory. It is written when a download is stored, and at exit.
+    """
+
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    _assets: ClassVar[dict[str, CachedAssetEntry] | None] = None
+    _blobs: ClassVar[dict[str, CachedBlobEntry]] = {}
+    _dirty: ClassVar[bool] = False
+
+    @classmethod
+    def make_key(cls, base_url: str, bucket_id: str, asset_name: str) -> str:
+        return f"{base_url.rstrip('/')}|{bucket_id}|{asset_name}"
+
+    @classmethod
+    def temp_path(cls) -> Path:
+        """Returns a path inside the cache directory to download to before storing, so storing is a rename."""
+        return cls._cache_directory() / "incoming" / f"{os.getpid()}-{threading.get_ident()}-{time.monotonic_ns()}"
+
+    @classmethod
+    def lookup(cls, key: str, remote_updated_at: str | None) -> Path | None:
+        """Returns the cached copy of the asset if it is still the remote version, otherwise None."""
+        if remote_updated_at is None:
+            return None
+        with cls._lock:
+            entry = cls._load().get(key)
+            if entry is None or entry.remote_updated_at != remote_updated_at:
+                return None
+            blob_path = cls._blob_path(entry.content_hash)
+            blob = cls._blobs.get(entry.content_hash)
+            if blob is None or not blob_path.exists():
+                del cls._load()[key]
+                cls._blobs.pop(entry.content_hash, None)
+                cls._dirty = True
+                return None
+            blob.last_used = time.time()
+            cls._dirty = True
+            return blob_path
+
+    @classmethod
+    def store(cls, key: str, path: Path, content_hash: str, remote_updated_at: str | None) -> Path:
+        """Moves a downloaded file into the cache and returns the path of the cached blob."""
+        blob_path = cls._blob_path(content_hash)
+        with cls._lock:
+            if blob_path.exists():
+                path.unlink(missing_ok=True)
+            else:
+                blob_path.parent.mkdir(parents=True, exist_ok=True)
+                path.replace(blob_path)
+            cls._load()[key] = CachedAssetEntry(content_hash=content_hash, remote_updated_at=remote_updated_at)
+            cls._blobs[content_hash] = CachedBlobEntry(size=blob_path.stat().st_size, last_used=time.time())
+            cls._evict(keep=content_hash)
+            cls._save()
+        return blob_path
+
+    @classmethod
+    def flush(cls) -> None:
+        """Writes the usage recorded by cache hits since the index was last saved."""
+        with cls._lock:
+            if cls._dirty:
+                cls._save()
+
+    @classmethod
+    def _evict(cls, keep: str) -> None:
+        max_size = get_int_setting("GT_CLOUD_DOWNLOAD_CACHE_MAX_SIZE_MB", DEFAULT_DOWNLOAD_CACHE_MAX_SIZE_MB) * MEGABYTE
+        total_size = sum(blob.size for blob in cls._blobs.values())
+        for content_hash, blob in sorted(cls._blobs.items(), key=lambda item: item[1].last_used):
+            if total_size <= max_size:
+                break
+            if content_hash == keep:
+                continue
+            cls._blob_path(content_hash).unlink(missing_ok=True)
+            del cls._blobs[content_hash]
+            total_size -= blob.size
+            for stale_key in [k for k, entry in (cls._assets or {}).items() if entry.content_hash == content_hash]:
+                del cls._load()[stale_key]
+            logger.info("Evicted %s (%d bytes) from the asset download cache", content_hash, blob.size)
+
+    @classmethod
+    def _cache_directory(cls) -> Path:
+        return get_cache_directory("downloads")
+
+    @classmethod
+    def _blob_path(cls, content_hash: str) -> Path:
+        algorithm, _, digest = content_hash.partition(":")
+        return cls._cache_directory() / "blobs" / algorithm / digest[:2] / digest
+
+    @classmethod
+    def _load(cls) -> dict[str, CachedAssetEntry]:
+        if cls._assets is None:
+            cls._assets = {}
+            data = load_json(cls._cache_directory() / INDEX_FILE_NAME, "asset download cache index") or {}
+            try:
+                cls._assets = {key: CachedAssetEntry(**value) for key, value in data.get("assets", {}).items()}
+                cls._blobs = {key: CachedBlobEntry(**value) for key, value in data.get("blobs", {}).items()}
+            except (AttributeError, TypeError) as e:
+                logger.warning("Ignoring unreadable asset download cache index: %s", e)
+        return cls._assets
+
+    @classmethod
+    def _save(cls) -> None:
+        cls._dirty = False
+        data = {
+            "assets": {key: asdict(entry) for key, entry in (cls._assets or {}).items()},
+            "blobs": {key: asdict(entry) for key, entry in cls._blobs.items()},
+        }
+        save_json(cls._cache_directory() / INDEX_FILE_NAME, data)
+
+
+atexit.register(AssetDownloadCache.flush)
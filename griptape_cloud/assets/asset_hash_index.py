@@ -0,0 +1,169 @@
+import atexit
+import hashlib
+import logging
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import ClassVar
+
+from base.constants import HASH_ALGORITHM
+from base.griptape_cloud_settings import get_cache_directory
+from base.json_store import load_json, save_json
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE_NAME = "index.json"
+SAVE_DELAY_SECONDS = 2.0
+
+
+@dataclass
+class AssetHashEntry:
+    content_hash: str
+    size: int
+    remote_updated_at: str | None = None
+
+
+@dataclass
+class FileHashEntry:
+    content_hash: str
+    size: int
+    mtime_ns: int
+
+
+class AssetHashIndex:
+    """Persistent index of the content hash of every asset uploaded from this machine.
+
+    Assets are keyed by base URL, bucket ID and asset name, and record the remote `updated_at` seen right after
+    the upload so that an asset changed by someone else invalidates its entry. Local file hashes are memoized by
+    path, size and modification time, so unchanged files are not re-read to be hashed.
+
+    Changes are kept in memory and written at most once every SAVE_DELAY_SECONDS, by `flush`, and at exit, so a
+    batch of uploads does not rewrite the whole index once per file.
+    """
+
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    # Serializes writes, so that an older snapshot never replaces a newer one.
+    _save_lock: ClassVar[threading.Lock] = threading.Lock()
+    _assets: ClassVar[dict[str, AssetHashEntry] | None] = None
+    _files: ClassVar[dict[str, FileHashEntry]] = {}
+    _dirty: ClassVar[bool] = False
+    _save_timer: ClassVar[threading.Timer | None] = None
+
+    @classmethod
+    def make_key(cls, base_url: str, bucket_id: str, asset_name: str) -> str:
+        return f"{base_url.rstrip('/')}|{bucket_id}|{asset_name}"
+
+    @classmethod
+    def hash_file(cls, file_path: Path) -> str:
+        """Returns the content hash of the file, streaming it from disk only if it changed since it was last hashed."""
+        content_hash, changed = cls._hash_file(file_path)
+        if changed:
+            with cls._lock:
+                cls._schedule_save()
+        return content_hash
+
+    @classmethod
+    def hash_files(cls, file_paths: Iterable[Path], max_workers: int | None = None) -> dict[Path, str]:
+        """Returns the content hash of each file, hashing changed files in parallel."""
+        file_paths = list(file_paths)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(cls._hash_file, file_paths))
+        if any(changed for _, changed in results):
+            with cls._lock:
+                cls._schedule_save()
+        return {file_path: content_hash for file_path, (content_hash, _) in zip(file_paths, results, strict=True)}
+
+    @classmethod
+    def get(cls, key: str) -> AssetHashEntry | None:
+        with cls._lock:
+            return cls._load().get(key)
+
+    @classmethod
+    def find_by_hash(cls, base_url: str, bucket_id: str, content_hash: str) -> list[str]:
+        """Returns the names of the assets in the bucket that were uploaded with the given content."""
+        prefix = cls.make_key(base_url, bucket_id, "")
+        with cls._lock:
+            return [
+                key.removeprefix(prefix)
+                for key, entry in cls._load().items()
+                if key.startswith(prefix) and entry.content_hash == content_hash
+            ]
+
+    @classmethod
+    def record(cls, key: str, entry: AssetHashEntry) -> None:
+        with cls._lock:
+            cls._load()[key] = entry
+            cls._schedule_save()
+
+    @classmethod
+    def invalidate(cls, key: str) -> None:
+        with cls._lock:
+            if cls._load().pop(key, None) is not None:
+                cls._schedule_save()
+
+    @classmethod
+    def flush(cls) -> None:
+        """Writes pending changes to disk now rather than when the scheduled save runs."""
+        with cls._save_lock:
+            with cls._lock:
+                if cls._save_timer is not None:
+                    cls._save_timer.cancel()
+                    cls._save_timer = None
+                if not cls._dirty:
+                    return
+                cls._dirty = False
+                data = {
+                    "assets": {key: asdict(entry) for key, entry in (cls._assets or {}).items()},
+                    "files": {key: asdict(entry) for key, entry in cls._files.items()},
+                }
+            save_json(cls._index_path(), data)
+
+    @classmethod
+    def _hash_file(cls, file_path: Path) -> tuple[str, bool]:
+        """Returns the content hash of the file and whether it had to be recomputed, without saving the index."""
+        resolved_path = str(file_path.resolve())
+        stat = file_path.stat()
+        with cls._lock:
+            cls._load()
+            memo = cls._files.get(resolved_path)
+            if memo is not None and memo.size == stat.st_size and memo.mtime_ns == stat.st_mtime_ns:
+                return memo.content_hash, False
+
+        with file_path.open("rb") as file:
+            content_hash = f"{HASH_ALGORITHM}:{hashlib.file_digest(file, HASH_ALGORITHM).hexdigest()}"
+
+        with cls._lock:
+            cls._files[resolved_path] = FileHashEntry(
+                content_hash=content_hash, size=stat.st_size, mtime_ns=stat.st_mtime_ns
+            )
+        return content_hash, True
+
+    @classmethod
+    def _index_path(cls) -> Path:
+        return get_cache_directory("asset_index") / INDEX_FILE_NAME
+
+    @classmethod
+    def _load(cls) -> dict[str, AssetHashEntry]:
+        if cls._assets is None:
+            cls._assets = {}
+            data = load_json(cls._index_path(), "asset hash index") or {}
+            try:
+                cls._assets = {key: AssetHashEntry(**value) for key, value in data.get("assets", {}).items()}
+                cls._files = {key: FileHashEntry(**value) for key, value in data.get("files", {}).items()}
+            except (AttributeError, TypeError) as e:
+                logger.warning("Ignoring unreadable asset hash index: %s", e)
+        return cls._assets
+
+    @classmethod
+    def _schedule_save(cls) -> None:
+        """Marks the index as changed and schedules a flush, unless one is already scheduled. Holds the lock."""
+        cls._dirty = True
+        if cls._save_timer is None:
+            cls._save_timer = threading.Timer(SAVE_DELAY_SECONDS, cls.flush)
+            cls._save_timer.daemon = True
+            cls._save_timer.start()
+
+
+atexit.register(AssetHashIndex.flush)
@@ -0,0 +1,119 @@
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any, ClassVar
+from urllib.parse import parse_qs, urlparse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ASSET_URL_CACHE_SIZE = 1024
+DEFAULT_ASSET_URL_TTL = 300.0
+DEFAULT_ASSET_URL_EXPIRY_MARGIN = 60.0
+
+
+@dataclass(frozen=True)
+class AssetUrlCacheKey:
+    base_url: str
+    api_key_hash: str
+    bucket_id: str
+    asset_name: str
+    operation: str
+
+
+@dataclass
+class AssetUrlCacheEntry:
+    value: Any
+    expires_at: float
+
+
+def parse_presigned_url_expiry(url: str) -> datetime | None:
+    """Returns the time a presigned URL expires at, if it can be read from the URL itself.
+
+    Understands Azure SAS URLs (`se`), and S3 and GCS V4 signed URLs (`X-Amz-Date`/`X-Goog-Date` plus the matching
+    `Expires` parameter).
+    """
+    params = {key.lower(): values[0] for key, values in parse_qs(urlparse(url).query).items()}
+    try:
+        if "se" in params:
+            expires_at = datetime.fromisoformat(params["se"])
+            # SAS expiries are always UTC, but may be given without an offset.
+            return expires_at if expires_at.tzinfo is not None else expires_at.replace(tzinfo=UTC)
+        for provider in ("amz", "goog"):
+            signed_at = params.get(f"x-{provider}-date")
+            expires_in = params.get(f"x-{provider}-expires")
+            if signed_at and expires_in:
+                signed_at_time = datetime.strptime(signed_at, "%Y%m%dT%H%M%SZ").replace(tzinfo=UTC)
+                return datetime.fromtimestamp(signed_at_time.timestamp() + int(expires_in), tz=UTC)
+    except ValueError as e:
+        logger.debug("Could not parse the expiry of presigned URL: %s", e)
+    return None
+
+
+class AssetUrlCache:
+    """Process-wide, size-bounded LRU cache of presigned asset download URLs.
+
+    Entries are keyed by organization, bucket, asset name and operation. Each entry expires a safety margin before
+    the URL itself does, using the expiry encoded in the URL when available and a default TTL otherwise, so a
+    cached URL never lapses while it is being used.
+    """
+
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    _entries: ClassVar["OrderedDict[AssetUrlCacheKey, AssetUrlCacheEntry]"] = OrderedDict()
+
+    @classmethod
+    def make_key(cls, base_url: str, api_key: str, bucket_id: str, asset_name: str, operation: str) -> AssetUrlCacheKey:
+        api_key_hash = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+        return AssetUrlCacheKey(
+            base_url=base_url.rstrip("/"),
+            api_key_hash=api_key_hash,
+            bucket_id=bucket_id,
+            asset_name=asset_name,
+            operation=operation,
+        )
+
+    @classmethod
+    def get(cls, key: AssetUrlCacheKey) -> Any | None:
+        """Returns the cached URL response for the key, or None if there is none that is still safe to use."""
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.monotonic():
+                del cls._entries[key]
+                return None
+            cls._entries.move_to_end(key)
+            return entry.value
+
+    @classmethod
+    def put(cls, key: AssetUrlCacheKey, value: Any, url: str, expires_at: datetime | None = None) -> None:
+        """Caches a URL response until shortly before the URL expires."""
+        expires_at = expires_at or parse_presigned_url_expiry(url)
+        if expires_at is not None:
+            ttl = expires_at.timestamp() - time.time()
+        else:
+            ttl = DEFAULT_ASSET_URL_TTL
+        ttl -= DEFAULT_ASSET_URL_EXPIRY_MARGIN
+        if ttl <= 0:
+            with cls._lock:
+                cls._entries.pop(key, None)
+            return
+
+        with cls._lock:
+            cls._entries[key] = AssetUrlCacheEntry(value=value, expires_at=time.monotonic() + ttl)
+            cls._entries.move_to_end(key)
+            while len(cls._entries) > DEFAULT_ASSET_URL_CACHE_SIZE:
+                cls._entries.popitem(last=False)
+
+    @classmethod
+    def invalidate(cls, bucket_id: str | None = None, asset_name: str | None = None) -> None:
+        """Drops the URLs of an asset, of every asset in a bucket, or the whole cache when called without arguments."""
+        with cls._lock:
+            for key in list(cls._entries):
+                if (bucket_id is None or key.bucket_id == bucket_id) and (
+                    asset_name is None or key.asset_name == asset_name
+                ):
+                    del cls._entries[key]
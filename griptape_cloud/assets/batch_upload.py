@@ -0,0 +1,87 @@
+import glob
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from base.constants import MEGABYTE
+
+UPLOADED = "uploaded"
+SKIPPED = "skipped"
+FAILED = "failed"
+
+
+@dataclass
+class BatchUploadFileResult:
+    file_path: str
+    asset_name: str
+    status: str
+    bytes_uploaded: int = 0
+    elapsed_seconds: float = 0.0
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class BatchUploadSummary:
+    files: int
+    uploaded: int
+    skipped: int
+    failed: int
+    bytes_uploaded: int
+    elapsed_seconds: float
+
+    @property
+    def throughput_mb_per_second(self) -> float:
+        return (self.bytes_uploaded / MEGABYTE) / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @classmethod
+    def from_results(cls, results: list[BatchUploadFileResult], elapsed_seconds: float) -> "BatchUploadSummary":
+        return cls(
+            files=len(results),
+            uploaded=sum(1 for result in results if result.status == UPLOADED),
+            skipped=sum(1 for result in results if result.status == SKIPPED),
+            failed=sum(1 for result in results if result.status == FAILED),
+            bytes_uploaded=sum(result.bytes_uploaded for result in results),
+            elapsed_seconds=elapsed_seconds,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "throughput_mb_per_second": self.throughput_mb_per_second}
+
+
+def collect_upload_files(source: str | None, file_paths: list[str], asset_prefix: str = "") -> list[tuple[Path, str]]:
+    """Resolves a directory, glob pattern or list of paths into (file path, asset name) pairs.
+
+    Files found under a directory keep their path relative to it as the asset name, so the directory structure is
+    preserved in the bucket. Files matched by a glob or listed explicitly are named after the file itself.
+    """
+    files: list[tuple[Path, str]] = []
+    if source:
+        source_path = Path(source)
+        if source_path.is_dir():
+            files.extend(
+                (path, path.relative_to(source_path).as_posix())
+                for path in sorted(source_path.rglob("*"))
+                if path.is_file()
+            )
+        elif source_path.is_file():
+            files.append((source_path, source_path.name))
+        else:
+            files.extend(
+                (Path(match), Path(match).name)
+                for match in sorted(glob.glob(source, recursive=True))  # noqa: PTH207 - patterns may be absolute
+                if Path(match).is_file()
+            )
+    files.extend((Path(file_path), Path(file_path).name) for file_path in file_paths if file_path)
+
+    prefix = asset_prefix.strip("/")
+    seen: set[str] = set()
+    unique_files = []
+    for path, asset_name in files:
+        name = f"{prefix}/{asset_name}" if prefix else asset_name
+        if name not in seen:
+            seen.add(name)
+            unique_files.append((path, name))
+    return unique_files
@@ -0,0 +1,170 @@
+import logging
+import time
+from typing import TYPE_CHECKING, cast
+
+from assets.batch_upload import FAILED, BatchUploadSummary, collect_upload_files
+from base.base_griptape_cloud_node import BaseGriptapeCloudNode
+from griptape_nodes.exe_types.core_types import Parameter, ParameterList, ParameterMode
+from griptape_nodes.exe_types.node_types import AsyncResult, ControlNode
+from mixins.griptape_cloud_api_mixin import DEFAULT_BATCH_UPLOAD_MAX_WORKERS
+
+if TYPE_CHECKING:
+    from griptape_cloud_client.models.bucket_detail import BucketDetail
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+class BatchUploadAsset(BaseGriptapeCloudNode, ControlNode):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+
+        self.add_parameter(
+            Parameter(
+                name="bucket",
+                input_types=["BucketDetail"],
+                type="BucketDetail",
+                output_type="BucketDetail",
+                default_value=None,
+                tooltip="The bucket to upload to",
+                allowed_modes={ParameterMode.INPUT},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="source",
+                input_types=["str"],
+                type="str",
+                output_type="str",
+                default_value=None,
+                ui_options={
+                    "clickable_file_browser": True,
+                    "expander": True,
+                    "display_name": "Directory or Glob",
+                },
+                tooltip="A directory to upload recursively, or a glob pattern (e.g. renders/*.png) of files to upload",
+            )
+        )
+
+        self.add_parameter(
+            ParameterList(
+                name="file_paths",
+                input_types=["str"],
+                output_type="str",
+                type="str",
+                default_value=None,
+                tooltip="Additional file paths to upload",
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="asset_prefix",
+                input_types=["str"],
+                type="str",
+                output_type="str",
+                default_value="",
+                tooltip="A prefix added to the name of every uploaded asset (e.g. renders/shot_010)",
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="max_workers",
+                input_types=["int"],
+                type="int",
+                output_type="int",
+                default_value=DEFAULT_BATCH_UPLOAD_MAX_WORKERS,
+                tooltip="How many files to upload at once",
+                allowed_modes={ParameterMode.INPUT, ParameterMode.PROPERTY},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="asset_names",
+                output_type="list",
+                default_value=None,
+                tooltip="The names of the assets that were uploaded or were already up to date",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="results",
+                output_type="list",
+                default_value=None,
+                tooltip="The result of every file: its asset name, status, size, duration and error, if any",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="summary",
+                output_type="dict",
+                default_value=None,
+                tooltip="Aggregate counts, bytes uploaded and throughput of the batch",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        )
+
+    def validate_before_workflow_run(self) -> list[Exception] | None:
+        exceptions = super().validate_before_workflow_run() or []
+
+        try:
+            if not self.get_parameter_value("bucket"):
+                msg = "Bucket is not set. Configure the Node with a valid Griptape Cloud Bucket before running."
+                exceptions.append(ValueError(msg))
+
+            if not self.get_parameter_value("source") and not self.get_parameter_value("file_paths"):
+                msg = "No files to upload. Configure the Node with a directory, glob pattern or file paths."
+                exceptions.append(ValueError(msg))
+
+            max_workers = self.get_parameter_value("max_workers")
+            if max_workers is not None and max_workers < 1:
+                msg = "Max workers must be at least 1."
+                exceptions.append(ValueError(msg))
+
+        except Exception as e:
+            exceptions.append(e)
+
+        return exceptions if exceptions else None
+
+    def _process(self) -> None:
+        bucket = cast("BucketDetail", self.get_parameter_value("bucket"))
+        files = collect_upload_files(
+            source=self.get_parameter_value("source"),
+            file_paths=self.get_parameter_value("file_paths") or [],
+            asset_prefix=self.get_parameter_value("asset_prefix") or "",
+        )
+        if not files:
+            msg = "No files matched the configured directory, glob pattern or file paths."
+            raise ValueError(msg)
+
+        start_time = time.monotonic()
+        results = self._upload_asset_files(files, bucket.bucket_id, max_workers=self.get_parameter_value("max_workers"))
+        summary = BatchUploadSummary.from_results(results, elapsed_seconds=time.monotonic() - start_time)
+
+        self.parameter_output_values["asset_names"] = [r.asset_name for r in results if r.status != FAILED]
+        self.parameter_output_values["results"] = [r.to_dict() for r in results]
+        self.parameter_output_values["summary"] = summary.to_dict()
+
+        logger.info(
+            "Uploaded %d of %d files to bucket %s (%d skipped, %d failed) at %.2f MB/s",
+            summary.uploaded,
+            summary.files,
+            bucket.bucket_id,
+            summary.skipped,
+            summary.failed,
+            summary.throughput_mb_per_second,
+        )
+        if summary.failed:
+            failed = [r.file_path for r in results if r.status == FAILED]
+            msg = f"Failed to upload {summary.failed} of {summary.files} files: {', '.join(failed[:10])}"
+            raise RuntimeError(msg)
+
+    def process(self) -> AsyncResult[None]:
+        yield lambda: self._process()
@@ -0,0 +1,129 @@
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+from base.base_griptape_cloud_node import BaseGriptapeCloudNode
+from griptape_nodes.exe_types.core_types import Parameter, ParameterMode
+from griptape_nodes.exe_types.node_types import AsyncResult, ControlNode
+
+if TYPE_CHECKING:
+    from griptape_cloud_client.models.bucket_detail import BucketDetail
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+class DownloadAsset(BaseGriptapeCloudNode, ControlNode):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+
+        self.add_parameter(
+            Parameter(
+                name="bucket",
+                input_types=["BucketDetail"],
+                type="BucketDetail",
+                output_type="BucketDetail",
+                default_value=None,
+                tooltip="The bucket to download from",
+                allowed_modes={ParameterMode.INPUT},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="asset_name",
+                input_types=["str"],
+                type="str",
+                output_type="str",
+                default_value=None,
+                tooltip="The name of the asset to download",
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="destination_path",
+                input_types=["str"],
+                type="str",
+                output_type="str",
+                default_value=None,
+                ui_options={
+                    "clickable_file_browser": True,
+                    "expander": True,
+                    "display_name": "Destination Path",
+                },
+                tooltip="Where to save the asset. If not set, the asset is read from the local download cache.",
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="use_cache",
+                input_types=["bool"],
+                type="bool",
+                output_type="bool",
+                default_value=True,
+                tooltip="Reuse a locally cached copy of the asset while the remote asset is unchanged",
+                allowed_modes={ParameterMode.INPUT, ParameterMode.PROPERTY},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="file_path",
+                output_type="str",
+                default_value=None,
+                tooltip="The path of the downloaded asset",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        )
+
+    def validate_before_workflow_run(self) -> list[Exception] | None:
+        exceptions = super().validate_before_workflow_run() or []
+
+        try:
+            if not self.get_parameter_value("bucket"):
+                msg = "Bucket is not set. Configure the Node with a valid Griptape Cloud Bucket before running."
+                exceptions.append(ValueError(msg))
+
+            if not self.get_parameter_value("asset_name"):
+                msg = "Asset name is not set. Configure the Node with a valid asset name before running."
+                exceptions.append(ValueError(msg))
+
+            destination_path = self.get_parameter_value("destination_path")
+            if destination_path and Path(destination_path).is_dir():
+                msg = f"Destination path is a directory: {destination_path}"
+                exceptions.append(IsADirectoryError(msg))
+
+            cast("BucketDetail", self.get_parameter_value("bucket"))
+
+        except Exception as e:
+            exceptions.append(e)
+
+        return exceptions if exceptions else None
+
+    def _process(self) -> None:
+        bucket = cast("BucketDetail", self.get_parameter_value("bucket"))
+        asset_name = self.get_parameter_value("asset_name")
+        destination_path = self.get_parameter_value("destination_path")
+        use_cache = self.get_parameter_value("use_cache")
+
+        if bucket and asset_name:
+            try:
+                file_path = self._download_asset_file(
+                    asset_name,
+                    bucket.bucket_id,
+                    destination=Path(destination_path) if destination_path else None,
+                    use_cache=use_cache is not False,
+                )
+
+                self.parameter_output_values["file_path"] = str(file_path)
+
+                logger.info("Successfully downloaded asset %s from bucket %s", asset_name, bucket.bucket_id)
+
+            except Exception as e:
+                logger.error("Error downloading asset: %s", e)
+                raise
+
+    def process(self) -> AsyncResult[None]:
+        yield lambda: self._process()
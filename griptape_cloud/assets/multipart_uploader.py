@@ -0,0 +1,301 @@
+import base64
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+from urllib.parse import urlparse
+
+import httpx
+from base.constants import MEGABYTE, TRANSFER_MAX_RETRIES, TRANSFER_RETRYABLE_STATUS_CODES
+from base.griptape_cloud_client_registry import GriptapeCloudClientRegistry
+from base.griptape_cloud_settings import get_cache_directory, get_int_setting
+from base.json_store import load_json, save_json
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+DEFAULT_PART_SIZE_MB = 8
+# Streamed uploads hold one part per concurrent request plus the one being filled, so their parts are smaller.
+DEFAULT_STREAM_PART_SIZE_MB = 1
+DEFAULT_MAX_CONCURRENCY = 4
+BLOB_TYPE_HEADER = "x-ms-blob-type"
+
+
+@dataclass
+class UploadResult:
+    bytes_uploaded: int
+    elapsed_seconds: float
+    parts: int
+    multipart: bool
+
+    @property
+    def throughput_mb_per_second(self) -> float:
+        return (self.bytes_uploaded / MEGABYTE) / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+class MultipartUploader:
+    """Uploads files to presigned asset URLs, in parallel parts when the storage backend supports it.
+
+    Griptape Cloud asset URLs are Azure Blob SAS URLs, which accept individual blocks (Put Block) that are then
+    committed in order (Put Block List). Files larger than one part are split into blocks that are uploaded
+    concurrently and retried individually. Completed blocks are recorded in a local manifest, so an interrupted
+    upload resumes from the parts that are missing. Any other URL, such as an S3 presigned URL, falls back to a single
+    PUT with a Content-Length, which is retried like the parts.
+
+    Content that is produced on the fly, such as a workflow package being zipped, can be uploaded with
+    `upload_stream` without ever being written to disk or held in memory as a whole.
+    """
+
+    def __init__(
+        self,
+        client: httpx.Client | None = None,
+        part_size: int | None = None,
+        max_concurrency: int | None = None,
+        max_retries: int = TRANSFER_MAX_RETRIES,
+        stream_part_size: int | None = None,
+    ) -> None:
+        self._client = client or GriptapeCloudClientRegistry.get_upload_client()
+        self.part_size = part_size or get_int_setting("GT_CLOUD_UPLOAD_PART_SIZE_MB", DEFAULT_PART_SIZE_MB) * MEGABYTE
+        self.max_concurrency = max_concurrency or get_int_setting(
+            "GT_CLOUD_UPLOAD_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY
+        )
+        self.max_retries = max_retries
+        self.stream_part_size = stream_part_size or DEFAULT_STREAM_PART_SIZE_MB * MEGABYTE
+
+    def upload(self, file_path: Path, url: str, headers: dict[str, str], manifest_key: str) -> UploadResult:
+        """Uploads the file to the presigned URL.
+
+        Args:
+            file_path: The file to upload.
+            url: The presigned PUT URL.
+            headers: The headers returned alongside the presigned URL.
+            manifest_key: A stable key for the destination (e.g. bucket ID and asset name), used to resume uploads.
+        """
+        start_time = time.monotonic()
+        file_size = file_path.stat().st_size
+
+        if file_size > self.part_size and self._supports_block_upload(url, headers):
+            parts = self._upload_blocks(file_path, file_size, url, headers, manifest_key)
+            multipart = True
+        else:
+            self._upload_single(file_path, url, headers)
+            parts = 1
+            multipart = False
+
+        result = UploadResult(
+            bytes_uploaded=file_size,
+            elapsed_seconds=time.monotonic() - start_time,
+            parts=parts,
+            multipart=multipart,
+        )
+        logger.info(
+            "Uploaded %s (%d bytes in %d part(s)) at %.2f MB/s",
+            file_path.name,
+            result.bytes_uploaded,
+            result.parts,
+            result.throughput_mb_per_second,
+        )
+        return result
+
+    def upload_stream(self, chunks: Iterable[bytes], url: str, headers: dict[str, str], name: str) -> UploadResult:
+        """Uploads content to the presigned URL while it is being produced.
+
+        Block-capable URLs receive the content as parts that are uploaded while the next part is being filled, so at
+        most `max_concurrency + 1` parts are in memory at once. Any other URL needs the length up front, so the content
+        is spooled to a temporary file and sent in a single PUT. Unlike `upload`, an interrupted stream cannot be
+        resumed.
+
+        Args:
+            chunks: The content, in order.
+            url: The presigned PUT URL.
+            headers: The headers returned alongside the presigned URL.
+            name: What is being uploaded, for logging.
+        """
+        start_time = time.monotonic()
+
+        if self._supports_block_upload(url, headers):
+            bytes_uploaded, parts = self._upload_stream_blocks(chunks, url, headers)
+            multipart = True
+        else:
+            bytes_uploaded = self._upload_stream_single(chunks, url, headers)
+            parts = 1
+            multipart = False
+
+        result = UploadResult(
+            bytes_uploaded=bytes_uploaded,
+            elapsed_seconds=time.monotonic() - start_time,
+            parts=parts,
+            multipart=multipart,
+        )
+        logger.info(
+            "Streamed %s (%d bytes in %d part(s)) at %.2f MB/s",
+            name,
+            result.bytes_uploaded,
+            result.parts,
+            result.throughput_mb_per_second,
+        )
+        return result
+
+    def _supports_block_upload(self, url: str, headers: dict[str, str]) -> bool:
+        hostname = urlparse(url).hostname or ""
+        return hostname.endswith(".blob.core.windows.net") or any(k.lower() == BLOB_TYPE_HEADER for k in headers)
+
+    def _upload_single(self, file_path: Path, url: str, headers: dict[str, str]) -> None:
+        with file_path.open("rb") as file:
+            self._put_with_retries(url, params=None, content=file, headers=headers)
+
+    def _upload_blocks(
+        self, file_path: Path, file_size: int, url: str, headers: dict[str, str], manifest_key: str
+    ) -> int:
+        part_count = (file_size + self.part_size - 1) // self.part_size
+        block_ids = [self._block_id(index) for index in range(part_count)]
+        block_headers = {k: v for k, v in headers.items() if k.lower() != BLOB_TYPE_HEADER}
+        manifest_path = self._manifest_path(manifest_key, file_path, file_size)
+        completed = self._read_manifest(manifest_path)
+        resumed = bool(completed)
+        if resumed:
+            logger.info(
+                "Resuming upload of %s with %d of %d parts complete", file_path.name, len(completed), part_count
+            )
+        manifest_lock = threading.Lock()
+
+        def upload_part(index: int) -> None:
+            with file_path.open("rb") as file:
+                file.seek(index * self.part_size)
+                data = file.read(self.part_size)
+            self._put_with_retries(
+                url,
+                params={"comp": "block", "blockid": block_ids[index]},
+                content=data,
+                headers=block_headers,
+            )
+            with manifest_lock:
+                completed.add(index)
+                self._write_manifest(manifest_path, completed)
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            # Consume the results so that a failed part raises here.
+            list(executor.map(upload_part, [i for i in range(part_count) if i not in completed]))
+
+        try:
+            self._commit_block_list(url, block_ids, block_headers)
+        except httpx.HTTPStatusError:
+            if not resumed:
+                raise
+            # Uncommitted blocks expire on the storage side; start over without the manifest.
+            logger.warning("Resumed parts of %s are no longer available. Restarting upload.", file_path.name)
+            manifest_path.unlink(missing_ok=True)
+            return self._upload_blocks(file_path, file_size, url, headers, manifest_key)
+        manifest_path.unlink(missing_ok=True)
+        return part_count
+
+    def _upload_stream_single(self, chunks: Iterable[bytes], url: str, headers: dict[str, str]) -> int:
+        with tempfile.TemporaryFile(dir=get_cache_directory("upload_spool")) as spool:
+            for chunk in chunks:
+                spool.write(chunk)
+            self._put_with_retries(url, params=None, content=spool, headers=headers)
+            return spool.tell()
+
+    def _upload_stream_blocks(self, chunks: Iterable[bytes], url: str, headers: dict[str, str]) -> tuple[int, int]:
+        block_headers = {k: v for k, v in headers.items() if k.lower() != BLOB_TYPE_HEADER}
+        block_ids: list[str] = []
+        pending: set[Future[None]] = set()
+        bytes_uploaded = 0
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            for data in self._iter_parts(chunks):
+                # Wait for a free worker before filling the next part, which bounds how much is buffered.
+                while len(pending) >= self.max_concurrency:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                block_id = self._block_id(len(block_ids))
+                block_ids.append(block_id)
+                bytes_uploaded += len(data)
+                pending.add(
+                    executor.submit(
+                        self._put_with_retries,
+                        url,
+                        params={"comp": "block", "blockid": block_id},
+                        content=data,
+                        headers=block_headers,
+                    )
+                )
+            for future in pending:
+                future.result()
+
+        self._commit_block_list(url, block_ids, block_headers)
+        return bytes_uploaded, len(block_ids)
+
+    def _iter_parts(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        buffer = bytearray()
+        for chunk in chunks:
+            buffer += chunk
+            while len(buffer) >= self.stream_part_size:
+                yield bytes(buffer[: self.stream_part_size])
+                del buffer[: self.stream_part_size]
+        if buffer:
+            yield bytes(buffer)
+
+    def _commit_block_list(self, url: str, block_ids: list[str], headers: dict[str, str]) -> None:
+        block_list = "".join(f"<Latest>{block_id}</Latest>" for block_id in block_ids)
+        self._put_with_retries(
+            url,
+            params={"comp": "blocklist"},
+            content=f'<?xml version="1.0" encoding="utf-8"?><BlockList>{block_list}</BlockList>'.encode(),
+            headers=headers,
+        )
+
+    def _put_with_retries(
+        self, url: str, params: dict[str, str] | None, content: bytes | BinaryIO, headers: dict[str, str]
+    ) -> None:
+        """PUTs the content, retrying transport errors and retryable statuses.
+
+        A file is sent again from its start on each attempt. Its Content-Length is set explicitly, since httpx would
+        otherwise send it with chunked transfer encoding, which S3 presigned URLs reject.
+        """
+        # The presigned URL already carries its own query string; httpx merges the extra parameters into it.
+        request_url = httpx.URL(url).copy_merge_params(params) if params else httpx.URL(url)
+        if not isinstance(content, bytes):
+            headers = {**headers, "Content-Length": str(content.seek(0, os.SEEK_END))}
+        for attempt in range(self.max_retries + 1):
+            if not isinstance(content, bytes):
+                content.seek(0)
+            try:
+                response = self._client.put(request_url, content=content, headers=headers)
+                if response.status_code not in TRANSFER_RETRYABLE_STATUS_CODES or attempt == self.max_retries:
+                    response.raise_for_status()
+                    return
+            except httpx.TransportError as e:
+                if attempt == self.max_retries:
+                    raise
+                logger.warning("Upload request failed (attempt %d): %s", attempt + 1, e)
+            time.sleep(min(2**attempt, 30))
+
+    def _block_id(self, index: int) -> str:
+        # Azure requires every block ID of a blob to have the same length.
+        return base64.b64encode(f"block-{index:08d}".encode()).decode()
+
+    def _manifest_path(self, manifest_key: str, file_path: Path, file_size: int) -> Path:
+        stat = file_path.stat()
+        fingerprint = f"{manifest_key}|{file_path.resolve()}|{file_size}|{stat.st_mtime_ns}|{self.part_size}"
+        digest = hashlib.sha256(fingerprint.encode()).hexdigest()
+        return get_cache_directory("upload_manifests") / f"{digest}.json"
+
+    def _read_manifest(self, manifest_path: Path) -> set[int]:
+        data = load_json(manifest_path, "upload manifest")
+        try:
+            return set(data["completed_parts"]) if data is not None else set()
+        except (KeyError, TypeError):
+            return set()
+
+    def _write_manifest(self, manifest_path: Path, completed: set[int]) -> None:
+        # Written atomically, so a crash mid-write never leaves a manifest that loses the completed parts.
+        save_json(manifest_path, {"completed_parts": sorted(completed)})
@@ -0,0 +1,246 @@
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import cast
+
+import httpx
+from base.constants import HASH_ALGORITHM, MEGABYTE, TRANSFER_MAX_RETRIES, TRANSFER_RETRYABLE_STATUS_CODES
+from base.griptape_cloud_client_registry import GriptapeCloudClientRegistry
+from base.griptape_cloud_settings import get_int_setting
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+DEFAULT_PART_SIZE_MB = 8
+DEFAULT_MAX_CONCURRENCY = 4
+# How many times a single range may sign the URL again after it is rejected, in case the rejection is not expiry.
+MAX_URL_REFRESHES = 2
+
+
+@dataclass
+class DownloadResult:
+    path: Path
+    bytes_downloaded: int
+    elapsed_seconds: float
+    parts: int
+    content_hash: str
+
+    @property
+    def throughput_mb_per_second(self) -> float:
+        return (self.bytes_downloaded / MEGABYTE) / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+@dataclass
+class _RangeProgress:
+    """The next byte of a range still to be written, so a retried request resumes where the last one stopped."""
+
+    position: int
+    end: int
+
+
+class _SignedUrl:
+    """The presigned URL shared by the requests of a download, signed again when storage rejects it as expired."""
+
+    def __init__(
+        self, url: str, headers: dict[str, str], refresh: Callable[[], tuple[str, dict[str, str]]] | None
+    ) -> None:
+        self._lock = threading.Lock()
+        self._refresh = refresh
+        self.url = url
+        self.headers = headers
+        self.generation = 0
+
+    def get(self) -> tuple[str, dict[str, str], int]:
+        with self._lock:
+            return self.url, self.headers, self.generation
+
+    def refresh(self, generation: int) -> bool:
+        """Signs the URL again, unless another request already did since it read `generation`.
+
+        Returns False if the URL cannot be signed again.
+        """
+        with self._lock:
+            if self._refresh is None:
+                return False
+            if generation == self.generation:
+                self.url, self.headers = self._refresh()
+                self.generation += 1
+            return True
+
+
+class RangedDownloader:
+    """Downloads presigned URLs to disk without holding whole files in memory.
+
+    Objects larger than one part are fetched with concurrent ranged GETs written straight to their offset in the
+    destination file. Smaller objects arrive in a single request, and servers that do not support ranges are streamed
+    in chunks. Every request is retried on its own, resuming from the last byte it wrote, and the file only appears at
+    the destination once it is complete. A URL that expires mid-download is signed again when a way to do so is given.
+    """
+
+    def __init__(
+        self,
+        client: httpx.Client | None = None,
+        part_size: int | None = None,
+        max_concurrency: int | None = None,
+        max_retries: int = TRANSFER_MAX_RETRIES,
+    ) -> None:
+        self._client = client or GriptapeCloudClientRegistry.get_upload_client()
+        self.part_size = part_size or get_int_setting("GT_CLOUD_DOWNLOAD_PART_SIZE_MB", DEFAULT_PART_SIZE_MB) * MEGABYTE
+        self.max_concurrency = max_concurrency or get_int_setting(
+            "GT_CLOUD_DOWNLOAD_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY
+        )
+        self.max_retries = max_retries
+
+    def download(
+        self,
+        url: str,
+        destination: Path,
+        headers: dict[str, str] | None = None,
+        refresh_url: Callable[[], tuple[str, dict[str, str]]] | None = None,
+    ) -> DownloadResult:
+        """Downloads the presigned URL to the destination path, replacing any file already there.
+
+        Args:
+            url: The presigned GET URL.
+            destination: Where to write the file.
+            headers: The headers returned alongside the presigned URL.
+            refresh_url: Returns a newly signed URL and its headers, for when storage rejects the URL with a 403.
+        """
+        start_time = time.monotonic()
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = destination.with_name(f".{destination.name}.{os.getpid()}-{threading.get_ident()}.part")
+
+        try:
+            parts = self._download(_SignedUrl(url, headers or {}, refresh_url), temp_path)
+            content_hash = self._hash_file(temp_path)
+            temp_path.replace(destination)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+        result = DownloadResult(
+            path=destination,
+            bytes_downloaded=destination.stat().st_size,
+            elapsed_seconds=time.monotonic() - start_time,
+            parts=parts,
+            content_hash=content_hash,
+        )
+        logger.info(
+            "Downloaded %s (%d bytes in %d part(s)) at %.2f MB/s",
+            destination.name,
+            result.bytes_downloaded,
+            result.parts,
+            result.throughput_mb_per_second,
+        )
+        return result
+
+    def _download(self, signed_url: _SignedUrl, path: Path) -> int:
+        size: int | None = None
+        path.touch()
+
+        def write_first_part(response: httpx.Response, progress: _RangeProgress) -> None:
+            nonlocal size
+            if response.status_code == httpx.codes.REQUESTED_RANGE_NOT_SATISFIABLE and progress.position == 0:
+                # Empty objects have no first byte to request.
+                size = 0
+                return
+            response.raise_for_status()
+            if progress.position == 0 or response.status_code != httpx.codes.PARTIAL_CONTENT:
+                # Servers that ignore the range send the whole object, which is streamed to disk as is, and again
+                # from the start if the request has to be retried.
+                progress.position = 0
+                size = self._get_total_size(response)
+                with path.open("r+b") as file:
+                    file.truncate(size or 0)
+            self._write_response(response, path, progress)
+
+        # Request the first part as a range: small objects arrive whole in this single request, and for large ones
+        # the response reveals the total size so the remaining parts can be fetched concurrently.
+        self._get_range_with_retries(signed_url, _RangeProgress(0, self.part_size - 1), write_first_part)
+        if size is None or size <= self.part_size:
+            return 1
+
+        part_count = (size + self.part_size - 1) // self.part_size
+
+        def write_part(response: httpx.Response, progress: _RangeProgress) -> None:
+            response.raise_for_status()
+            self._write_response(response, path, progress)
+
+        def download_part(index: int) -> None:
+            start = index * self.part_size
+            end = min(start + self.part_size, cast("int", size)) - 1
+            self._get_range_with_retries(signed_url, _RangeProgress(start, end), write_part)
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            # Consume the results so that a failed part raises here.
+            list(executor.map(download_part, range(1, part_count)))
+        return part_count
+
+    def _write_response(self, response: httpx.Response, path: Path, progress: _RangeProgress) -> None:
+        with path.open("r+b") as file:
+            file.seek(progress.position)
+            # Written as they arrive rather than in larger buffered chunks, so a retry loses as little as possible.
+            for chunk in response.iter_bytes():
+                file.write(chunk)
+                progress.position += len(chunk)
+
+    def _get_total_size(self, response: httpx.Response) -> int | None:
+        """Returns the total size of the object from a partial response, or None if the range was not honored."""
+        content_range = response.headers.get("Content-Range", "")
+        if response.status_code != httpx.codes.PARTIAL_CONTENT or "/" not in content_range:
+            return None
+        total = content_range.rsplit("/", 1)[1]
+        return int(total) if total.isdigit() else None
+
+    def _get_range_with_retries(
+        self,
+        signed_url: _SignedUrl,
+        progress: _RangeProgress,
+        write: Callable[[httpx.Response, _RangeProgress], None],
+    ) -> None:
+        """Requests the rest of a byte range and passes the response to `write`, retrying transient failures.
+
+        `write` advances the progress as it writes, so a connection dropped mid-stream is retried from the first byte
+        that did not arrive. A 403 signs the URL again, as presigned URLs can expire while a large download runs.
+        """
+        attempt = 0
+        refreshes = 0
+        while True:
+            url, headers, generation = signed_url.get()
+            range_headers = {**headers, "Range": f"bytes={progress.position}-{progress.end}"}
+            try:
+                with self._client.stream("GET", url, headers=range_headers) as response:
+                    if (
+                        response.status_code == httpx.codes.FORBIDDEN
+                        and refreshes < MAX_URL_REFRESHES
+                        and signed_url.refresh(generation)
+                    ):
+                        refreshes += 1
+                        logger.info(
+                            "Download URL was rejected. Signing it again to resume at byte %d", progress.position
+                        )
+                        continue
+                    if response.status_code in TRANSFER_RETRYABLE_STATUS_CODES and attempt < self.max_retries:
+                        logger.warning(
+                            "Download of bytes %d-%d failed (attempt %d)", progress.position, progress.end, attempt + 1
+                        )
+                    else:
+                        write(response, progress)
+                        return
+            except httpx.TransportError as e:
+                if attempt == self.max_retries:
+                    raise
+                logger.warning(
+                    "Download of bytes %d-%d failed (attempt %d): %s", progress.position, progress.end, attempt + 1, e
+                )
+            time.sleep(min(2**attempt, 30))
+            attempt += 1
+
+    def _hash_file(self, path: Path) -> str:
+        with path.open("rb") as file:
+            return f"{HASH_ALGORITHM}:{hashlib.file_digest(file, HASH_ALGORITHM).hexdigest()}"
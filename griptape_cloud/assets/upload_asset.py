@@ -2,9 +2,7 @@ import logging
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
-import requests
 from base.base_griptape_cloud_node import BaseGriptapeCloudNode
-from griptape_cloud_client.models.assert_url_operation import AssertUrlOperation
 from griptape_nodes.exe_types.core_types import Parameter, ParameterMode
 from griptape_nodes.exe_types.node_types import AsyncResult, ControlNode
 
@@ -93,20 +91,12 @@ class UploadAsset(BaseGriptapeCloudNode, ControlNode):
 
         if bucket and asset_name and file_path:
             try:
-                self._create_asset(
-                    asset_name=asset_name,
-                    bucket_id=bucket.bucket_id,
-                )
-                upload_url_response = self._create_asset_url(asset_name, bucket.bucket_id, AssertUrlOperation.PUT)
-
-                with Path(file_path).open("rb") as file:
-                    headers = upload_url_response.headers.to_dict() or {}
-                    upload_response = requests.put(upload_url_response.url, data=file, headers=headers, timeout=300)
-                    upload_response.raise_for_status()
+                upload_result = self._upload_asset_file(Path(file_path), asset_name, bucket.bucket_id)
 
                 self.parameter_output_values["asset_name"] = asset_name
 
-                logger.info("Successfully uploaded asset %s to bucket %s", asset_name, bucket.bucket_id)
+                if upload_result is not None:
+                    logger.info("Successfully uploaded asset %s to bucket %s", asset_name, bucket.bucket_id)
 
             except Exception as e:
                 logger.error("Error uploading asset: %s", e)
@@ -3,6 +3,8 @@ from typing import Any
 
 from assistants.assistant_options import AssistantOptions
 from base.base_griptape_cloud_node import BaseGriptapeCloudNode
+from base.griptape_cloud_options import is_headless, use_lazy_options
+from base.indexed_choices import IndexedChoices
 from griptape_nodes.exe_types.core_types import Parameter, ParameterMode
 from griptape_nodes.exe_types.node_types import DataNode
 
@@ -14,8 +16,15 @@ class GetAssistant(BaseGriptapeCloudNode, DataNode):
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
 
-        self.assistants = self._list_assistants().assistants
-        self.choices = list(map(AssistantOptions._assistant_to_name_and_id, self.assistants))
+        # In lazy mode, only a listing that is already cached is used; otherwise the choices are loaded in the
+        # background, or when the node is validated or run if it runs headless, so the node can be built from its
+        # saved ID without a network round trip.
+        self.lazy_options = use_lazy_options()
+        if self.lazy_options:
+            self.assistant_choices = self._peek_cached_listing("assistants") or IndexedChoices()
+        else:
+            self.assistant_choices = self._get_assistant_choices_cached()
+        self.choices_loaded = bool(self.assistant_choices) or not self.lazy_options
 
         self.add_parameter(
             Parameter(
@@ -23,15 +32,8 @@ class GetAssistant(BaseGriptapeCloudNode, DataNode):
                 input_types=["str"],
                 output_type="str",
                 type="str",
-                default_value=self.assistants[0].assistant_id if self.assistants else None,
-                traits={
-                    AssistantOptions(
-                        choices=self.choices,
-                        choices_value_lookup={
-                            AssistantOptions._assistant_to_name_and_id(s): s for s in self.assistants
-                        },
-                    )
-                },
+                default_value=self.assistant_choices.first_id(),
+                traits={AssistantOptions(indexed_choices=self.assistant_choices)},
                 tooltip="The ID of the assistant",
                 allowed_modes={ParameterMode.INPUT, ParameterMode.PROPERTY, ParameterMode.OUTPUT},
             )
@@ -61,13 +63,20 @@ class GetAssistant(BaseGriptapeCloudNode, DataNode):
             )
         )
 
+        if not self.choices_loaded and not is_headless():
+            # Fill the dropdown as soon as the listing arrives rather than on the first run.
+            self._load_choices_in_background(self._resolve_assistant)
+
     def validate_before_workflow_run(self) -> list[Exception] | None:
         exceptions = super().validate_before_workflow_run() or []
 
         try:
-            if not self.get_parameter_value("assistant_id"):
+            assistant_id = self.get_parameter_value("assistant_id")
+            if not assistant_id:
                 msg = "Assistant ID is not set. Configure the Node with a valid Griptape Cloud Assistant ID before running."
                 exceptions.append(ValueError(msg))
+            else:
+                self._resolve_assistant()
 
         except Exception as e:
             # Add any exceptions to your list to return
@@ -81,16 +90,39 @@ class GetAssistant(BaseGriptapeCloudNode, DataNode):
     ) -> None:
         """Callback after a value has been set on this Node."""
         if parameter.name == "assistant_id" and value is not None:
-            assistant = next((s for s in self.assistants if s.assistant_id == value), None)
-            if assistant is None:
-                msg = f"Assistant with ID '{value}' not found."
-                logger.error(msg)
-                raise ValueError(msg)
-            self.set_parameter_value("assistant", assistant)
-            self.set_parameter_value("name", assistant.name)
+            if not self.choices_loaded:
+                # Resolved once the choices are loaded.
+                return
+            self._set_assistant(value)
             if modified_parameters_set is not None:
                 modified_parameters_set.add("assistant")
                 modified_parameters_set.add("name")
 
+    def _set_assistant(self, assistant_id: str) -> None:
+        assistant = self.assistant_choices.by_id.get(assistant_id)
+        if assistant is None:
+            msg = f"Assistant with ID '{assistant_id}' not found."
+            logger.error(msg)
+            raise ValueError(msg)
+        self.set_parameter_value("assistant", assistant)
+        self.set_parameter_value("name", assistant.name)
+
+    def _load_assistant_choices(self) -> None:
+        self.assistant_choices = self._get_assistant_choices_cached()
+        parameter = self.get_parameter_by_name("assistant_id")
+        if parameter is not None:
+            for trait in parameter.find_elements_by_type(AssistantOptions):
+                trait.set_indexed_choices(self.assistant_choices)
+        self.choices_loaded = True
+
+    def _resolve_assistant(self) -> None:
+        """Loads the choices if they are not loaded yet, and sets the assistant if it was selected before they were."""
+        if not self.choices_loaded:
+            self._load_assistant_choices()
+        assistant = self.get_parameter_value("assistant")
+        assistant_id = self.get_parameter_value("assistant_id")
+        if assistant is None or assistant.assistant_id != assistant_id:
+            self._set_assistant(assistant_id)
+
     def process(self) -> None:
-        pass
+        self._resolve_assistant()
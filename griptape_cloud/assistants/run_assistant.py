@@ -2,9 +2,11 @@ import logging
 from typing import TYPE_CHECKING, Any, cast
 
 from base.base_griptape_cloud_node import BaseGriptapeCloudNode
+from base.run_event_buffer import RunEventBuffer
 from griptape_cloud_client.types import Unset
 from griptape_nodes.exe_types.core_types import Parameter, ParameterGroup, ParameterList, ParameterMode
 from griptape_nodes.exe_types.node_types import AsyncResult, ControlNode
+from mixins.run_event_poller import ASSISTANT_RUN_COMPLETED_EVENT_TYPE
 
 if TYPE_CHECKING:
     from griptape_cloud_client.models.assistant_detail import AssistantDetail
@@ -92,23 +94,40 @@ class RunAssistant(BaseGriptapeCloudNode, ControlNode):
         # if there are exceptions, they will display when the user tries to run the flow with the node.
         return exceptions if exceptions else None
 
-    def _process(self) -> None:
+    async def _process(self) -> None:
+        api = self.gtc_async_api
         include_events = self.get_parameter_value("include_events")
         assistant = cast("AssistantDetail", self.get_parameter_value("assistant"))
         args = self.get_parameter_value("args")
-        assistant_run = self._create_assistant_run(assistant_id=assistant.assistant_id, args=args)
+        assistant_run = await api._create_assistant_run(assistant_id=assistant.assistant_id, args=args)
 
         output: Any | None = None
 
-        for events in self._poll_assistant_run_events(assistant_run_id=assistant_run.assistant_run_id):
-            if include_events:
-                self.append_value_to_parameter("events", "\n".join(str(event.payload) for event in events))
-
-        assistant_run = self._get_assistant_run(assistant_run_id=assistant_run.assistant_run_id)
+        event_buffer = (
+            RunEventBuffer(flush=lambda text: self.publish_update_to_parameter("events", text))
+            if include_events
+            else None
+        )
+        # Without an events parameter to fill, only the completion event is needed
+        events_filter = (
+            {"exclude_types": event_buffer.excluded_types}
+            if event_buffer is not None
+            else {"include_types": [ASSISTANT_RUN_COMPLETED_EVENT_TYPE]}
+        )
+        async for events in api._poll_assistant_run_events(
+            assistant_run_id=assistant_run.assistant_run_id, **events_filter
+        ):
+            if event_buffer is not None:
+                event_buffer.extend(events)
+        if event_buffer is not None:
+            event_buffer.flush()
+
+        assistant_run = await api._get_assistant_run(assistant_run_id=assistant_run.assistant_run_id)
         output = assistant_run.output if not isinstance(assistant_run.output, Unset) else None
         self.parameter_output_values["output"] = output
 
     def process(
         self,
     ) -> AsyncResult[None]:
-        yield lambda: self._process()
+        # Runs are awaited on the event loop rather than in a worker thread, so many of them can wait at once.
+        yield self._process()
@@ -1,11 +1,18 @@
 import logging
 import os
+import threading
+from collections.abc import Callable
+from typing import TYPE_CHECKING
 from urllib.parse import urljoin
 
-from griptape_cloud_client.client import AuthenticatedClient
+from base.griptape_cloud_client_registry import GriptapeCloudClientRegistry
 from griptape_nodes.exe_types.node_types import BaseNode
 from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
 from mixins.griptape_cloud_api_mixin import GriptapeCloudApiMixin
+from mixins.griptape_cloud_async_api_mixin import GriptapeCloudAsyncApi
+
+if TYPE_CHECKING:
+    from griptape_cloud_client.client import AuthenticatedClient
 
 DEFAULT_GRIPTAPE_CLOUD_ENDPOINT = urljoin(base=os.getenv("GT_CLOUD_BASE_URL", "https://cloud.griptape.ai"), url="/api/")
 API_KEY_ENV_VAR = "GT_CLOUD_API_KEY"
@@ -23,18 +30,32 @@ class BaseGriptapeCloudNode(BaseNode, GriptapeCloudApiMixin):
             kwargs["name"] = name
         super().__init__(**kwargs)
         self.base_url = DEFAULT_GRIPTAPE_CLOUD_ENDPOINT
-        self.gtc_client = AuthenticatedClient(
-            base_url=self.base_url,
-            token=self._get_gt_cloud_api_key(),
-            verify_ssl=False,
-        )
+        self._gtc_client: AuthenticatedClient | None = None
+
+    @property
+    def gtc_client(self) -> "AuthenticatedClient":
+        # The API key is looked up once and then again before every workflow run, so a rotated key is picked up
+        # without asking the secrets manager on every request.
+        if self._gtc_client is None:
+            self._gtc_client = GriptapeCloudClientRegistry.get_client(
+                base_url=self.base_url, api_key=self._get_gt_cloud_api_key()
+            )
+        return self._gtc_client
+
+    @property
+    def gtc_async_api(self) -> GriptapeCloudAsyncApi:
+        """The asyncio API on this node's client, for processing that awaits its calls on the event loop."""
+        return GriptapeCloudAsyncApi(self.gtc_client)
 
     def validate_before_workflow_run(self) -> list[Exception] | None:
         exceptions = []
 
         try:
-            self._get_gt_cloud_api_key()
+            self._gtc_client = GriptapeCloudClientRegistry.get_client(
+                base_url=self.base_url, api_key=self._get_gt_cloud_api_key()
+            )
         except Exception as e:
+            self._gtc_client = None
             exceptions.append(e)
 
         return exceptions if exceptions else None
@@ -44,3 +65,12 @@ class BaseGriptapeCloudNode(BaseNode, GriptapeCloudApiMixin):
             msg = f"{API_KEY_ENV_VAR} not found by Griptape Secrets Manager"
             raise KeyError(msg)
         return api_key
+
+    def _load_choices_in_background(self, load_choices: Callable[[], None]) -> None:
+        def load() -> None:
+            try:
+                load_choices()
+            except Exception as e:
+                logger.warning("Failed to load Griptape Cloud choices for node '%s': %s", self.name, e)
+
+        threading.Thread(target=load, name="griptape-cloud-load-choices", daemon=True).start()
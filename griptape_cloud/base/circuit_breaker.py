@@ -0,0 +1,101 @@
+import threading
+import time
+from typing import ClassVar
+
+import httpx
+from base.griptape_cloud_settings import get_int_setting
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 30.0
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Raised instead of sending a request to an endpoint whose circuit is open."""
+
+
+class CircuitBreaker:
+    """Per-endpoint circuit breaker.
+
+    After `failure_threshold` consecutive failures the circuit opens and requests to the endpoint fail fast for
+    `reset_timeout` seconds. A single trial request is then let through; its success closes the circuit and its
+    failure opens it again.
+    """
+
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    _breakers: ClassVar[dict[str, "CircuitBreaker"]] = {}
+
+    def __init__(self, endpoint: str, failure_threshold: int, reset_timeout: float = DEFAULT_RESET_TIMEOUT) -> None:
+        self.endpoint = endpoint
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state_lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    @classmethod
+    def get(cls, endpoint: str) -> "CircuitBreaker":
+        """Returns the process-wide breaker for the endpoint, creating it on first use."""
+        with cls._lock:
+            breaker = cls._breakers.get(endpoint)
+            if breaker is None:
+                breaker = cls(
+                    endpoint,
+                    failure_threshold=get_int_setting(
+                        "GT_CLOUD_CIRCUIT_BREAKER_FAILURE_THRESHOLD", DEFAULT_FAILURE_THRESHOLD
+                    ),
+                )
+                cls._breakers[endpoint] = breaker
+            return breaker
+
+    @classmethod
+    def reset_all(cls) -> None:
+        with cls._lock:
+            cls._breakers.clear()
+
+    @property
+    def state(self) -> str:
+        with self._state_lock:
+            return self._state
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == OPEN
+
+    def before_request(self, request: httpx.Request) -> None:
+        """Raises CircuitOpenError if the request may not be sent right now."""
+        if self.failure_threshold <= 0:
+            return
+        with self._state_lock:
+            if self._state == CLOSED:
+                return
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._state = HALF_OPEN
+                self._trial_in_flight = False
+            if self._state == HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+            retry_in = max(self.reset_timeout - (time.monotonic() - self._opened_at), 0.0)
+        msg = f"Circuit open for {self.endpoint} after repeated failures. Retry in {retry_in:.0f}s."
+        raise CircuitOpenError(msg, request=request)
+
+    def record_success(self) -> None:
+        with self._state_lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        if self.failure_threshold <= 0:
+            return
+        with self._state_lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self._trial_in_flight = False
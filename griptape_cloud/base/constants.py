@@ -0,0 +1,7 @@
+MEGABYTE = 1024 * 1024
+# Content hashes are written as `{HASH_ALGORITHM}:{hex digest}`.
+HASH_ALGORITHM = "sha256"
+
+# Uploads to and downloads from presigned asset URLs bypass the API transport's retries and retry on their own.
+TRANSFER_MAX_RETRIES = 3
+TRANSFER_RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
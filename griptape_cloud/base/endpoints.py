@@ -0,0 +1,55 @@
+import re
+
+import httpx
+
+EVENTS = "events"
+RUNS = "runs"
+ASSETS = "assets"
+LISTINGS = "listings"
+DEFAULT = "default"
+ENDPOINT_CLASSES = (EVENTS, RUNS, ASSETS, LISTINGS, DEFAULT)
+
+ASSET_SEGMENTS = frozenset({"assets", "asset-urls"})
+
+_ID_SEGMENT_PATTERN = re.compile(r"^(?:\d+|[0-9a-fA-F-]{8,})$")
+
+
+def is_id_segment(segment: str) -> bool:
+    """Returns whether a path segment is a resource ID rather than part of the endpoint's route."""
+    return bool(_ID_SEGMENT_PATTERN.match(segment))
+
+
+def get_endpoint_key(request: httpx.Request) -> str:
+    """Returns the request's method, host and route, e.g. `GET host/api/structures/{id}`.
+
+    ID segments are collapsed to `{id}`, and asset names, which may span several segments, to `{name}`, so there is
+    one key per route rather than per resource. Circuit breakers and metric labels are keyed by it.
+    """
+    segments = request.url.path.split("/")
+    route: list[str] = []
+    for index, segment in enumerate(segments):
+        if segment in ASSET_SEGMENTS and any(segments[index + 1 :]):
+            route.extend((segment, "{name}"))
+            break
+        route.append("{id}" if is_id_segment(segment) else segment)
+    return f"{request.method} {request.url.host}{'/'.join(route)}"
+
+
+def get_endpoint_class(request: httpx.Request) -> str:
+    """Returns which class of Griptape Cloud endpoint the request is for: events, runs, assets or listings."""
+    segments = [segment for segment in request.url.path.split("/") if segment]
+    last_segment = segments[-1] if segments else ""
+    if last_segment == EVENTS:
+        return EVENTS
+    if any(segment == RUNS or segment.endswith("-runs") for segment in segments):
+        return RUNS
+    if any(segment in ASSET_SEGMENTS for segment in segments):
+        return ASSETS
+    if request.method == "GET" and last_segment and not is_id_segment(last_segment):
+        return LISTINGS
+    return DEFAULT
+
+
+def is_run_creation(request: httpx.Request) -> bool:
+    """Returns whether the request creates a structure or assistant run."""
+    return request.method == "POST" and request.url.path.rstrip("/").endswith(f"/{RUNS}")
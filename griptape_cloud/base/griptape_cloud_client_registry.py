@@ -0,0 +1,128 @@
+import atexit
+import importlib.util
+import logging
+import threading
+import weakref
+from typing import ClassVar
+
+import httpx
+from base.griptape_cloud_settings import get_bool_setting, get_int_setting
+from base.resilient_transport import ResilientTransport
+from griptape_cloud_client.client import AuthenticatedClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+DEFAULT_UPLOAD_TIMEOUT = 300.0
+
+
+class GriptapeCloudClientRegistry:
+    """Process-wide registry handing out pooled, keep-alive Griptape Cloud clients.
+
+    Clients are keyed by base URL and API key, so every node and the publisher share a single connection pool
+    per account instead of opening one per instance. API clients send requests through a ResilientTransport, which
+    retries transient failures and fails fast on endpoints that keep failing. When the API key for a base URL
+    rotates, a new client is built and the transport of the superseded one is retired, closing its connections
+    as soon as the requests still in flight with it finish.
+    """
+
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    _clients: ClassVar[dict[tuple[str, str], AuthenticatedClient]] = {}
+    _transports: ClassVar[dict[tuple[str, str], ResilientTransport]] = {}
+    # Retired transports are only tracked while something still holds their client, to close them on shutdown.
+    _retired_transports: ClassVar[weakref.WeakSet[ResilientTransport]] = weakref.WeakSet()
+    _upload_client: ClassVar[httpx.Client | None] = None
+
+    @classmethod
+    def get_client(cls, base_url: str, api_key: str) -> AuthenticatedClient:
+        """Returns the shared client for the base URL and API key, building it on first use."""
+        normalized_base_url = cls._normalize_base_url(base_url)
+        key = (normalized_base_url, api_key)
+        retired: list[ResilientTransport] = []
+        with cls._lock:
+            client = cls._clients.get(key)
+            if client is None:
+                for stale_key in [k for k in cls._clients if k[0] == normalized_base_url]:
+                    logger.info("Griptape Cloud API key rotated for %s. Rebuilding client.", normalized_base_url)
+                    del cls._clients[stale_key]
+                    retired.append(cls._transports.pop(stale_key))
+                # A custom transport replaces httpx's default one, so the connection options are passed to it
+                # instead. Presigned URL transfers keep the plain transport, since the uploader and downloader retry
+                # on their own.
+                transport = ResilientTransport(verify=False, **cls._get_httpx_args())
+                client = AuthenticatedClient(
+                    base_url=normalized_base_url,
+                    token=api_key,
+                    verify_ssl=False,
+                    httpx_args={"transport": transport},
+                )
+                cls._clients[key] = client
+                cls._transports[key] = transport
+                cls._retired_transports.update(retired)
+        for stale_transport in retired:
+            stale_transport.retire()
+        return client
+
+    @classmethod
+    def get_upload_client(cls) -> httpx.Client:
+        """Returns the shared unauthenticated client used for transfers against presigned asset URLs."""
+        with cls._lock:
+            if cls._upload_client is None:
+                cls._upload_client = httpx.Client(
+                    timeout=httpx.Timeout(DEFAULT_UPLOAD_TIMEOUT),
+                    **cls._get_httpx_args(),
+                )
+            return cls._upload_client
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Closes every pooled client. Clients are rebuilt on demand if requested again."""
+        with cls._lock:
+            clients = list(cls._clients.values())
+            retired_transports = list(cls._retired_transports)
+            cls._clients.clear()
+            cls._transports.clear()
+            cls._retired_transports.clear()
+            upload_client, cls._upload_client = cls._upload_client, None
+
+        for client in clients:
+            cls._close_client(client)
+        for transport in retired_transports:
+            transport.close()
+        if upload_client is not None:
+            upload_client.close()
+
+    @classmethod
+    def _close_client(cls, client: AuthenticatedClient) -> None:
+        # Only close the underlying httpx client if it was ever created; the async client is bound to the event
+        # loop that created it and is released with that loop.
+        httpx_client = client._client
+        if httpx_client is not None:
+            try:
+                httpx_client.close()
+            except Exception as e:
+                logger.debug("Error closing Griptape Cloud client: %s", e)
+
+    @classmethod
+    def _normalize_base_url(cls, base_url: str) -> str:
+        return base_url.rstrip("/")
+
+    @classmethod
+    def _get_httpx_args(cls) -> dict:
+        http2 = get_bool_setting("GT_CLOUD_HTTP2", default=True)
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.debug("HTTP/2 requested but the 'h2' package is not installed. Falling back to HTTP/1.1.")
+            http2 = False
+        return {
+            "http2": http2,
+            "limits": httpx.Limits(
+                max_connections=get_int_setting("GT_CLOUD_HTTP_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS),
+                max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+            ),
+        }
+
+
+atexit.register(GriptapeCloudClientRegistry.close_all)
@@ -0,0 +1,180 @@
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+import weakref
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, ClassVar
+
+from base.griptape_cloud_settings import get_float_setting
+from base.rate_limiter import RequestPriority, request_priority
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LISTING_CACHE_TTL = 300.0
+
+
+@dataclass
+class ListingCacheEntry:
+    value: Any
+    fetched_at: float
+    refreshing: bool = False
+
+
+@dataclass(frozen=True)
+class ListingCacheKey:
+    base_url: str
+    api_key_hash: str
+    resource: str
+
+
+class GriptapeCloudListingCache:
+    """Process-wide, per-organization cache of Griptape Cloud resource listings.
+
+    Entries are keyed by base URL, API key and resource type. Concurrent misses for the same key share a single
+    request, fresh entries are served from memory, and entries older than the TTL are served stale while a
+    background thread refreshes them. Async callers load and refresh entries on their own event loop instead.
+    """
+
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    _entries: ClassVar[dict[ListingCacheKey, ListingCacheEntry]] = {}
+    _load_locks: ClassVar[dict[ListingCacheKey, threading.Lock]] = {}
+    # asyncio locks are bound to one event loop, so async loads are shared per loop.
+    _async_load_locks: ClassVar[
+        weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[ListingCacheKey, asyncio.Lock]]
+    ] = weakref.WeakKeyDictionary()
+    _refresh_tasks: ClassVar[set[asyncio.Task]] = set()
+
+    @classmethod
+    def make_key(cls, base_url: str, api_key: str, resource: str) -> ListingCacheKey:
+        # The API key identifies the organization; only a digest of it is kept as part of the key.
+        api_key_hash = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+        return ListingCacheKey(base_url=base_url.rstrip("/"), api_key_hash=api_key_hash, resource=resource)
+
+    @classmethod
+    def get(cls, key: ListingCacheKey, loader: Callable[[], Any], ttl: float | None = None) -> Any:
+        """Returns the cached listing for the key, loading it with `loader` on a miss."""
+        ttl = ttl if ttl is not None else get_float_setting("GT_CLOUD_LISTING_CACHE_TTL", DEFAULT_LISTING_CACHE_TTL)
+
+        entry, refresh = cls._lookup(key, ttl)
+        if entry is not None:
+            if refresh:
+                threading.Thread(
+                    target=cls._refresh,
+                    args=(key, loader),
+                    name=f"griptape-cloud-listing-refresh-{key.resource}",
+                    daemon=True,
+                ).start()
+            return entry.value
+
+        # Only one caller loads a missing entry; everyone else waits for it and reads the result.
+        with cls._lock:
+            load_lock = cls._load_locks.setdefault(key, threading.Lock())
+        with load_lock:
+            with cls._lock:
+                entry = cls._entries.get(key)
+                if entry is not None:
+                    return entry.value
+            value = loader()
+            cls._store(key, value)
+            return value
+
+    @classmethod
+    async def get_async(
+        cls, key: ListingCacheKey, loader: Callable[[], Awaitable[Any]], ttl: float | None = None
+    ) -> Any:
+        """Returns the cached listing for the key, awaiting `loader` on the running event loop on a miss."""
+        ttl = ttl if ttl is not None else get_float_setting("GT_CLOUD_LISTING_CACHE_TTL", DEFAULT_LISTING_CACHE_TTL)
+
+        entry, refresh = cls._lookup(key, ttl)
+        if entry is not None:
+            if refresh:
+                task = asyncio.get_running_loop().create_task(cls._refresh_async(key, loader))
+                # The loop only keeps weak references to its tasks.
+                cls._refresh_tasks.add(task)
+                task.add_done_callback(cls._refresh_tasks.discard)
+            return entry.value
+
+        with cls._lock:
+            load_locks = cls._async_load_locks.setdefault(asyncio.get_running_loop(), {})
+            load_lock = load_locks.setdefault(key, asyncio.Lock())
+        async with load_lock:
+            with cls._lock:
+                entry = cls._entries.get(key)
+                if entry is not None:
+                    return entry.value
+            value = await loader()
+            cls._store(key, value)
+            return value
+
+    @classmethod
+    def peek(cls, key: ListingCacheKey) -> Any | None:
+        """Returns the cached listing for the key without loading it, or None if it has not been loaded."""
+        with cls._lock:
+            entry = cls._entries.get(key)
+            return entry.value if entry is not None else None
+
+    @classmethod
+    def invalidate(cls, key: ListingCacheKey | None = None, resource: str | None = None) -> None:
+        """Drops a single entry, every entry for a resource type, or the whole cache when called without arguments."""
+        with cls._lock:
+            if key is not None:
+                cls._entries.pop(key, None)
+            elif resource is not None:
+                for stale_key in [k for k in cls._entries if k.resource == resource]:
+                    del cls._entries[stale_key]
+            else:
+                cls._entries.clear()
+
+    @classmethod
+    def _lookup(cls, key: ListingCacheKey, ttl: float) -> tuple[ListingCacheEntry | None, bool]:
+        """Returns the entry for the key, and whether the caller should refresh it because it has gone stale."""
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is None or entry.refreshing or time.monotonic() - entry.fetched_at <= ttl:
+                return entry, False
+            entry.refreshing = True
+            return entry, True
+
+    @classmethod
+    def _store(cls, key: ListingCacheKey, value: Any) -> None:
+        with cls._lock:
+            cls._entries[key] = ListingCacheEntry(value=value, fetched_at=time.monotonic())
+
+    @classmethod
+    def _refresh(cls, key: ListingCacheKey, loader: Callable[[], Any]) -> None:
+        try:
+            # Background refreshes give way to requests someone is waiting on.
+            with request_priority(RequestPriority.LOW):
+                value = loader()
+        except Exception as e:
+            cls._finish_refresh(key, error=e)
+            return
+        cls._finish_refresh(key, value=value)
+
+    @classmethod
+    async def _refresh_async(cls, key: ListingCacheKey, loader: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            with request_priority(RequestPriority.LOW):
+                value = await loader()
+        except Exception as e:
+            cls._finish_refresh(key, error=e)
+            return
+        cls._finish_refresh(key, value=value)
+
+    @classmethod
+    def _finish_refresh(cls, key: ListingCacheKey, value: Any = None, error: Exception | None = None) -> None:
+        if error is not None:
+            logger.warning(
+                "Failed to refresh Griptape Cloud listing '%s'. Serving stale entry: %s", key.resource, error
+            )
+            with cls._lock:
+                if (entry := cls._entries.get(key)) is not None:
+                    entry.refreshing = False
+            return
+        with cls._lock:
+            # Entries invalidated while the refresh was in flight stay invalidated.
+            if key in cls._entries:
+                cls._entries[key] = ListingCacheEntry(value=value, fetched_at=time.monotonic())
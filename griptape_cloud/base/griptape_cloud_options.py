@@ -0,0 +1,78 @@
+import logging
+import os
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from base.griptape_cloud_settings import get_bool_setting, get_library_setting
+from base.indexed_choices import IndexedChoices
+from griptape_nodes.exe_types.core_types import Parameter
+from griptape_nodes.traits.options import Options
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+LAZY_OPTIONS_AUTO = "auto"
+# Set by Griptape Cloud for the structure runs that execute published workflows.
+STRUCTURE_RUN_ID_ENV_VAR = "GT_CLOUD_STRUCTURE_RUN_ID"
+
+
+def is_headless() -> bool:
+    """Returns whether the workflow runs without an editor, as a published workflow on Griptape Cloud."""
+    return STRUCTURE_RUN_ID_ENV_VAR in os.environ
+
+
+def use_lazy_options() -> bool:
+    """Returns whether selector nodes defer loading their choices until they are validated or run.
+
+    Follows GT_CLOUD_LAZY_OPTIONS. With `auto`, the default, choices are deferred when running headless, where no
+    one looks at the dropdowns and loading them only delays the run.
+    """
+    if str(get_library_setting("GT_CLOUD_LAZY_OPTIONS", LAZY_OPTIONS_AUTO)).strip().lower() == LAZY_OPTIONS_AUTO:
+        return is_headless()
+    return get_bool_setting("GT_CLOUD_LAZY_OPTIONS", default=False)
+
+
+@dataclass(eq=False)
+class GriptapeCloudOptions(Options):
+    """Options trait for selecting a Griptape Cloud resource by ID from an IndexedChoices listing."""
+
+    indexed_choices: IndexedChoices = field(kw_only=True)
+
+    def __init__(self, *, indexed_choices: IndexedChoices):
+        super().__init__(choices=indexed_choices.labels)
+        self.indexed_choices = indexed_choices
+
+    def set_indexed_choices(self, indexed_choices: IndexedChoices) -> None:
+        self.indexed_choices = indexed_choices
+        self.choices = indexed_choices.labels
+
+    def converters_for_trait(self) -> list[Callable]:
+        def converter(value: Any) -> Any:
+            if not self.indexed_choices:
+                # Choices are loaded lazily; keep the value until they are available.
+                return value
+            resource_id = self.indexed_choices.resolve_id(value)
+            if resource_id is None:
+                msg = f"Selection '{value}' is not in choices. Defaulting to first choice: '{self.choices[0]}'."
+                logger.warning(msg)
+                resource_id = self.indexed_choices.first_id()
+            msg = f"Converted choice into value: {resource_id}"
+            logger.warning(msg)
+            return resource_id
+
+        return [converter]
+
+    def validators_for_trait(self) -> list[Callable[[Parameter, Any], Any]]:
+        def validator(param: Parameter, value: Any) -> None:
+            if not self.indexed_choices:
+                return
+            if value not in self.indexed_choices.by_id:
+                msg = f"Attempted to set Parameter '{param.name}' to value '{value}', but that was not one of the available choices."
+
+                def raise_error() -> None:
+                    raise ValueError(msg)
+
+                raise_error()
+
+        return [validator]
@@ -0,0 +1,59 @@
+import logging
+import os
+from pathlib import Path
+
+from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
+
+GRIPTAPE_CLOUD_LIBRARY_CONFIG_KEY = "griptape_cloud_library"
+
+logger = logging.getLogger(__name__)
+
+
+def get_library_setting(name: str, default: str) -> str:
+    """Reads an optional Griptape Cloud Library setting, falling back to the default when unset."""
+    try:
+        value = GriptapeNodes.ConfigManager().get_config_value(f"{GRIPTAPE_CLOUD_LIBRARY_CONFIG_KEY}.{name}")
+    except Exception as e:
+        logger.debug("Failed to read setting '%s': %s", name, e)
+        return default
+    if value is None or value == "":
+        return default
+    return str(value)
+
+
+def get_int_setting(name: str, default: int) -> int:
+    """Reads an optional integer setting."""
+    try:
+        return int(get_library_setting(name, str(default)))
+    except ValueError:
+        logger.warning("Setting '%s' is not an integer. Using default: %s", name, default)
+        return default
+
+
+def get_float_setting(name: str, default: float) -> float:
+    """Reads an optional numeric setting."""
+    try:
+        return float(get_library_setting(name, str(default)))
+    except ValueError:
+        logger.warning("Setting '%s' is not a number. Using default: %s", name, default)
+        return default
+
+
+def get_bool_setting(name: str, *, default: bool) -> bool:
+    """Reads an optional boolean setting."""
+    value = get_library_setting(name, str(default)).strip().lower()
+    return value in {"1", "true", "yes", "on"}
+
+
+def get_list_setting(name: str, default: list[str]) -> list[str]:
+    """Reads an optional comma-separated list setting."""
+    value = get_library_setting(name, ",".join(default))
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def get_cache_directory(*parts: str) -> Path:
+    """Returns (and creates) a directory under the Griptape Cloud Library's local cache."""
+    default_root = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "griptape_cloud"
+    cache_directory = Path(get_library_setting("GT_CLOUD_CACHE_DIRECTORY", str(default_root))).joinpath(*parts)
+    cache_directory.mkdir(parents=True, exist_ok=True)
+    return cache_directory
@@ -0,0 +1,43 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class IndexedChoices:
+    """A resource listing indexed for constant-time lookups by ID and by display label.
+
+    Built once per listing refresh and shared by the selector nodes and their Options traits.
+    """
+
+    details: list[Any] = field(default_factory=list)
+    labels: list[str] = field(default_factory=list)
+    by_id: dict[str, Any] = field(default_factory=dict)
+    id_by_label: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def make_label(cls, name: str, resource_id: str) -> str:
+        return f"{name} ({resource_id})"
+
+    @classmethod
+    def from_details(cls, details: list[Any], id_attr: str) -> "IndexedChoices":
+        """Indexes details by the ID attribute (e.g. `structure_id`) and by their `name (id)` label."""
+        indexed_choices = cls(details=list(details))
+        for detail in indexed_choices.details:
+            resource_id = getattr(detail, id_attr)
+            label = cls.make_label(detail.name, resource_id)
+            indexed_choices.labels.append(label)
+            indexed_choices.by_id[resource_id] = detail
+            indexed_choices.id_by_label[label] = resource_id
+        return indexed_choices
+
+    def __bool__(self) -> bool:
+        return bool(self.details)
+
+    def resolve_id(self, value: Any) -> str | None:
+        """Returns the ID for a value that is either an ID or a label, or None if it matches neither."""
+        if value in self.by_id:
+            return value
+        return self.id_by_label.get(value)
+
+    def first_id(self) -> str | None:
+        return next(iter(self.by_id), None)
@@ -0,0 +1,426 @@
+import atexit
+import contextlib
+import logging
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, ClassVar
+
+import httpx
+from base.circuit_breaker import CircuitOpenError
+from base.endpoints import get_endpoint_class, get_endpoint_key
+from base.griptape_cloud_settings import get_cache_directory, get_library_setting, get_list_setting
+from base.json_store import write_text_atomically
+
+logger = logging.getLogger(__name__)
+
+LOGGING_SINK = "logging"
+PROMETHEUS_SINK = "prometheus"
+OPENTELEMETRY_SINK = "otel"
+
+DEFAULT_PROMETHEUS_FLUSH_INTERVAL = 15.0
+# Checked in order, so more specific error types come first.
+ERROR_CATEGORIES: tuple[tuple[type[BaseException], str], ...] = (
+    (CircuitOpenError, "circuit_open"),
+    (httpx.TimeoutException, "timeout"),
+    (httpx.NetworkError, "connection"),
+    (httpx.TransportError, "transport"),
+)
+DURATION_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+
+def get_error_category(status_code: int | None = None, error: BaseException | None = None) -> str | None:
+    """Returns a coarse category for a failed request, or None if it succeeded."""
+    if error is not None:
+        return next((category for error_type, category in ERROR_CATEGORIES if isinstance(error, error_type)), "error")
+    if status_code is None or status_code < httpx.codes.BAD_REQUEST:
+        return None
+    if status_code == httpx.codes.TOO_MANY_REQUESTS:
+        return "rate_limited"
+    if status_code >= httpx.codes.INTERNAL_SERVER_ERROR:
+        return "server_error"
+    return "client_error"
+
+
+@dataclass
+class RequestRecord:
+    """Timing and outcome of one Griptape Cloud API call, including all of its retries."""
+
+    method: str
+    endpoint: str
+    endpoint_class: str
+    start_time_ns: int
+    started_at: float
+    status_code: int | None = None
+    duration: float = 0.0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    retries: int = 0
+    rate_limit_wait: float = 0.0
+    error_category: str | None = None
+
+
+@dataclass
+class PhaseRecord:
+    """Timing and outcome of a named phase of work, such as packaging a workflow for publishing."""
+
+    name: str
+    start_time_ns: int
+    duration: float = 0.0
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error_category: str | None = None
+
+
+class InstrumentationSink:
+    """Receives request and phase records. Subclasses override the hooks they are interested in."""
+
+    def record_request(self, record: RequestRecord) -> None:
+        pass
+
+    def record_phase(self, record: PhaseRecord) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+
+class LoggingSink(InstrumentationSink):
+    def record_request(self, record: RequestRecord) -> None:
+        logger.info(
+            "%s -> %s in %.3fs (sent %d B, received %d B, %d retries, %.3fs rate limited%s)",
+            record.endpoint,
+            record.status_code,
+            record.duration,
+            record.bytes_sent,
+            record.bytes_received,
+            record.retries,
+            record.rate_limit_wait,
+            f", {record.error_category}" if record.error_category else "",
+        )
+
+    def record_phase(self, record: PhaseRecord) -> None:
+        logger.info(
+            "Phase %s took %.3fs%s %s",
+            record.name,
+            record.duration,
+            f" ({record.error_category})" if record.error_category else "",
+            record.attributes or "",
+        )
+
+
+def _escape_label(value: object) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: tuple[tuple[str, str], ...]) -> str:
+    return ",".join(f'{name}="{_escape_label(value)}"' for name, value in labels)
+
+
+class _Histogram:
+    def __init__(self) -> None:
+        self.bucket_counts = [0] * len(DURATION_BUCKETS)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        for index, bound in enumerate(DURATION_BUCKETS):
+            if value <= bound:
+                self.bucket_counts[index] += 1
+
+    def format(self, name: str, labels: tuple[tuple[str, str], ...]) -> list[str]:
+        lines = []
+        for bound, count in zip(DURATION_BUCKETS, self.bucket_counts, strict=True):
+            lines.append(f"{name}_bucket{{{_format_labels((*labels, ('le', str(bound))))}}} {count}")
+        lines.append(f"{name}_bucket{{{_format_labels((*labels, ('le', '+Inf')))}}} {self.count}")
+        lines.append(f"{name}_sum{{{_format_labels(labels)}}} {self.total}")
+        lines.append(f"{name}_count{{{_format_labels(labels)}}} {self.count}")
+        return lines
+
+
+class PrometheusTextfileSink(InstrumentationSink):
+    """Aggregates records into Prometheus metrics and writes them to a file for the node exporter's textfile collector.
+
+    The file is replaced atomically at most once per flush interval, and on shutdown.
+    """
+
+    def __init__(self, path: Path, flush_interval: float = DEFAULT_PROMETHEUS_FLUSH_INTERVAL) -> None:
+        self.path = path
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        # Serializes flushes, so the file always ends up with the latest snapshot.
+        self._flush_lock = threading.Lock()
+        self._last_flush = 0.0
+        self._counters: dict[str, dict[tuple[tuple[str, str], ...], float]] = defaultdict(lambda: defaultdict(float))
+        self._histograms: dict[str, dict[tuple[tuple[str, str], ...], _Histogram]] = defaultdict(
+            lambda: defaultdict(_Histogram)
+        )
+
+    def record_request(self, record: RequestRecord) -> None:
+        labels = (
+            ("endpoint", record.endpoint),
+            ("endpoint_class", record.endpoint_class),
+            ("status", str(record.status_code or "")),
+        )
+        endpoint_labels = labels[:2]
+        with self._lock:
+            self._counters["griptape_cloud_requests_total"][labels] += 1
+            self._counters["griptape_cloud_request_retries_total"][endpoint_labels] += record.retries
+            self._counters["griptape_cloud_request_bytes_sent_total"][endpoint_labels] += record.bytes_sent
+            self._counters["griptape_cloud_request_bytes_received_total"][endpoint_labels] += record.bytes_received
+            self._counters["griptape_cloud_rate_limit_wait_seconds_total"][endpoint_labels] += record.rate_limit_wait
+            if record.error_category is not None:
+                error_labels = (*endpoint_labels, ("category", record.error_category))
+                self._counters["griptape_cloud_request_errors_total"][error_labels] += 1
+            self._histograms["griptape_cloud_request_duration_seconds"][endpoint_labels].observe(record.duration)
+        self._maybe_flush()
+
+    def record_phase(self, record: PhaseRecord) -> None:
+        labels = (("phase", record.name),)
+        with self._lock:
+            self._histograms["griptape_cloud_phase_duration_seconds"][labels].observe(record.duration)
+            if record.error_category is not None:
+                self._counters["griptape_cloud_phase_errors_total"][labels] += 1
+        self._maybe_flush()
+
+    def flush(self) -> None:
+        with self._flush_lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        with self._lock:
+            lines = []
+            for name, series in sorted(self._counters.items()):
+                lines.append(f"# TYPE {name} counter")
+                lines.extend(f"{name}{{{_format_labels(labels)}}} {value}" for labels, value in series.items())
+            for name, series in sorted(self._histograms.items()):
+                lines.append(f"# TYPE {name} histogram")
+                for labels, histogram in series.items():
+                    lines.extend(histogram.format(name, labels))
+            self._last_flush = time.monotonic()
+        try:
+            # Other processes sharing the file must not write into the same temporary file.
+            write_text_atomically(self.path, "\n".join(lines) + "\n")
+        except OSError as e:
+            logger.warning("Failed to write Griptape Cloud metrics to %s: %s", self.path, e)
+
+    def _maybe_flush(self) -> None:
+        # A flush already in progress writes this record too, or the next one will.
+        if time.monotonic() - self._last_flush >= self.flush_interval and self._flush_lock.acquire(blocking=False):
+            try:
+                self._flush()
+            finally:
+                self._flush_lock.release()
+
+
+class OpenTelemetrySink(InstrumentationSink):
+    """Emits a span for every request and phase through the globally configured OpenTelemetry tracer provider."""
+
+    def __init__(self) -> None:
+        from opentelemetry import trace
+
+        self._tracer = trace.get_tracer("griptape_cloud")
+
+    def record_request(self, record: RequestRecord) -> None:
+        span = self._tracer.start_span(
+            f"{record.method} {record.endpoint_class}",
+            start_time=record.start_time_ns,
+            attributes={
+                "http.request.method": record.method,
+                "http.response.status_code": record.status_code or 0,
+                "griptape_cloud.endpoint": record.endpoint,
+                "griptape_cloud.bytes_sent": record.bytes_sent,
+                "griptape_cloud.bytes_received": record.bytes_received,
+                "griptape_cloud.retries": record.retries,
+                "griptape_cloud.rate_limit_wait": record.rate_limit_wait,
+                "error.type": record.error_category or "",
+            },
+        )
+        span.end(end_time=record.start_time_ns + int(record.duration * 1e9))
+
+    def record_phase(self, record: PhaseRecord) -> None:
+        attributes = {f"griptape_cloud.{name}": str(value) for name, value in record.attributes.items()}
+        attributes["error.type"] = record.error_category or ""
+        span = self._tracer.start_span(record.name, start_time=record.start_time_ns, attributes=attributes)
+        span.end(end_time=record.start_time_ns + int(record.duration * 1e9))
+
+
+class _InstrumentedStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Response stream that counts the bytes read and reports the request once the response is closed."""
+
+    def __init__(self, stream: Any, on_close: Callable[[int], None]) -> None:
+        self._stream = stream
+        self._on_close = on_close
+        self._bytes_received = 0
+        self._closed = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._stream:
+            self._bytes_received += len(chunk)
+            yield chunk
+
+    async def __aiter__(self) -> Any:
+        async for chunk in self._stream:
+            self._bytes_received += len(chunk)
+            yield chunk
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._finish()
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._finish()
+
+    def _finish(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._on_close(self._bytes_received)
+
+
+class GriptapeCloudInstrumentation:
+    """Process-wide instrumentation of Griptape Cloud API calls and publishing phases.
+
+    Sinks are chosen with the comma-separated GT_CLOUD_INSTRUMENTATION_SINKS setting (`logging`, `prometheus`,
+    `otel`) and more can be attached with `add_sink`. With no sinks, which is the default, requests and phases are
+    not timed at all.
+    """
+
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    _sinks: ClassVar[list[InstrumentationSink] | None] = None
+
+    @classmethod
+    def get_sinks(cls) -> list[InstrumentationSink]:
+        sinks = cls._sinks
+        if sinks is None:
+            with cls._lock:
+                if cls._sinks is None:
+                    cls._sinks = cls._create_sinks()
+                sinks = cls._sinks
+        return sinks
+
+    @classmethod
+    def add_sink(cls, sink: InstrumentationSink) -> None:
+        sinks = cls.get_sinks()
+        with cls._lock:
+            cls._sinks = [*sinks, sink]
+
+    @classmethod
+    def reset(cls) -> None:
+        """Flushes the current sinks and reloads them from the settings on next use."""
+        cls.flush()
+        with cls._lock:
+            cls._sinks = None
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return bool(cls.get_sinks())
+
+    @classmethod
+    def start_request(cls, request: httpx.Request) -> RequestRecord | None:
+        """Returns a record to fill in for the request, or None when instrumentation is disabled."""
+        if not cls.get_sinks():
+            return None
+        return RequestRecord(
+            method=request.method,
+            endpoint=get_endpoint_key(request),
+            endpoint_class=get_endpoint_class(request),
+            start_time_ns=time.time_ns(),
+            started_at=time.monotonic(),
+            bytes_sent=len(request.content),
+        )
+
+    @classmethod
+    def finish_request(cls, record: RequestRecord, error: BaseException) -> None:
+        """Reports a request that failed without a response."""
+        record.duration = time.monotonic() - record.started_at
+        record.error_category = get_error_category(error=error)
+        cls._emit_request(record)
+
+    @classmethod
+    def instrument_response(cls, record: RequestRecord | None, response: httpx.Response) -> httpx.Response:
+        """Returns the response with its stream wrapped so that the request is reported once the body is read."""
+        if record is None:
+            return response
+        record.status_code = response.status_code
+        record.error_category = get_error_category(status_code=response.status_code)
+
+        def on_close(bytes_received: int) -> None:
+            record.duration = time.monotonic() - record.started_at
+            record.bytes_received = bytes_received
+            cls._emit_request(record)
+
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_InstrumentedStream(response.stream, on_close),
+            extensions=response.extensions,
+        )
+
+    @classmethod
+    @contextlib.contextmanager
+    def phase(cls, name: str, **attributes: Any) -> Iterator[None]:
+        """Times the block as a named phase, recording whether it raised."""
+        if not cls.get_sinks():
+            yield
+            return
+        record = PhaseRecord(name=name, start_time_ns=time.time_ns(), attributes=attributes)
+        started_at = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            record.error_category = get_error_category(error=e)
+            raise
+        finally:
+            record.duration = time.monotonic() - started_at
+            for sink in cls.get_sinks():
+                try:
+                    sink.record_phase(record)
+                except Exception as e:
+                    logger.debug("Instrumentation sink %s failed: %s", type(sink).__name__, e)
+
+    @classmethod
+    def flush(cls) -> None:
+        for sink in cls._sinks or []:
+            try:
+                sink.flush()
+            except Exception as e:
+                logger.debug("Instrumentation sink %s failed to flush: %s", type(sink).__name__, e)
+
+    @classmethod
+    def _emit_request(cls, record: RequestRecord) -> None:
+        for sink in cls.get_sinks():
+            try:
+                sink.record_request(record)
+            except Exception as e:
+                logger.debug("Instrumentation sink %s failed: %s", type(sink).__name__, e)
+
+    @classmethod
+    def _create_sinks(cls) -> list[InstrumentationSink]:
+        sinks: list[InstrumentationSink] = []
+        for name in get_list_setting("GT_CLOUD_INSTRUMENTATION_SINKS", []):
+            if name == LOGGING_SINK:
+                sinks.append(LoggingSink())
+            elif name == PROMETHEUS_SINK:
+                default_path = get_cache_directory("metrics") / "griptape_cloud.prom"
+                path = Path(get_library_setting("GT_CLOUD_PROMETHEUS_TEXTFILE", str(default_path)))
+                sinks.append(PrometheusTextfileSink(path))
+            elif name == OPENTELEMETRY_SINK:
+                try:
+                    sinks.append(OpenTelemetrySink())
+                except ImportError:
+                    logger.warning("The 'otel' instrumentation sink requires the 'opentelemetry-api' package.")
+            else:
+                logger.warning("Unknown Griptape Cloud instrumentation sink '%s'. Ignoring it.", name)
+        return sinks
+
+
+atexit.register(GriptapeCloudInstrumentation.flush)
@@ -0,0 +1,47 @@
+import json
+import logging
+import tempfile
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def load_json(path: Path, description: str) -> Any | None:
+    """Returns the parsed contents of a JSON file, or None if it does not exist or cannot be read.
+
+    Args:
+        path: The file to read.
+        description: What the file is, for the warning logged when it cannot be read (e.g. "asset hash index").
+    """
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (ValueError, OSError) as e:
+        logger.warning("Ignoring unreadable %s: %s", description, e)
+        return None
+
+
+def save_json(path: Path, data: Any) -> None:
+    """Writes data to a JSON file, replacing it atomically."""
+    write_text_atomically(path, json.dumps(data))
+
+
+def write_text_atomically(path: Path, text: str) -> None:
+    """Writes text to a file through a uniquely named temporary file next to it, then renames it into place.
+
+    A crash never leaves a truncated file behind, and processes saving the same file at once never write into each
+    other's temporary file; the last rename wins.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+    ) as file:
+        file.write(text)
+    temp_path = Path(file.name)
+    try:
+        temp_path.replace(path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
@@ -0,0 +1,238 @@
+import asyncio
+import contextlib
+import logging
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import ClassVar
+
+import httpx
+from base.endpoints import (
+    ASSETS,
+    DEFAULT,
+    ENDPOINT_CLASSES,
+    EVENTS,
+    LISTINGS,
+    RUNS,
+    get_endpoint_class,
+    is_run_creation,
+)
+from base.griptape_cloud_settings import get_float_setting
+
+logger = logging.getLogger(__name__)
+
+# Requests per second for each endpoint class.
+DEFAULT_RATE_LIMITS = {
+    EVENTS: 10.0,
+    RUNS: 5.0,
+    ASSETS: 10.0,
+    LISTINGS: 5.0,
+    DEFAULT: 10.0,
+}
+# Requests per second across every endpoint class, where requests of different classes compete.
+TOTAL = "total"
+DEFAULT_TOTAL_RATE_LIMIT = 20.0
+# Every bucket lets this many seconds' worth of requests through at once.
+BURST_SECONDS = 2.0
+# Waits longer than this are logged.
+SLOW_WAIT_THRESHOLD = 1.0
+
+
+class RequestPriority(IntEnum):
+    """Order in which waiting requests are let through. Lower values go first.
+
+    The priority is kept in a context variable, so work handed to a thread pool keeps it only when submitted
+    through `contextvars.copy_context().run`.
+    """
+
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+_request_priority: ContextVar[RequestPriority | None] = ContextVar("griptape_cloud_request_priority", default=None)
+
+
+@contextlib.contextmanager
+def request_priority(priority: RequestPriority) -> Iterator[None]:
+    """Sets the rate limiter priority of the Griptape Cloud requests made within the block."""
+    token = _request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+
+def get_request_priority(request: httpx.Request) -> RequestPriority:
+    """Returns the priority set with `request_priority`, or HIGH for run creation and NORMAL for the rest."""
+    priority = _request_priority.get()
+    if priority is not None:
+        return priority
+    return RequestPriority.HIGH if is_run_creation(request) else RequestPriority.NORMAL
+
+
+@dataclass
+class RateLimiterStats:
+    requests: int = 0
+    throttled: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+
+    def record(self, wait_seconds: float) -> None:
+        self.requests += 1
+        if wait_seconds > 0:
+            self.throttled += 1
+            self.wait_seconds_total += wait_seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, wait_seconds)
+
+
+class TokenBucket:
+    """Thread-safe token bucket whose waiters are let through in priority order.
+
+    A waiter only takes a token when no waiter of a higher priority is queued, so run creation is not held up
+    behind a backlog of background listing refreshes. A rate of 0 or less disables the bucket.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.stats = RateLimiterStats()
+        self._condition = threading.Condition()
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._waiting: Counter[RequestPriority] = Counter()
+
+    def acquire(self, priority: RequestPriority = RequestPriority.NORMAL) -> float:
+        """Blocks until a token is available and returns how many seconds were spent waiting."""
+        started_at = time.monotonic()
+        with self._condition:
+            self._waiting[priority] += 1
+            waited = False
+            try:
+                while (delay := self._try_acquire(priority)) > 0:
+                    waited = True
+                    self._condition.wait(delay)
+            finally:
+                self._waiting[priority] -= 1
+                self._condition.notify_all()
+            wait_seconds = time.monotonic() - started_at if waited else 0.0
+            self.stats.record(wait_seconds)
+        return wait_seconds
+
+    async def acquire_async(self, priority: RequestPriority = RequestPriority.NORMAL) -> float:
+        """Waits without blocking the event loop until a token is available; returns the seconds spent waiting."""
+        started_at = time.monotonic()
+        waited = False
+        with self._condition:
+            self._waiting[priority] += 1
+        try:
+            while True:
+                with self._condition:
+                    delay = self._try_acquire(priority)
+                if delay <= 0:
+                    break
+                waited = True
+                await asyncio.sleep(delay)
+        finally:
+            with self._condition:
+                self._waiting[priority] -= 1
+                self._condition.notify_all()
+        wait_seconds = time.monotonic() - started_at if waited else 0.0
+        with self._condition:
+            self.stats.record(wait_seconds)
+        return wait_seconds
+
+    def _try_acquire(self, priority: RequestPriority) -> float:
+        """Takes a token and returns 0, or returns how long to wait before trying again. Holds the condition."""
+        if self.rate <= 0:
+            return 0.0
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+        token_delay = max((1 - self._tokens) / self.rate, 1 / self.rate / 10)
+        if any(self._waiting[higher] for higher in RequestPriority if higher < priority):
+            return token_delay
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return token_delay
+
+
+class GriptapeCloudRateLimiter:
+    """Process-wide client-side rate limiter for Griptape Cloud API requests.
+
+    Every API client from the registry draws from the same token buckets, one per endpoint class (events, runs,
+    assets, listings and everything else), so concurrent nodes and the publisher stay within the organization's
+    quota together rather than each backing off from 429s on its own. A request then draws from a total bucket
+    shared by every class, where waiters are let through in priority order, so run creation overtakes a backlog of
+    background listing refreshes even though the two never share an endpoint class.
+    """
+
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    _buckets: ClassVar[dict[str, TokenBucket]] = {}
+
+    @classmethod
+    def get_bucket(cls, endpoint_class: str) -> TokenBucket:
+        """Returns the bucket of an endpoint class, or the bucket shared by every class for TOTAL."""
+        with cls._lock:
+            bucket = cls._buckets.get(endpoint_class)
+            if bucket is None:
+                default_rate = (
+                    DEFAULT_TOTAL_RATE_LIMIT
+                    if endpoint_class == TOTAL
+                    else DEFAULT_RATE_LIMITS.get(endpoint_class, DEFAULT_RATE_LIMITS[DEFAULT])
+                )
+                rate = get_float_setting(f"GT_CLOUD_RATE_LIMIT_{endpoint_class.upper()}", default_rate)
+                bucket = TokenBucket(rate=rate, burst=round(rate * BURST_SECONDS))
+                cls._buckets[endpoint_class] = bucket
+            return bucket
+
+    @classmethod
+    def acquire(cls, request: httpx.Request) -> float:
+        """Blocks until the request's endpoint class has capacity for it; returns the seconds spent waiting."""
+        endpoint_class = get_endpoint_class(request)
+        priority = get_request_priority(request)
+        wait_seconds = cls.get_bucket(endpoint_class).acquire(priority)
+        wait_seconds += cls.get_bucket(TOTAL).acquire(priority)
+        cls._log_wait(request, endpoint_class, wait_seconds)
+        return wait_seconds
+
+    @classmethod
+    async def acquire_async(cls, request: httpx.Request) -> float:
+        endpoint_class = get_endpoint_class(request)
+        priority = get_request_priority(request)
+        wait_seconds = await cls.get_bucket(endpoint_class).acquire_async(priority)
+        wait_seconds += await cls.get_bucket(TOTAL).acquire_async(priority)
+        cls._log_wait(request, endpoint_class, wait_seconds)
+        return wait_seconds
+
+    @classmethod
+    def get_stats(cls) -> dict[str, RateLimiterStats]:
+        """Returns a snapshot of the queueing statistics of every endpoint class and of the total bucket."""
+        with cls._lock:
+            buckets = dict(cls._buckets)
+        return {
+            endpoint_class: RateLimiterStats(**vars(buckets[endpoint_class].stats))
+            for endpoint_class in (*ENDPOINT_CLASSES, TOTAL)
+            if endpoint_class in buckets
+        }
+
+    @classmethod
+    def reset_all(cls) -> None:
+        with cls._lock:
+            cls._buckets.clear()
+
+    @classmethod
+    def _log_wait(cls, request: httpx.Request, endpoint_class: str, wait_seconds: float) -> None:
+        if wait_seconds >= SLOW_WAIT_THRESHOLD:
+            logger.info(
+                "Griptape Cloud request %s %s waited %.1fs for the %s rate limit.",
+                request.method,
+                request.url.path,
+                wait_seconds,
+                endpoint_class,
+            )
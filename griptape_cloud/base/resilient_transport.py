@@ -0,0 +1,329 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+import uuid
+from collections.abc import AsyncGenerator, Callable, Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import httpx
+from base.circuit_breaker import CircuitBreaker
+from base.endpoints import get_endpoint_key
+from base.griptape_cloud_settings import get_bool_setting, get_int_setting
+from base.instrumentation import GriptapeCloudInstrumentation, RequestRecord
+from base.rate_limiter import GriptapeCloudRateLimiter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_RETRIES = 4
+DEFAULT_BACKOFF_BASE = 0.5
+DEFAULT_BACKOFF_MAX = 30.0
+DEFAULT_RETRY_AFTER_MAX = 120.0
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+TOO_MANY_REQUESTS = 429
+# Errors raised before the request reached the server, so retrying them is safe for any method.
+UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parses a `Retry-After` header given either as seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max((retry_at - datetime.now(UTC)).total_seconds(), 0.0)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When and how long to wait before retrying a Griptape Cloud API request.
+
+    Idempotent requests are retried on 5xx responses and transport errors with jittered exponential backoff. 429
+    responses and connection failures are retried for any request, since the server did not act on them. Other
+    failed create calls (POST) are not retried, since retrying one the server did act on would, for example, start a
+    second run. With `idempotency_keys`, POSTs carry an idempotency key and are retried like idempotent requests;
+    it is off by default until Griptape Cloud is confirmed to honor the header. A `Retry-After` header replaces the
+    backoff, unless it asks for a longer wait than `retry_after_max`, in which case the response is returned as is.
+    """
+
+    max_retries: int = DEFAULT_MAX_RETRIES
+    backoff_base: float = DEFAULT_BACKOFF_BASE
+    backoff_max: float = DEFAULT_BACKOFF_MAX
+    retry_after_max: float = DEFAULT_RETRY_AFTER_MAX
+    idempotency_keys: bool = False
+
+    @classmethod
+    def from_settings(cls) -> "RetryPolicy":
+        return cls(
+            max_retries=get_int_setting("GT_CLOUD_HTTP_MAX_RETRIES", DEFAULT_MAX_RETRIES),
+            idempotency_keys=get_bool_setting("GT_CLOUD_HTTP_IDEMPOTENCY_KEYS", default=False),
+        )
+
+    def prepare(self, request: httpx.Request) -> None:
+        """Adds an idempotency key to create calls, so that every attempt of the call carries the same key."""
+        if self.idempotency_keys and request.method == "POST" and IDEMPOTENCY_KEY_HEADER not in request.headers:
+            request.headers[IDEMPOTENCY_KEY_HEADER] = str(uuid.uuid4())
+
+    def is_retryable_request(self, request: httpx.Request) -> bool:
+        return request.method in IDEMPOTENT_METHODS or IDEMPOTENCY_KEY_HEADER in request.headers
+
+    def get_backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))  # noqa: S311
+
+    def get_retry_delay(
+        self,
+        request: httpx.Request,
+        attempt: int,
+        *,
+        response: httpx.Response | None = None,
+        error: Exception | None = None,
+    ) -> float | None:
+        """Returns how long to wait before retrying the attempt, or None if it should not be retried."""
+        if attempt >= self.max_retries:
+            return None
+        if error is not None:
+            retryable = isinstance(error, UNSENT_ERRORS) or self.is_retryable_request(request)
+            return self.get_backoff(attempt) if retryable else None
+        if response is None or not self._is_retryable_response(request, response):
+            return None
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is None:
+            return self.get_backoff(attempt)
+        return retry_after if retry_after <= self.retry_after_max else None
+
+    def _is_retryable_response(self, request: httpx.Request, response: httpx.Response) -> bool:
+        if response.status_code not in RETRYABLE_STATUS_CODES:
+            return False
+        return response.status_code == TOO_MANY_REQUESTS or self.is_retryable_request(request)
+
+
+def _record_response(breaker: CircuitBreaker, response: httpx.Response) -> None:
+    if response.status_code >= httpx.codes.INTERNAL_SERVER_ERROR:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+
+
+def _log_retry(request: httpx.Request, attempt: int, max_retries: int, delay: float, reason: object) -> None:
+    logger.warning(
+        "Griptape Cloud request %s %s failed (%s). Retrying in %.1fs (retry %d of %d).",
+        request.method,
+        request.url.path,
+        reason,
+        delay,
+        attempt + 1,
+        max_retries,
+    )
+
+
+class _TrackedStream(httpx.SyncByteStream):
+    """Response stream that calls `on_close` once the response is closed."""
+
+    def __init__(self, stream: Any, on_close: Callable[[], None]) -> None:
+        self._stream = stream
+        self._on_close = on_close
+        self._closed = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            if not self._closed:
+                self._closed = True
+                self._on_close()
+
+
+class ResilientTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """httpx transport that rate limits, retries, circuit-breaks and instruments every Griptape Cloud API call.
+
+    The transport serves both the sync and async clients built by `AuthenticatedClient`, wrapping a pooled
+    `HTTPTransport` or `AsyncHTTPTransport` created on first use with the given keyword arguments. Async connection
+    pools are bound to the event loop that opened them, so every event loop gets an `AsyncHTTPTransport` of its own,
+    closed when the loop shuts down its async generators, as `asyncio.run` does before closing the loop.
+
+    A transport that is no longer handed out can be retired: its sync connection pool is closed as soon as the
+    responses still being read from it are closed, and rebuilt should it be used again.
+    """
+
+    def __init__(self, policy: RetryPolicy | None = None, **transport_kwargs: Any) -> None:
+        self.policy = policy or RetryPolicy.from_settings()
+        self._transport_kwargs = transport_kwargs
+        self._lock = threading.Lock()
+        self._transport: httpx.HTTPTransport | None = None
+        self._in_flight = 0
+        self._retired = False
+        self._async_transports: dict[
+            asyncio.AbstractEventLoop, tuple[httpx.AsyncHTTPTransport, AsyncGenerator[None, None]]
+        ] = {}
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self._in_flight += 1
+        try:
+            self.policy.prepare(request)
+            # Buffer the body so that it can be sent again.
+            request.read()
+            record = GriptapeCloudInstrumentation.start_request(request)
+            try:
+                response = self._send(request, record)
+            except Exception as e:
+                if record is not None:
+                    GriptapeCloudInstrumentation.finish_request(record, error=e)
+                raise
+        except BaseException:
+            self._finish_request()
+            raise
+        response = httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_TrackedStream(response.stream, self._finish_request),
+            extensions=response.extensions,
+        )
+        return GriptapeCloudInstrumentation.instrument_response(record, response)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.policy.prepare(request)
+        await request.aread()
+        record = GriptapeCloudInstrumentation.start_request(request)
+        try:
+            response = await self._send_async(request, record)
+        except Exception as e:
+            if record is not None:
+                GriptapeCloudInstrumentation.finish_request(record, error=e)
+            raise
+        return GriptapeCloudInstrumentation.instrument_response(record, response)
+
+    def close(self) -> None:
+        with self._lock:
+            transport, self._transport = self._transport, None
+        if transport is not None:
+            transport.close()
+
+    def retire(self) -> None:
+        """Closes the sync connection pool once no response from it is left open."""
+        with self._lock:
+            self._retired = True
+        self._close_if_idle()
+
+    def _finish_request(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+        self._close_if_idle()
+
+    def _close_if_idle(self) -> None:
+        with self._lock:
+            if not self._retired or self._in_flight:
+                return
+            transport, self._transport = self._transport, None
+        if transport is not None:
+            transport.close()
+
+    async def aclose(self) -> None:
+        # Transports of other event loops can only be closed from their own loop; they are closed as it shuts down.
+        with self._lock:
+            entry = self._async_transports.get(asyncio.get_running_loop())
+        if entry is not None:
+            await entry[1].aclose()
+
+    def _send(self, request: httpx.Request, record: RequestRecord | None) -> httpx.Response:
+        breaker = CircuitBreaker.get(get_endpoint_key(request))
+        transport = self._get_transport()
+        attempt = 0
+        while True:
+            breaker.before_request(request)
+            wait_seconds = GriptapeCloudRateLimiter.acquire(request)
+            if record is not None:
+                record.retries = attempt
+                record.rate_limit_wait += wait_seconds
+            try:
+                response = transport.handle_request(request)
+            except httpx.TransportError as e:
+                breaker.record_failure()
+                delay = self.policy.get_retry_delay(request, attempt, error=e)
+                if delay is None or breaker.is_open:
+                    raise
+                _log_retry(request, attempt, self.policy.max_retries, delay, e)
+            else:
+                _record_response(breaker, response)
+                delay = self.policy.get_retry_delay(request, attempt, response=response)
+                if delay is None or breaker.is_open:
+                    return response
+                response.close()
+                _log_retry(request, attempt, self.policy.max_retries, delay, response.status_code)
+            time.sleep(delay)
+            attempt += 1
+
+    async def _send_async(self, request: httpx.Request, record: RequestRecord | None) -> httpx.Response:
+        breaker = CircuitBreaker.get(get_endpoint_key(request))
+        transport = await self._get_async_transport()
+        attempt = 0
+        while True:
+            breaker.before_request(request)
+            wait_seconds = await GriptapeCloudRateLimiter.acquire_async(request)
+            if record is not None:
+                record.retries = attempt
+                record.rate_limit_wait += wait_seconds
+            try:
+                response = await transport.handle_async_request(request)
+            except httpx.TransportError as e:
+                breaker.record_failure()
+                delay = self.policy.get_retry_delay(request, attempt, error=e)
+                if delay is None or breaker.is_open:
+                    raise
+                _log_retry(request, attempt, self.policy.max_retries, delay, e)
+            else:
+                _record_response(breaker, response)
+                delay = self.policy.get_retry_delay(request, attempt, response=response)
+                if delay is None or breaker.is_open:
+                    return response
+                await response.aclose()
+                _log_retry(request, attempt, self.policy.max_retries, delay, response.status_code)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _get_transport(self) -> httpx.HTTPTransport:
+        with self._lock:
+            if self._transport is None:
+                self._transport = httpx.HTTPTransport(**self._transport_kwargs)
+            return self._transport
+
+    async def _get_async_transport(self) -> httpx.AsyncHTTPTransport:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if (entry := self._async_transports.get(loop)) is not None:
+                return entry[0]
+            transport = httpx.AsyncHTTPTransport(**self._transport_kwargs)
+            closer = self._close_on_loop_shutdown(loop, transport)
+            self._async_transports[loop] = (transport, closer)
+        # Started on the loop, so that the loop finalizes it when it shuts down its async generators.
+        await anext(closer)
+        return transport
+
+    async def _close_on_loop_shutdown(
+        self, loop: asyncio.AbstractEventLoop, transport: httpx.AsyncHTTPTransport
+    ) -> AsyncGenerator[None, None]:
+        try:
+            yield
+        finally:
+            with self._lock:
+                if (entry := self._async_transports.get(loop)) is not None and entry[0] is transport:
+                    del self._async_transports[loop]
+            await transport.aclose()
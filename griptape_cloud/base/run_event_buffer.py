@@ -0,0 +1,83 @@
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from base.griptape_cloud_settings import get_list_setting
+
+DEFAULT_MAX_EVENTS = 500
+DEFAULT_MAX_BYTES = 256 * 1024
+DEFAULT_FLUSH_INTERVAL = 0.25
+DEFAULT_EXCLUDED_EVENT_TYPES = ["TextChunkEvent", "ActionChunkEvent"]
+
+
+class RunEventBuffer:
+    """Bounded ring buffer of formatted run events, flushed to a node parameter at a throttled rate.
+
+    Only the most recent events that fit within both the event and byte limits are kept, and events of excluded
+    types are dropped before they are formatted. Flushes replace the parameter's value with the buffer's contents
+    at most once per flush interval, so memory use and UI traffic stay flat however long a run goes on.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        flush: Callable[[str], None],
+        *,
+        format_event: Callable[[Any], str] = lambda event: str(event.payload),
+        max_events: int | None = None,
+        max_bytes: int | None = None,
+        flush_interval: float | None = None,
+        excluded_types: Iterable[str] | None = None,
+    ) -> None:
+        self._flush = flush
+        self._format_event = format_event
+        self.max_events = max_events or DEFAULT_MAX_EVENTS
+        self.max_bytes = max_bytes or DEFAULT_MAX_BYTES
+        self.flush_interval = flush_interval if flush_interval is not None else DEFAULT_FLUSH_INTERVAL
+        self.excluded_types = set(
+            excluded_types
+            if excluded_types is not None
+            else get_list_setting("GT_CLOUD_EVENT_BUFFER_EXCLUDED_TYPES", DEFAULT_EXCLUDED_EVENT_TYPES)
+        )
+        self._lines: deque[str] = deque()
+        self._size = 0
+        self._dropped = 0
+        self._dirty = False
+        self._last_flush = 0.0
+
+    def extend(self, events: Iterable[Any]) -> None:
+        """Adds a batch of events, flushing if the flush interval has passed."""
+        for event in events:
+            if getattr(event, "type_", None) in self.excluded_types:
+                continue
+            self._append(self._format_event(event))
+        if self._dirty and time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """Sends the buffer's contents to the parameter if anything changed since the last flush."""
+        if not self._dirty:
+            return
+        self._flush(self.text)
+        self._dirty = False
+        self._last_flush = time.monotonic()
+
+    @property
+    def text(self) -> str:
+        lines = list(self._lines)
+        if self._dropped:
+            lines.insert(0, f"[{self._dropped} earlier events omitted]")
+        return "\n".join(lines)
+
+    def _append(self, line: str) -> None:
+        line_size = len(line.encode("utf-8")) + 1
+        if line_size > self.max_bytes:
+            # Keep the tail of an oversized event rather than dropping the whole buffer for it.
+            line = line.encode("utf-8")[-(self.max_bytes - 1) :].decode("utf-8", errors="ignore")
+            line_size = len(line.encode("utf-8")) + 1
+        self._lines.append(line)
+        self._size += line_size
+        self._dirty = True
+        while len(self._lines) > self.max_events or self._size > self.max_bytes:
+            self._size -= len(self._lines.popleft().encode("utf-8")) + 1
+            self._dropped += 1
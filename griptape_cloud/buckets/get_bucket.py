@@ -2,6 +2,8 @@ import logging
 from typing import Any
 
 from base.base_griptape_cloud_node import BaseGriptapeCloudNode
+from base.griptape_cloud_options import is_headless, use_lazy_options
+from base.indexed_choices import IndexedChoices
 from buckets.bucket_options import BucketOptions
 from griptape_nodes.exe_types.core_types import Parameter, ParameterMode
 from griptape_nodes.exe_types.node_types import DataNode
@@ -14,8 +16,15 @@ class GetBucket(BaseGriptapeCloudNode, DataNode):
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
 
-        self.buckets = self._list_buckets().buckets
-        self.choices = list(map(BucketOptions._bucket_to_name_and_id, self.buckets))
+        # In lazy mode, only a listing that is already cached is used; otherwise the choices are loaded in the
+        # background, or when the node is validated or run if it runs headless, so the node can be built from its
+        # saved ID without a network round trip.
+        self.lazy_options = use_lazy_options()
+        if self.lazy_options:
+            self.bucket_choices = self._peek_cached_listing("buckets") or IndexedChoices()
+        else:
+            self.bucket_choices = self._get_bucket_choices_cached()
+        self.choices_loaded = bool(self.bucket_choices) or not self.lazy_options
 
         self.add_parameter(
             Parameter(
@@ -23,13 +32,8 @@ class GetBucket(BaseGriptapeCloudNode, DataNode):
                 input_types=["str"],
                 output_type="str",
                 type="str",
-                default_value=self.buckets[0].bucket_id if self.buckets else None,
-                traits={
-                    BucketOptions(
-                        choices=self.choices,
-                        choices_value_lookup={BucketOptions._bucket_to_name_and_id(b): b for b in self.buckets},
-                    )
-                },
+                default_value=self.bucket_choices.first_id(),
+                traits={BucketOptions(indexed_choices=self.bucket_choices)},
                 tooltip="The ID of the bucket",
                 allowed_modes={ParameterMode.INPUT, ParameterMode.PROPERTY, ParameterMode.OUTPUT},
             )
@@ -59,13 +63,20 @@ class GetBucket(BaseGriptapeCloudNode, DataNode):
             )
         )
 
+        if not self.choices_loaded and not is_headless():
+            # Fill the dropdown as soon as the listing arrives rather than on the first run.
+            self._load_choices_in_background(self._resolve_bucket)
+
     def validate_before_workflow_run(self) -> list[Exception] | None:
         exceptions = super().validate_before_workflow_run() or []
 
         try:
-            if not self.get_parameter_value("bucket_id"):
+            bucket_id = self.get_parameter_value("bucket_id")
+            if not bucket_id:
                 msg = "Bucket ID is not set. Configure the Node with a valid Griptape Cloud Bucket ID before running."
                 exceptions.append(ValueError(msg))
+            else:
+                self._resolve_bucket()
 
         except Exception as e:
             exceptions.append(e)
@@ -76,16 +87,39 @@ class GetBucket(BaseGriptapeCloudNode, DataNode):
         self, parameter: Parameter, value: Any, modified_parameters_set: set[str] | None = None
     ) -> None:
         if parameter.name == "bucket_id" and value is not None:
-            bucket = next((b for b in self.buckets if b.bucket_id == value), None)
-            if bucket is None:
-                msg = f"Bucket with ID '{value}' not found."
-                logger.error(msg)
-                raise ValueError(msg)
-            self.set_parameter_value("bucket", bucket)
-            self.set_parameter_value("name", bucket.name)
+            if not self.choices_loaded:
+                # Resolved once the choices are loaded.
+                return
+            self._set_bucket(value)
             if modified_parameters_set is not None:
                 modified_parameters_set.add("bucket")
                 modified_parameters_set.add("name")
 
+    def _set_bucket(self, bucket_id: str) -> None:
+        bucket = self.bucket_choices.by_id.get(bucket_id)
+        if bucket is None:
+            msg = f"Bucket with ID '{bucket_id}' not found."
+            logger.error(msg)
+            raise ValueError(msg)
+        self.set_parameter_value("bucket", bucket)
+        self.set_parameter_value("name", bucket.name)
+
+    def _load_bucket_choices(self) -> None:
+        self.bucket_choices = self._get_bucket_choices_cached()
+        parameter = self.get_parameter_by_name("bucket_id")
+        if parameter is not None:
+            for trait in parameter.find_elements_by_type(BucketOptions):
+                trait.set_indexed_choices(self.bucket_choices)
+        self.choices_loaded = True
+
+    def _resolve_bucket(self) -> None:
+        """Loads the choices if they are not loaded yet, and sets the bucket if it was selected before they were."""
+        if not self.choices_loaded:
+            self._load_bucket_choices()
+        bucket = self.get_parameter_value("bucket")
+        bucket_id = self.get_parameter_value("bucket_id")
+        if bucket is None or bucket.bucket_id != bucket_id:
+            self._set_bucket(bucket_id)
+
     def process(self) -> None:
-        pass
+        self._resolve_bucket()
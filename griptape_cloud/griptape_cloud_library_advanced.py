@@ -33,6 +33,11 @@ class GriptapeCloudLibraryAdvanced(AdvancedNodeLibrary):
         msg = f"Starting to load nodes for '{library_data.name}' library..."
         logger.info(msg)
 
+        # Release pooled connections held over from a previous load of this library.
+        from base.griptape_cloud_client_registry import GriptapeCloudClientRegistry
+
+        GriptapeCloudClientRegistry.close_all()
+
     def after_library_nodes_loaded(self, library_data: LibrarySchema, library: Library) -> None:  # noqa: ARG002
         """Called after all nodes have been loaded from the library."""
         GriptapeNodes.LibraryManager().on_register_event_handler(
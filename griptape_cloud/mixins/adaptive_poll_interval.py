@@ -0,0 +1,45 @@
+from dataclasses import dataclass, field
+
+from base.griptape_cloud_settings import get_float_setting
+
+DEFAULT_MIN_POLL_INTERVAL = 0.1
+DEFAULT_MAX_POLL_INTERVAL = 2.0
+DEFAULT_POLL_BACKOFF_MULTIPLIER = 1.5
+
+
+@dataclass
+class AdaptivePollInterval:
+    """Poll interval that backs off exponentially while a run is idle and resets once events arrive.
+
+    Active runs are polled at the fast interval so short runs finish without a fixed wait, while quiet stretches
+    of long runs are polled progressively less often.
+    """
+
+    min_interval: float = DEFAULT_MIN_POLL_INTERVAL
+    max_interval: float = DEFAULT_MAX_POLL_INTERVAL
+    multiplier: float = DEFAULT_POLL_BACKOFF_MULTIPLIER
+    _current: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        self._current = self.min_interval
+
+    @classmethod
+    def from_settings(cls) -> "AdaptivePollInterval":
+        return cls(
+            max_interval=get_float_setting("GT_CLOUD_EVENT_POLL_MAX_INTERVAL", DEFAULT_MAX_POLL_INTERVAL),
+        )
+
+    @property
+    def current(self) -> float:
+        return self._current
+
+    def reset(self) -> None:
+        self._current = self.min_interval
+
+    def next_interval(self, *, received_events: bool) -> float:
+        """Returns the delay before the next poll, given whether the last poll returned any events."""
+        if received_events:
+            self.reset()
+        else:
+            self._current = min(self._current * self.multiplier, self.max_interval)
+        return self._current
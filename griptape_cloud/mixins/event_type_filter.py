@@ -0,0 +1,37 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class EventTypeFilter:
+    """Include/exclude filter on the `type_` of run events.
+
+    The events endpoints have no type filter, so every event is still fetched and the filter is applied to each page
+    as it is returned. It saves the work of handling the filtered events, not the transfer.
+    """
+
+    include_types: frozenset[str] | None = None
+    exclude_types: frozenset[str] = frozenset()
+
+    @classmethod
+    def create(
+        cls, include_types: Iterable[str] | None = None, exclude_types: Iterable[str] | None = None
+    ) -> "EventTypeFilter":
+        return cls(
+            include_types=frozenset(include_types) if include_types is not None else None,
+            exclude_types=frozenset(exclude_types or ()),
+        )
+
+    def __bool__(self) -> bool:
+        return self.include_types is not None or bool(self.exclude_types)
+
+    def allows(self, event_type: str) -> bool:
+        if self.include_types is not None and event_type not in self.include_types:
+            return False
+        return event_type not in self.exclude_types
+
+    def apply(self, events: list[Any]) -> list[Any]:
+        if not self:
+            return events
+        return [event for event in events if self.allows(event.type_)]
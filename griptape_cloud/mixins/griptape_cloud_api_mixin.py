@@ -1,10 +1,34 @@
+import contextvars
+import hashlib
 import logging
+import queue
+import shutil
+import tempfile
+import threading
 import time
-from collections.abc import Generator
-from typing import TYPE_CHECKING
+from collections import deque
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
+import httpx
+from assets.asset_download_cache import AssetDownloadCache
+from assets.asset_hash_index import AssetHashEntry, AssetHashIndex
+from assets.asset_url_cache import AssetUrlCache, AssetUrlCacheKey
+from assets.batch_upload import FAILED, SKIPPED, UPLOADED, BatchUploadFileResult
+from assets.multipart_uploader import MultipartUploader, UploadResult
+from assets.ranged_downloader import RangedDownloader
+from base.constants import HASH_ALGORITHM
+from base.griptape_cloud_listing_cache import GriptapeCloudListingCache, ListingCacheKey
+from base.griptape_cloud_settings import get_int_setting
+from base.indexed_choices import IndexedChoices
+from base.instrumentation import GriptapeCloudInstrumentation
 from griptape_cloud_client.api.assets.create_asset import sync as create_asset
 from griptape_cloud_client.api.assets.create_asset_url import sync as create_asset_url
+from griptape_cloud_client.api.assets.delete_asset import sync as delete_asset
+from griptape_cloud_client.api.assets.get_asset import sync as get_asset
 from griptape_cloud_client.api.assistant_runs.create_assistant_run import sync as create_assistant_run
 from griptape_cloud_client.api.assistant_runs.get_assistant_run import sync as get_assistant_run
 from griptape_cloud_client.api.assistants.list_assistants import sync as list_assistants
@@ -19,6 +43,7 @@ from griptape_cloud_client.api.events.list_assistant_events import sync as list_
 from griptape_cloud_client.api.events.list_events import sync as list_events
 from griptape_cloud_client.api.structure_runs.create_structure_run import sync as create_structure_run
 from griptape_cloud_client.api.structure_runs.get_structure_run import sync as get_structure_run
+from griptape_cloud_client.api.structures.get_structure import sync_detailed as get_structure_detailed
 from griptape_cloud_client.api.structures.list_structures import sync as list_structures
 from griptape_cloud_client.models.assert_url_operation import AssertUrlOperation
 from griptape_cloud_client.models.assistant_event_detail import AssistantEventDetail
@@ -44,11 +69,13 @@ from griptape_cloud_client.models.create_structure_run_response_content import (
 )
 from griptape_cloud_client.models.deployment_status import DeploymentStatus
 from griptape_cloud_client.models.event_detail import EventDetail
+from griptape_cloud_client.models.get_asset_response_content import GetAssetResponseContent
 from griptape_cloud_client.models.get_assistant_run_response_content import (
     GetAssistantRunResponseContent,
 )
 from griptape_cloud_client.models.get_bucket_response_content import GetBucketResponseContent
 from griptape_cloud_client.models.get_deployment_response_content import GetDeploymentResponseContent
+from griptape_cloud_client.models.get_structure_response_content import GetStructureResponseContent
 from griptape_cloud_client.models.get_structure_run_response_content import (
     GetStructureRunResponseContent,
 )
@@ -68,19 +95,91 @@ from griptape_cloud_client.models.structure_deployment_detail import StructureDe
 from griptape_cloud_client.models.structure_run_status import StructureRunStatus
 from griptape_cloud_client.models.update_bucket_request_content import UpdateBucketRequestContent
 from griptape_cloud_client.models.update_bucket_response_content import UpdateBucketResponseContent
-from griptape_cloud_client.types import UNSET
+from griptape_cloud_client.types import UNSET, Unset
+from mixins.adaptive_poll_interval import AdaptivePollInterval
+from mixins.event_type_filter import EventTypeFilter
+from mixins.run_event_poller import (
+    ASSISTANT_RUN_COMPLETED_EVENT_TYPE,
+    RUN_TERMINAL_STATUSES,
+    STRUCTURE_RUN_COMPLETED_EVENT_TYPE,
+    RunEventPoller,
+    RunEventSubscription,
+)
+from mixins.structure_run_batch import RUN_FAILED, RUN_SUCCEEDED, StructureRunBatchResult
 
 if TYPE_CHECKING:
     from griptape_cloud_client.client import AuthenticatedClient
+    from griptape_cloud_client.models.assistant_detail import AssistantDetail
+    from griptape_cloud_client.models.bucket_detail import BucketDetail
+    from griptape_cloud_client.models.structure_detail import StructureDetail
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_MAX_CONCURRENT_PAGES = 4
+DEFAULT_BATCH_UPLOAD_MAX_WORKERS = 8
+DEFAULT_STRUCTURE_RUN_MAX_IN_FLIGHT = 16
+DEFAULT_MAX_CONCURRENT_SUBMISSIONS = 8
+DEFAULT_RUN_STATUS_POLL_MAX_INTERVAL = 10.0
+
 
 class GriptapeCloudApiMixin:
     """Mixin class providing shared Griptape Cloud API functionality."""
 
     gtc_client: "AuthenticatedClient"
 
+    def _get_listing_cache_key(self, resource: str) -> ListingCacheKey:
+        return GriptapeCloudListingCache.make_key(
+            base_url=self.gtc_client._base_url, api_key=self.gtc_client.token, resource=resource
+        )
+
+    def _get_cached_listing(self, resource: str, loader: Callable[[], Any]) -> Any:
+        return GriptapeCloudListingCache.get(self._get_listing_cache_key(resource), loader)
+
+    def _peek_cached_listing(self, resource: str) -> Any | None:
+        return GriptapeCloudListingCache.peek(self._get_listing_cache_key(resource))
+
+    def _invalidate_cached_listing(self, resource: str) -> None:
+        GriptapeCloudListingCache.invalidate(self._get_listing_cache_key(resource))
+
+    def _iter_paginated_listing(
+        self, list_page: Callable[..., Any], get_items: Callable[[Any], list]
+    ) -> Generator[Any, None, None]:
+        """Lazily yields every item of a paginated listing.
+
+        The first page is yielded as soon as it arrives. Once the page count is known, the remaining pages are
+        fetched concurrently through a bounded window and yielded in order, so memory stays bounded by the window
+        rather than the size of the listing.
+        """
+        page_size = DEFAULT_PAGE_SIZE
+        max_concurrent_pages = DEFAULT_MAX_CONCURRENT_PAGES
+
+        first_page = list_page(page=1, page_size=page_size)
+        yield from get_items(first_page)
+
+        pagination = first_page.pagination
+        total_pages = 1 if isinstance(pagination, Unset) or pagination is None else pagination.total_pages
+        if total_pages <= 1:
+            return
+
+        pending: deque[Future] = deque()
+        next_page = 2
+        with ThreadPoolExecutor(max_workers=max_concurrent_pages) as executor:
+            try:
+                while next_page <= total_pages or pending:
+                    while next_page <= total_pages and len(pending) < max_concurrent_pages:
+                        # Pages keep the caller's rate limiter priority, so a background refresh stays in the back.
+                        pending.append(
+                            executor.submit(
+                                contextvars.copy_context().run, list_page, page=next_page, page_size=page_size
+                            )
+                        )
+                        next_page += 1
+                    yield from get_items(pending.popleft().result())
+            finally:
+                for future in pending:
+                    future.cancel()
+
     def _get_deployment(self, deployment_id: str) -> GetDeploymentResponseContent:
         try:
             response = get_deployment(
@@ -114,30 +213,35 @@ class GriptapeCloudApiMixin:
             raise
 
     def _wait_for_structure_deployment(self, deployment_id: str, timeout: float = 60.0) -> GetDeploymentResponseContent:
-        try:
-            start_time = time.time()
-            while True:
-                response = self._get_deployment(deployment_id=deployment_id)
-                if isinstance(response, GetDeploymentResponseContent):
-                    # Check if deployment is in a terminal state
-                    if response.status in [DeploymentStatus.ERROR, DeploymentStatus.FAILED, DeploymentStatus.SUCCEEDED]:
-                        return response
-
-                    # Check timeout
-                    if time.time() - start_time > timeout:
-                        msg = f"Timeout waiting for deployment {deployment_id} to reach terminal state"
-                        logger.error(msg)
-                        raise TimeoutError(msg)  # noqa: TRY301
+        with GriptapeCloudInstrumentation.phase("deployment.wait", deployment_id=deployment_id):
+            try:
+                start_time = time.time()
+                while True:
+                    response = self._get_deployment(deployment_id=deployment_id)
+                    if isinstance(response, GetDeploymentResponseContent):
+                        # Check if deployment is in a terminal state
+                        if response.status in [
+                            DeploymentStatus.ERROR,
+                            DeploymentStatus.FAILED,
+                            DeploymentStatus.SUCCEEDED,
+                        ]:
+                            return response
 
-                    # Wait before next check
-                    time.sleep(1.0)
-                else:
-                    msg = f"Unexpected response type: {type(response)}"
-                    logger.error(msg)
-                    raise TypeError(msg)  # noqa: TRY301
-        except Exception as e:
-            logger.error("Error waiting for structure deployment: %s", e)
-            raise
+                        # Check timeout
+                        if time.time() - start_time > timeout:
+                            msg = f"Timeout waiting for deployment {deployment_id} to reach terminal state"
+                            logger.error(msg)
+                            raise TimeoutError(msg)  # noqa: TRY301
+
+                        # Wait before next check
+                        time.sleep(1.0)
+                    else:
+                        msg = f"Unexpected response type: {type(response)}"
+                        logger.error(msg)
+                        raise TypeError(msg)  # noqa: TRY301
+            except Exception as e:
+                logger.error("Error waiting for structure deployment: %s", e)
+                raise
 
     def _wait_for_latest_structure_deployment(
         self, structure_id: str, timeout: float = 300.0
@@ -156,12 +260,12 @@ class GriptapeCloudApiMixin:
             logger.error("Error waiting for latest structure deployment: %s", e)
             raise
 
-    def _list_buckets(self) -> ListBucketsResponseContent:
+    def _list_buckets(self, page: int = 1, page_size: int = DEFAULT_PAGE_SIZE) -> ListBucketsResponseContent:
         try:
             response = list_buckets(
                 client=self.gtc_client,
-                page=1,
-                page_size=100,
+                page=page,
+                page_size=page_size,
             )
             if isinstance(response, ListBucketsResponseContent):
                 return response
@@ -172,6 +276,14 @@ class GriptapeCloudApiMixin:
             logger.error("Error listing buckets: %s", e)
             raise
 
+    def _get_bucket_choices_cached(self) -> IndexedChoices:
+        return self._get_cached_listing(
+            "buckets", lambda: IndexedChoices.from_details(list(self._iter_buckets()), id_attr="bucket_id")
+        )
+
+    def _iter_buckets(self) -> Generator["BucketDetail", None, None]:
+        yield from self._iter_paginated_listing(self._list_buckets, lambda response: response.buckets)
+
     def _get_bucket(self, bucket_id: str) -> GetBucketResponseContent:
         try:
             response = get_bucket(bucket_id=bucket_id, client=self.gtc_client)
@@ -190,6 +302,7 @@ class GriptapeCloudApiMixin:
                 body=CreateBucketRequestContent(name=name),
                 client=self.gtc_client,
             )
+            self._invalidate_cached_listing("buckets")
             if isinstance(response, CreateBucketResponseContent):
                 return response
             msg = f"Unexpected response type: {type(response)}"
@@ -206,6 +319,7 @@ class GriptapeCloudApiMixin:
                 body=UpdateBucketRequestContent(name=name),
                 client=self.gtc_client,
             )
+            self._invalidate_cached_listing("buckets")
             if isinstance(response, UpdateBucketResponseContent):
                 return response
             msg = f"Unexpected response type: {type(response)}"
@@ -218,16 +332,18 @@ class GriptapeCloudApiMixin:
     def _delete_bucket(self, bucket_id: str) -> None:
         try:
             delete_bucket(bucket_id=bucket_id, client=self.gtc_client)
+            AssetUrlCache.invalidate(bucket_id=bucket_id)
+            self._invalidate_cached_listing("buckets")
         except Exception as e:
             logger.error("Error deleting bucket: %s", e)
             raise
 
-    def _list_assistants(self) -> ListAssistantsResponseContent:
+    def _list_assistants(self, page: int = 1, page_size: int = DEFAULT_PAGE_SIZE) -> ListAssistantsResponseContent:
         try:
             response = list_assistants(
                 client=self.gtc_client,
-                page=1,
-                page_size=100,
+                page=page,
+                page_size=page_size,
             )
             if isinstance(response, ListAssistantsResponseContent):
                 return response
@@ -238,6 +354,14 @@ class GriptapeCloudApiMixin:
             logger.error("Error listing assistants: %s", e)
             raise
 
+    def _get_assistant_choices_cached(self) -> IndexedChoices:
+        return self._get_cached_listing(
+            "assistants", lambda: IndexedChoices.from_details(list(self._iter_assistants()), id_attr="assistant_id")
+        )
+
+    def _iter_assistants(self) -> Generator["AssistantDetail", None, None]:
+        yield from self._iter_paginated_listing(self._list_assistants, lambda response: response.assistants)
+
     def _get_assistant_run(self, assistant_run_id: str) -> GetAssistantRunResponseContent:
         try:
             response = get_assistant_run(assistant_run_id=assistant_run_id, client=self.gtc_client)
@@ -269,8 +393,9 @@ class GriptapeCloudApiMixin:
             raise
 
     def _list_assistant_run_events(
-        self, assistant_run_id: str, offset: float | None = None
+        self, assistant_run_id: str, offset: float | None = None, event_filter: EventTypeFilter | None = None
     ) -> ListAssistantEventsResponseContent:
+        event_filter = event_filter or EventTypeFilter()
         try:
             response = list_assistant_events(
                 assistant_run_id=assistant_run_id,
@@ -278,6 +403,7 @@ class GriptapeCloudApiMixin:
                 client=self.gtc_client,
             )
             if isinstance(response, ListAssistantEventsResponseContent):
+                response.events = event_filter.apply(response.events)
                 return response
             msg = f"Unexpected response type: {type(response)}"
             logger.error(msg)
@@ -286,18 +412,34 @@ class GriptapeCloudApiMixin:
             logger.error("Error listing events: %s", e)
             raise
 
-    def _poll_assistant_run_events(self, assistant_run_id: str) -> Generator[list[AssistantEventDetail], None, None]:
-        run_completed = False
-        offset: float | None = None
+    def _is_assistant_run_finished(self, assistant_run_id: str) -> bool:
+        assistant_run = self._get_assistant_run(assistant_run_id=assistant_run_id)
+        return str(assistant_run.status) in RUN_TERMINAL_STATUSES
 
-        while not run_completed:
-            list_events_response = self._list_assistant_run_events(assistant_run_id=assistant_run_id, offset=offset)
-            offset = list_events_response.next_offset
-            for event in list_events_response.events:
-                if event.type_ == "FinishStructureRunEvent" and event.origin == "ASSISTANT":
-                    run_completed = True
-            yield list_events_response.events
-            time.sleep(0.5)
+    def _poll_assistant_run_events(
+        self,
+        assistant_run_id: str,
+        include_types: Iterable[str] | None = None,
+        exclude_types: Iterable[str] | None = None,
+    ) -> Generator[list[AssistantEventDetail], None, None]:
+        """Yields batches of the assistant run's events until it finishes, optionally filtered by event type."""
+        event_filter = EventTypeFilter.create(include_types, exclude_types)
+        poller = RunEventPoller.get_instance()
+        subscription = poller.subscribe(
+            run_id=assistant_run_id,
+            fetch=lambda run_id, offset: self._list_assistant_run_events(
+                assistant_run_id=run_id, offset=offset, event_filter=event_filter
+            ),
+            is_completion_event=lambda event: (
+                event.type_ == ASSISTANT_RUN_COMPLETED_EVENT_TYPE and event.origin == "ASSISTANT"
+            ),
+            is_run_finished=self._is_assistant_run_finished if event_filter else None,
+        )
+        with GriptapeCloudInstrumentation.phase("assistant_run.wait", assistant_run_id=assistant_run_id):
+            try:
+                yield from subscription.iter_batches()
+            finally:
+                poller.unsubscribe(subscription)
 
     def _create_asset(
         self,
@@ -321,9 +463,31 @@ class GriptapeCloudApiMixin:
             logger.error("Error creating asset: %s", e)
             raise
 
+    def _get_asset_url_cache_key(
+        self, asset_name: str, bucket_id: str, operation: AssertUrlOperation
+    ) -> AssetUrlCacheKey:
+        return AssetUrlCache.make_key(
+            base_url=self.gtc_client._base_url,
+            api_key=self.gtc_client.token,
+            bucket_id=bucket_id,
+            asset_name=asset_name,
+            operation=str(operation),
+        )
+
     def _create_asset_url(
-        self, asset_name: str, bucket_id: str, operation: AssertUrlOperation = AssertUrlOperation.GET
+        self,
+        asset_name: str,
+        bucket_id: str,
+        operation: AssertUrlOperation = AssertUrlOperation.GET,
+        *,
+        use_cache: bool = True,
     ) -> CreateAssetUrlResponseContent:
+        # Only download URLs are cached. An upload can run past the cache's expiry margin, and a URL that lapses
+        # mid-upload fails the remaining parts with 403s, so every upload gets a freshly signed URL.
+        cacheable = operation == AssertUrlOperation.GET
+        cache_key = self._get_asset_url_cache_key(asset_name, bucket_id, operation)
+        if use_cache and cacheable and (cached_response := AssetUrlCache.get(cache_key)) is not None:
+            return cached_response
         try:
             response = create_asset_url(
                 bucket_id=bucket_id,
@@ -334,6 +498,14 @@ class GriptapeCloudApiMixin:
                 ),
             )
             if isinstance(response, CreateAssetUrlResponseContent):
+                expires_at = getattr(response, "expires_at", None)
+                if cacheable:
+                    AssetUrlCache.put(
+                        cache_key,
+                        response,
+                        url=response.url,
+                        expires_at=expires_at if isinstance(expires_at, datetime) else None,
+                    )
                 return response
             msg = f"Unexpected response type: {type(response)}"
             logger.error(msg)
@@ -342,12 +514,250 @@ class GriptapeCloudApiMixin:
             logger.error("Error creating asset URL: %s", e)
             raise
 
-    def _list_structures(self) -> ListStructuresResponseContent:
+    def _get_asset(self, asset_name: str, bucket_id: str) -> GetAssetResponseContent:
+        try:
+            response = get_asset(
+                bucket_id=bucket_id,
+                name=asset_name,
+                client=self.gtc_client,
+            )
+            if isinstance(response, GetAssetResponseContent):
+                return response
+            msg = f"Unexpected response type: {type(response)}"
+            logger.error(msg)
+            raise TypeError(msg)  # noqa: TRY301
+        except Exception as e:
+            logger.error("Error getting asset: %s", e)
+            raise
+
+    def _delete_asset(self, asset_name: str, bucket_id: str) -> None:
+        try:
+            delete_asset(bucket_id=bucket_id, name=asset_name, client=self.gtc_client)
+            AssetUrlCache.invalidate(bucket_id=bucket_id, asset_name=asset_name)
+            AssetHashIndex.invalidate(AssetHashIndex.make_key(self.gtc_client._base_url, bucket_id, asset_name))
+        except Exception as e:
+            logger.error("Error deleting asset: %s", e)
+            raise
+
+    def _get_remote_asset_version(self, asset_name: str, bucket_id: str) -> str | None:
+        """Returns a value identifying the current version of a remote asset, or None if it cannot be found."""
+        try:
+            asset = self._get_asset(asset_name, bucket_id)
+        except Exception:
+            return None
+        updated_at = getattr(asset, "updated_at", None)
+        return None if updated_at is None or isinstance(updated_at, Unset) else str(updated_at)
+
+    def _is_asset_up_to_date(self, asset_name: str, bucket_id: str, content_hash: str) -> bool:
+        """Returns True if the asset was uploaded from here with the same content and has not changed remotely."""
+        key = AssetHashIndex.make_key(self.gtc_client._base_url, bucket_id, asset_name)
+        entry = AssetHashIndex.get(key)
+        if entry is None or entry.content_hash != content_hash:
+            return False
+        if entry.remote_updated_at is None or self._get_remote_asset_version(asset_name, bucket_id) != (
+            entry.remote_updated_at
+        ):
+            # The asset was changed or deleted by someone else since it was uploaded.
+            AssetHashIndex.invalidate(key)
+            return False
+        return True
+
+    def _find_uploaded_asset(
+        self, bucket_id: str, content_hash: str, name_filter: Callable[[str], bool] | None = None
+    ) -> str | None:
+        """Returns the name of an up-to-date asset in the bucket that has the given content, if there is one.
+
+        Args:
+            bucket_id: The bucket to look in.
+            content_hash: The content to look for.
+            name_filter: Only assets whose name it accepts are considered.
+        """
+        for asset_name in AssetHashIndex.find_by_hash(self.gtc_client._base_url, bucket_id, content_hash):
+            if name_filter is not None and not name_filter(asset_name):
+                continue
+            if self._is_asset_up_to_date(asset_name, bucket_id, content_hash):
+                return asset_name
+        return None
+
+    def _upload_asset_file(
+        self, file_path: Path, asset_name: str, bucket_id: str, *, deduplicate: bool = True
+    ) -> UploadResult | None:
+        """Uploads a file as an asset, skipping the upload if the asset already has the same content.
+
+        Returns:
+            The result of the upload, or None if the upload was skipped.
+        """
+        content_hash = AssetHashIndex.hash_file(file_path)
+        if deduplicate and self._is_asset_up_to_date(asset_name, bucket_id, content_hash):
+            logger.info("Asset %s in bucket %s is unchanged. Skipping upload.", asset_name, bucket_id)
+            return None
+
+        self._create_asset(asset_name=asset_name, bucket_id=bucket_id)
+        upload_url_response = self._create_asset_url(asset_name, bucket_id, AssertUrlOperation.PUT)
+        result = MultipartUploader().upload(
+            file_path=file_path,
+            url=upload_url_response.url,
+            headers=upload_url_response.headers.to_dict() or {},
+            manifest_key=f"{bucket_id}/{asset_name}",
+        )
+
+        self._record_uploaded_asset(asset_name, bucket_id, content_hash, result.bytes_uploaded)
+        return result
+
+    def _upload_asset_stream(self, chunks: Iterable[bytes], asset_name: str, bucket_id: str) -> UploadResult:
+        """Uploads content as an asset while it is being produced, without writing it to disk first.
+
+        The content is hashed as it streams, so later uploads of the same content can be deduplicated against it.
+        """
+        digest = hashlib.new(HASH_ALGORITHM)
+
+        def hash_chunks() -> Iterator[bytes]:
+            for chunk in chunks:
+                digest.update(chunk)
+                yield chunk
+
+        self._create_asset(asset_name=asset_name, bucket_id=bucket_id)
+        upload_url_response = self._create_asset_url(asset_name, bucket_id, AssertUrlOperation.PUT)
+        result = MultipartUploader().upload_stream(
+            hash_chunks(),
+            url=upload_url_response.url,
+            headers=upload_url_response.headers.to_dict() or {},
+            name=asset_name,
+        )
+
+        self._record_uploaded_asset(
+            asset_name, bucket_id, f"{HASH_ALGORITHM}:{digest.hexdigest()}", result.bytes_uploaded
+        )
+        return result
+
+    def _record_uploaded_asset(self, asset_name: str, bucket_id: str, content_hash: str, size: int) -> None:
+        AssetHashIndex.record(
+            AssetHashIndex.make_key(self.gtc_client._base_url, bucket_id, asset_name),
+            AssetHashEntry(
+                content_hash=content_hash,
+                size=size,
+                remote_updated_at=self._get_remote_asset_version(asset_name, bucket_id),
+            ),
+        )
+
+    def _upload_asset_files(
+        self,
+        files: list[tuple[Path, str]],
+        bucket_id: str,
+        max_workers: int | None = None,
+        on_result: Callable[[BatchUploadFileResult], None] | None = None,
+    ) -> list[BatchUploadFileResult]:
+        """Uploads many files as assets through a bounded worker pool.
+
+        Every worker runs the create-asset, create-URL and PUT steps of one file, so the round trips of different
+        files overlap. A failed file does not stop the batch; its error is reported in its result.
+
+        Args:
+            files: (file path, asset name) pairs to upload.
+            bucket_id: The bucket to upload to.
+            max_workers: How many files to upload at once.
+            on_result: Called with each result as soon as its file finishes.
+
+        Returns:
+            One result per file, in the order of `files`.
+        """
+        max_workers = max_workers or get_int_setting(
+            "GT_CLOUD_BATCH_UPLOAD_MAX_WORKERS", DEFAULT_BATCH_UPLOAD_MAX_WORKERS
+        )
+
+        def upload(file_path: Path, asset_name: str) -> BatchUploadFileResult:
+            start_time = time.monotonic()
+            try:
+                upload_result = self._upload_asset_file(file_path, asset_name, bucket_id)
+            except Exception as e:
+                return BatchUploadFileResult(
+                    file_path=str(file_path),
+                    asset_name=asset_name,
+                    status=FAILED,
+                    elapsed_seconds=time.monotonic() - start_time,
+                    error=str(e),
+                )
+            return BatchUploadFileResult(
+                file_path=str(file_path),
+                asset_name=asset_name,
+                status=SKIPPED if upload_result is None else UPLOADED,
+                bytes_uploaded=0 if upload_result is None else upload_result.bytes_uploaded,
+                elapsed_seconds=time.monotonic() - start_time,
+            )
+
+        results: list[BatchUploadFileResult | None] = [None] * len(files)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="griptape-cloud-batch-upload") as executor:
+            futures = {
+                executor.submit(contextvars.copy_context().run, upload, file_path, asset_name): index
+                for index, (file_path, asset_name) in enumerate(files)
+            }
+            for future in as_completed(futures):
+                result = future.result()
+                results[futures[future]] = result
+                if on_result is not None:
+                    on_result(result)
+        # Persist the hashes of the whole batch in one write.
+        AssetHashIndex.flush()
+        return [result for result in results if result is not None]
+
+    def _download_asset_file(
+        self, asset_name: str, bucket_id: str, destination: Path | None = None, *, use_cache: bool = True
+    ) -> Path:
+        """Downloads an asset to disk, serving it from the local download cache while the remote asset is unchanged.
+
+        Args:
+            asset_name: The name of the asset to download.
+            bucket_id: The bucket the asset is in.
+            destination: Where to write the asset. If not set, the path of the cached copy is returned instead.
+            use_cache: Whether to read from and store into the local download cache.
+
+        Returns:
+            The path of the downloaded asset.
+        """
+        key = AssetDownloadCache.make_key(self.gtc_client._base_url, bucket_id, asset_name)
+        remote_version = self._get_remote_asset_version(asset_name, bucket_id) if use_cache else None
+        path = AssetDownloadCache.lookup(key, remote_version) if use_cache else None
+
+        if path is not None:
+            logger.info("Asset %s in bucket %s is cached locally. Skipping download.", asset_name, bucket_id)
+        else:
+            url_response = self._create_asset_url(asset_name, bucket_id, AssertUrlOperation.GET)
+            if use_cache:
+                download_path = AssetDownloadCache.temp_path()
+            else:
+                download_path = destination or Path(tempfile.mkdtemp()) / Path(asset_name).name
+
+            def refresh_url() -> tuple[str, dict[str, str]]:
+                # The cached URL was rejected, most likely because it expired early, so it must not be handed out again.
+                AssetUrlCache.invalidate(bucket_id=bucket_id, asset_name=asset_name)
+                response = self._create_asset_url(asset_name, bucket_id, AssertUrlOperation.GET, use_cache=False)
+                return response.url, response.headers.to_dict() or {}
+
+            result = RangedDownloader().download(
+                url=url_response.url,
+                destination=download_path,
+                headers=url_response.headers.to_dict() or {},
+                refresh_url=refresh_url,
+            )
+            path = (
+                AssetDownloadCache.store(key, result.path, result.content_hash, remote_version)
+                if use_cache
+                else result.path
+            )
+
+        if destination is None or destination == path:
+            return path
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        # Copy rather than link, so that editing the downloaded file never corrupts the cached copy.
+        shutil.copyfile(path, destination)
+        return destination
+
+    def _list_structures(self, page: int = 1, page_size: int = DEFAULT_PAGE_SIZE) -> ListStructuresResponseContent:
         try:
             response = list_structures(
                 client=self.gtc_client,
-                page=1,
-                page_size=100,
+                page=page,
+                page_size=page_size,
             )
             if isinstance(response, ListStructuresResponseContent):
                 return response
@@ -358,6 +768,29 @@ class GriptapeCloudApiMixin:
             logger.error("Error listing structures: %s", e)
             raise
 
+    def _find_structure(self, structure_id: str) -> GetStructureResponseContent | None:
+        """Returns the structure, or None if it does not exist."""
+        try:
+            response = get_structure_detailed(structure_id=structure_id, client=self.gtc_client)
+            if response.status_code == httpx.codes.NOT_FOUND:
+                return None
+            if isinstance(response.parsed, GetStructureResponseContent):
+                return response.parsed
+            msg = f"Unexpected response when getting structure: {response.status_code} {type(response.parsed)}"
+            logger.error(msg)
+            raise TypeError(msg)  # noqa: TRY301
+        except Exception as e:
+            logger.error("Error getting structure: %s", e)
+            raise
+
+    def _get_structure_choices_cached(self) -> IndexedChoices:
+        return self._get_cached_listing(
+            "structures", lambda: IndexedChoices.from_details(list(self._iter_structures()), id_attr="structure_id")
+        )
+
+    def _iter_structures(self) -> Generator["StructureDetail", None, None]:
+        yield from self._iter_paginated_listing(self._list_structures, lambda response: response.structures)
+
     def _create_structure_run(self, structure_id: str, args: list[str]) -> CreateStructureRunResponseContent:
         try:
             response = create_structure_run(
@@ -391,9 +824,52 @@ class GriptapeCloudApiMixin:
     def _get_structure_run_bad_statuses(self) -> list[str]:
         return [StructureRunStatus.FAILED, StructureRunStatus.CANCELLED, StructureRunStatus.ERROR]
 
+    def _get_structure_run_terminal_statuses(self) -> list[str]:
+        return [StructureRunStatus.SUCCEEDED, *self._get_structure_run_bad_statuses()]
+
+    def _wait_for_structure_runs(
+        self, structure_run_ids: list[str], timeout: float | None = None
+    ) -> list[GetStructureRunResponseContent]:
+        """Waits for structure runs submitted earlier to reach a terminal status.
+
+        Unfinished runs are polled by status, backing off while none of them changes and polling quickly again as
+        soon as one finishes.
+
+        Returns:
+            The final state of each run, in the order of `structure_run_ids`.
+        """
+        with GriptapeCloudInstrumentation.phase("structure_run.wait", runs=len(structure_run_ids)):
+            try:
+                start_time = time.monotonic()
+                terminal_statuses = self._get_structure_run_terminal_statuses()
+                poll_interval = AdaptivePollInterval(max_interval=DEFAULT_RUN_STATUS_POLL_MAX_INTERVAL)
+                finished: dict[str, GetStructureRunResponseContent] = {}
+                while True:
+                    finished_any = False
+                    for structure_run_id in dict.fromkeys(structure_run_ids):
+                        if structure_run_id in finished:
+                            continue
+                        structure_run = self._get_structure_run(structure_run_id=structure_run_id)
+                        if structure_run.status in terminal_statuses:
+                            finished[structure_run_id] = structure_run
+                            finished_any = True
+                    if len(finished) == len(set(structure_run_ids)):
+                        return [finished[structure_run_id] for structure_run_id in structure_run_ids]
+
+                    if timeout is not None and time.monotonic() - start_time > timeout:
+                        msg = f"Timeout waiting for {len(set(structure_run_ids)) - len(finished)} structure run(s) to finish"
+                        logger.error(msg)
+                        raise TimeoutError(msg)  # noqa: TRY301
+
+                    time.sleep(poll_interval.next_interval(received_events=finished_any))
+            except Exception as e:
+                logger.error("Error waiting for structure runs: %s", e)
+                raise
+
     def _list_structure_run_events(
-        self, structure_run_id: str, offset: float | None = None
+        self, structure_run_id: str, offset: float | None = None, event_filter: EventTypeFilter | None = None
     ) -> ListEventsResponseContent:
+        event_filter = event_filter or EventTypeFilter()
         try:
             response = list_events(
                 structure_run_id=structure_run_id,
@@ -401,6 +877,7 @@ class GriptapeCloudApiMixin:
                 client=self.gtc_client,
             )
             if isinstance(response, ListEventsResponseContent):
+                response.events = event_filter.apply(response.events)
                 return response
             msg = f"Unexpected response type: {type(response)}"
             logger.error(msg)
@@ -409,20 +886,189 @@ class GriptapeCloudApiMixin:
             logger.error("Error listing events: %s", e)
             raise
 
-    def _poll_structure_run_events(self, structure_run_id: str) -> Generator[list[EventDetail], None, None]:
-        run_completed = False
-        offset: float | None = None
+    def _is_structure_run_finished(self, structure_run_id: str) -> bool:
+        structure_run = self._get_structure_run(structure_run_id=structure_run_id)
+        return structure_run.status in self._get_structure_run_terminal_statuses()
+
+    def _subscribe_to_structure_run(
+        self, structure_run_id: str, event_filter: EventTypeFilter | None = None, **kwargs
+    ) -> RunEventSubscription:
+        event_filter = event_filter or EventTypeFilter()
+        return RunEventPoller.get_instance().subscribe(
+            run_id=structure_run_id,
+            fetch=lambda run_id, offset: self._list_structure_run_events(
+                structure_run_id=run_id, offset=offset, event_filter=event_filter
+            ),
+            is_completion_event=lambda event: (
+                event.type_ == STRUCTURE_RUN_COMPLETED_EVENT_TYPE and event.origin == "SYSTEM"
+            ),
+            is_run_finished=self._is_structure_run_finished if event_filter else None,
+            **kwargs,
+        )
+
+    def _poll_structure_run_events(
+        self,
+        structure_run_id: str,
+        include_types: Iterable[str] | None = None,
+        exclude_types: Iterable[str] | None = None,
+    ) -> Generator[list[EventDetail], None, None]:
+        """Yields batches of the structure run's events until it finishes, optionally filtered by event type."""
+        subscription = self._subscribe_to_structure_run(
+            structure_run_id, event_filter=EventTypeFilter.create(include_types, exclude_types)
+        )
+        with GriptapeCloudInstrumentation.phase("structure_run.wait", structure_run_id=structure_run_id):
+            try:
+                yield from subscription.iter_batches()
+            finally:
+                RunEventPoller.get_instance().unsubscribe(subscription)
+
+    def _run_structure_batch(  # noqa: C901, PLR0915
+        self,
+        structure_id: str,
+        args_list: list[list[str]],
+        max_in_flight: int | None = None,
+        on_result: Callable[[StructureRunBatchResult], None] | None = None,
+        timeout: float | None = None,
+    ) -> list[StructureRunBatchResult]:
+        """Runs a structure once per argument list, keeping up to `max_in_flight` runs going at once.
+
+        Runs are submitted concurrently and tracked together through the shared run event poller, so a batch takes
+        about as long as its slowest runs rather than the sum of all of them. A failed run does not stop the batch;
+        its error is reported in its result.
+
+        Args:
+            structure_id: The structure to run.
+            args_list: The arguments of each run.
+            max_in_flight: How many runs may be submitted and not yet finished at once.
+            on_result: Called with each result as soon as its run finishes.
+            timeout: How many seconds to wait for the whole batch. Runs that have not finished by then are reported
+                as failed and are no longer tracked, and runs not yet submitted are not submitted. Timed-out runs are
+                not cancelled on Griptape Cloud; they keep running, and the IDs of those already created are in
+                their results. None waits indefinitely.
+
+        Returns:
+            One result per argument list, in submission order.
+        """
+        max_in_flight = max_in_flight or get_int_setting(
+            "GT_CLOUD_STRUCTURE_RUN_MAX_IN_FLIGHT", DEFAULT_STRUCTURE_RUN_MAX_IN_FLIGHT
+        )
+        deadline = time.monotonic() + timeout if timeout else None
+        bad_statuses = self._get_structure_run_bad_statuses()
+        results: list[StructureRunBatchResult | None] = [None] * len(args_list)
+        start_times: dict[int, float] = {}
+        structure_run_ids: dict[int, str] = {}
+        subscriptions: dict[int, RunEventSubscription] = {}
+        # Set once the batch stops waiting. Submissions still in flight by then must not start tracking their runs.
+        cancelled = False
+        subscriptions_lock = threading.Lock()
+        # Completed runs and finished results are both reported back to this thread through one queue. Both
+        # callbacks below always put a message on it, so the loop never waits on a run that can no longer report.
+        messages: queue.Queue[tuple[int, str | None, Exception | None] | StructureRunBatchResult] = queue.Queue()
 
-        while not run_completed:
-            list_events_response = self._list_structure_run_events(structure_run_id=structure_run_id, offset=offset)
-            offset = list_events_response.next_offset
-            for event in list_events_response.events:
-                if event.type_ == "StructureRunCompleted" and event.origin == "SYSTEM":
-                    run_completed = True
-            yield list_events_response.events
-            time.sleep(0.5)
+        def submit(index: int, args: list[str]) -> None:
+            try:
+                structure_run = self._create_structure_run(structure_id=structure_id, args=args)
+                structure_run_ids[index] = structure_run.structure_run_id
+                with subscriptions_lock:
+                    if cancelled:
+                        logger.warning(
+                            "Structure run %s was created after its batch stopped waiting. It will not be tracked.",
+                            structure_run.structure_run_id,
+                        )
+                        return
+                    subscriptions[index] = self._subscribe_to_structure_run(
+                        structure_run.structure_run_id,
+                        # Only completion matters here, so skip every other event where the server supports it.
+                        event_filter=EventTypeFilter.create(include_types=[STRUCTURE_RUN_COMPLETED_EVENT_TYPE]),
+                        keep_events=False,
+                        on_finished=lambda subscription: messages.put((index, subscription.run_id, subscription.error)),
+                    )
+            except Exception as e:
+                logger.error("Error submitting run %d of structure %s: %s", index, structure_id, e)
+                messages.put((index, structure_run_ids.get(index), e))
+
+        def create_result(index: int, structure_run_id: str | None, error: str | None) -> StructureRunBatchResult:
+            return StructureRunBatchResult(
+                index=index,
+                args=args_list[index],
+                status=RUN_FAILED,
+                structure_run_id=structure_run_id,
+                error=error,
+                elapsed_seconds=time.monotonic() - start_times.get(index, time.monotonic()),
+            )
+
+        def finalize(index: int, structure_run_id: str | None, error: Exception | None) -> None:
+            try:
+                result = create_result(index, structure_run_id, None)
+                if error is not None or structure_run_id is None:
+                    result.error = str(error)
+                else:
+                    structure_run = self._get_structure_run(structure_run_id=structure_run_id)
+                    result.run_status = str(structure_run.status)
+                    result.output = structure_run.output if not isinstance(structure_run.output, Unset) else None
+                    if structure_run.status in bad_statuses:
+                        result.error = f"Structure run finished with status {structure_run.status}"
+                    else:
+                        result.status = RUN_SUCCEEDED
+            except Exception as e:
+                result = create_result(index, structure_run_id, str(e))
+            messages.put(result)
+
+        pending = deque(enumerate(args_list))
+        in_flight = 0
+        remaining = len(args_list)
+        executor = ThreadPoolExecutor(
+            max_workers=min(max_in_flight, DEFAULT_MAX_CONCURRENT_SUBMISSIONS),
+            thread_name_prefix="griptape-cloud-structure-run-batch",
+        )
+        try:
+            while remaining:
+                while pending and in_flight < max_in_flight:
+                    index, args = pending.popleft()
+                    start_times[index] = time.monotonic()
+                    executor.submit(contextvars.copy_context().run, submit, index, args)
+                    in_flight += 1
+
+                try:
+                    message = messages.get(timeout=None if deadline is None else max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    logger.error("Timed out waiting for %d runs of structure %s", remaining, structure_id)
+                    for index in [index for index, result in enumerate(results) if result is None]:
+                        timed_out = create_result(
+                            index, structure_run_ids.get(index), f"Timed out after {timeout} seconds"
+                        )
+                        results[index] = timed_out
+                        if on_result is not None:
+                            on_result(timed_out)
+                    break
+
+                if isinstance(message, StructureRunBatchResult):
+                    results[message.index] = message
+                    remaining -= 1
+                    if on_result is not None:
+                        on_result(message)
+                else:
+                    in_flight -= 1
+                    executor.submit(contextvars.copy_context().run, finalize, *message)
+        finally:
+            # Stop tracking runs that are still going when the batch times out or its caller fails.
+            with subscriptions_lock:
+                cancelled = True
+                unfinished = list(subscriptions.values())
+            for subscription in unfinished:
+                RunEventPoller.get_instance().unsubscribe(subscription)
+            executor.shutdown(wait=deadline is None or time.monotonic() < deadline, cancel_futures=True)
+
+        return [result for result in results if result is not None]
 
     def _is_deployment_ready(self, deployment: GetDeploymentResponseContent | StructureDeploymentDetail) -> bool:
         return deployment.status in [
             DeploymentStatus.SUCCEEDED,
         ]
+
+
+class GriptapeCloudApi(GriptapeCloudApiMixin):
+    """GriptapeCloudApiMixin bound to a client, for callers that are not Griptape Cloud nodes themselves."""
+
+    def __init__(self, gtc_client: "AuthenticatedClient") -> None:
+        self.gtc_client = gtc_client
@@ -0,0 +1,765 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from assets.asset_url_cache import AssetUrlCache, AssetUrlCacheKey
+from assets.batch_upload import BatchUploadFileResult
+from assets.multipart_uploader import UploadResult
+from base.griptape_cloud_listing_cache import GriptapeCloudListingCache, ListingCacheKey
+from base.indexed_choices import IndexedChoices
+from base.instrumentation import GriptapeCloudInstrumentation
+from griptape_cloud_client.api.assets.create_asset import asyncio as create_asset
+from griptape_cloud_client.api.assets.create_asset_url import asyncio as create_asset_url
+from griptape_cloud_client.api.assets.get_asset import asyncio as get_asset
+from griptape_cloud_client.api.assistant_runs.create_assistant_run import asyncio as create_assistant_run
+from griptape_cloud_client.api.assistant_runs.get_assistant_run import asyncio as get_assistant_run
+from griptape_cloud_client.api.assistants.list_assistants import asyncio as list_assistants
+from griptape_cloud_client.api.buckets.create_bucket import asyncio as create_bucket
+from griptape_cloud_client.api.buckets.delete_bucket import asyncio as delete_bucket
+from griptape_cloud_client.api.buckets.get_bucket import asyncio as get_bucket
+from griptape_cloud_client.api.buckets.list_buckets import asyncio as list_buckets
+from griptape_cloud_client.api.buckets.update_bucket import asyncio as update_bucket
+from griptape_cloud_client.api.deployments.get_deployment import asyncio as get_deployment
+from griptape_cloud_client.api.deployments.list_structure_deployments import asyncio as list_structure_deployments
+from griptape_cloud_client.api.events.list_assistant_events import asyncio as list_assistant_events
+from griptape_cloud_client.api.events.list_events import asyncio as list_events
+from griptape_cloud_client.api.structure_runs.create_structure_run import asyncio as create_structure_run
+from griptape_cloud_client.api.structure_runs.get_structure_run import asyncio as get_structure_run
+from griptape_cloud_client.api.structures.list_structures import asyncio as list_structures
+from griptape_cloud_client.models.assert_url_operation import AssertUrlOperation
+from griptape_cloud_client.models.assistant_event_detail import AssistantEventDetail
+from griptape_cloud_client.models.create_asset_request_content import CreateAssetRequestContent
+from griptape_cloud_client.models.create_asset_response_content import (
+    CreateAssetResponseContent,
+)
+from griptape_cloud_client.models.create_asset_url_request_content import CreateAssetUrlRequestContent
+from griptape_cloud_client.models.create_asset_url_response_content import CreateAssetUrlResponseContent
+from griptape_cloud_client.models.create_assistant_run_request_content import (
+    CreateAssistantRunRequestContent,
+)
+from griptape_cloud_client.models.create_assistant_run_response_content import (
+    CreateAssistantRunResponseContent,
+)
+from griptape_cloud_client.models.create_bucket_request_content import CreateBucketRequestContent
+from griptape_cloud_client.models.create_bucket_response_content import CreateBucketResponseContent
+from griptape_cloud_client.models.create_structure_run_request_content import (
+    CreateStructureRunRequestContent,
+)
+from griptape_cloud_client.models.create_structure_run_response_content import (
+    CreateStructureRunResponseContent,
+)
+from griptape_cloud_client.models.deployment_status import DeploymentStatus
+from griptape_cloud_client.models.event_detail import EventDetail
+from griptape_cloud_client.models.get_asset_response_content import GetAssetResponseContent
+from griptape_cloud_client.models.get_assistant_run_response_content import (
+    GetAssistantRunResponseContent,
+)
+from griptape_cloud_client.models.get_bucket_response_content import GetBucketResponseContent
+from griptape_cloud_client.models.get_deployment_response_content import GetDeploymentResponseContent
+from griptape_cloud_client.models.get_structure_run_response_content import (
+    GetStructureRunResponseContent,
+)
+from griptape_cloud_client.models.list_assistant_events_response_content import (
+    ListAssistantEventsResponseContent,
+)
+from griptape_cloud_client.models.list_assistants_response_content import ListAssistantsResponseContent
+from griptape_cloud_client.models.list_buckets_response_content import ListBucketsResponseContent
+from griptape_cloud_client.models.list_events_response_content import ListEventsResponseContent
+from griptape_cloud_client.models.list_structure_deployments_response_content import (
+    ListStructureDeploymentsResponseContent,
+)
+from griptape_cloud_client.models.list_structures_response_content import (
+    ListStructuresResponseContent,
+)
+from griptape_cloud_client.models.structure_deployment_detail import StructureDeploymentDetail
+from griptape_cloud_client.models.structure_run_status import StructureRunStatus
+from griptape_cloud_client.models.update_bucket_request_content import UpdateBucketRequestContent
+from griptape_cloud_client.models.update_bucket_response_content import UpdateBucketResponseContent
+from griptape_cloud_client.types import UNSET, Unset
+from mixins.adaptive_poll_interval import AdaptivePollInterval
+from mixins.event_type_filter import EventTypeFilter
+from mixins.griptape_cloud_api_mixin import (
+    DEFAULT_MAX_CONCURRENT_PAGES,
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_RUN_STATUS_POLL_MAX_INTERVAL,
+    GriptapeCloudApi,
+)
+from mixins.run_event_poller import (
+    ASSISTANT_RUN_COMPLETED_EVENT_TYPE,
+    RUN_TERMINAL_STATUSES,
+    STRUCTURE_RUN_COMPLETED_EVENT_TYPE,
+    RunEventSubscription,
+)
+from mixins.structure_run_batch import StructureRunBatchResult
+
+if TYPE_CHECKING:
+    from griptape_cloud_client.client import AuthenticatedClient
+    from griptape_cloud_client.models.assistant_detail import AssistantDetail
+    from griptape_cloud_client.models.bucket_detail import BucketDetail
+    from griptape_cloud_client.models.structure_detail import StructureDetail
+
+logger = logging.getLogger(__name__)
+
+
+class GriptapeCloudAsyncApiMixin:
+    """Mixin class providing shared Griptape Cloud API functionality using the client's asyncio endpoints.
+
+    Offers the operations of GriptapeCloudApiMixin under the same names, so a node can await its runs on the event
+    loop instead of holding a worker thread for their duration. Requests and run polling are native coroutines.
+    Uploads, downloads and structure run batches already spread their work over worker pools of their own, so they
+    run their blocking counterparts in a worker thread.
+    """
+
+    gtc_client: "AuthenticatedClient"
+
+    def _get_blocking_api(self) -> GriptapeCloudApi:
+        return GriptapeCloudApi(self.gtc_client)
+
+    async def _poll_run_events(self, subscription: RunEventSubscription) -> AsyncGenerator[list[Any], None]:
+        """Yields batches of a run's events until it finishes, pacing the polls like the RunEventPoller does."""
+        while True:
+            events = subscription.receive(await subscription.fetch(subscription.run_id, subscription.offset))
+            if events:
+                yield events
+            if subscription.is_completed_by(events):
+                return
+            if subscription.is_status_check_due(events) and await subscription.is_run_finished(subscription.run_id):
+                # Pick up any events emitted between the last poll and the run finishing.
+                if events := subscription.receive(await subscription.fetch(subscription.run_id, subscription.offset)):
+                    yield events
+                return
+            await asyncio.sleep(subscription.schedule_next_poll(received_events=bool(events)))
+
+    def _get_listing_cache_key(self, resource: str) -> ListingCacheKey:
+        return GriptapeCloudListingCache.make_key(
+            base_url=self.gtc_client._base_url, api_key=self.gtc_client.token, resource=resource
+        )
+
+    async def _get_cached_listing(self, resource: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        return await GriptapeCloudListingCache.get_async(self._get_listing_cache_key(resource), loader)
+
+    def _peek_cached_listing(self, resource: str) -> Any | None:
+        return GriptapeCloudListingCache.peek(self._get_listing_cache_key(resource))
+
+    def _invalidate_cached_listing(self, resource: str) -> None:
+        GriptapeCloudListingCache.invalidate(self._get_listing_cache_key(resource))
+
+    async def _iter_paginated_listing(
+        self, list_page: Callable[..., Awaitable[Any]], get_items: Callable[[Any], list]
+    ) -> AsyncGenerator[Any, None]:
+        """Lazily yields every item of a paginated listing.
+
+        The first page is yielded as soon as it arrives. Once the page count is known, the remaining pages are
+        fetched concurrently through a bounded window and yielded in order, so memory stays bounded by the window
+        rather than the size of the listing.
+        """
+        page_size = DEFAULT_PAGE_SIZE
+        max_concurrent_pages = DEFAULT_MAX_CONCURRENT_PAGES
+
+        first_page = await list_page(page=1, page_size=page_size)
+        for item in get_items(first_page):
+            yield item
+
+        pagination = first_page.pagination
+        total_pages = 1 if isinstance(pagination, Unset) or pagination is None else pagination.total_pages
+        if total_pages <= 1:
+            return
+
+        pending: deque[asyncio.Future] = deque()
+        next_page = 2
+        try:
+            while next_page <= total_pages or pending:
+                while next_page <= total_pages and len(pending) < max_concurrent_pages:
+                    pending.append(asyncio.ensure_future(list_page(page=next_page, page_size=page_size)))
+                    next_page += 1
+                for item in get_items(await pending.popleft()):
+                    yield item
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def _get_deployment(self, deployment_id: str) -> GetDeploymentResponseContent:
+        try:
+            response = await get_deployment(
+                deployment_id=deployment_id,
+                client=self.gtc_client,
+            )
+            if isinstance(response, GetDeploymentResponseContent):
+                return response
+            msg = f"Unexpected response type: {type(response)}"
+            logger.error(msg)
+            raise TypeError(msg)  # noqa: TRY301
+        except Exception as e:
+            logger.error("Error getting deployment: %s", e)
+            raise
+
+    async def _list_structure_deployments(
+        self, structure_id: str, status: list[DeploymentStatus] | None = None
+    ) -> ListStructureDeploymentsResponseContent:
+        try:
+            status_query = status or UNSET
+            response = await list_structure_deployments(
+                structure_id=structure_id, client=self.gtc_client, status=status_query
+            )
+            if isinstance(response, ListStructureDeploymentsResponseContent):
+                return response
+            msg = f"Unexpected response type: {type(response)}"
+            logger.error(msg)
+            raise TypeError(msg)  # noqa: TRY301
+        except Exception as e:
+            logger.error("Error getting deployment: %s", e)
+            raise
+
+    async def _wait_for_structure_deployment(
+        self,
+        deployment_id: str,
+        timeout: float = 60.0,  # noqa: ASYNC109
+    ) -> GetDeploymentResponseContent:
+        with GriptapeCloudInstrumentation.phase("deployment.wait", deployment_id=deployment_id):
+            try:
+                start_time = time.time()
+                while True:
+                    response = await self._get_deployment(deployment_id=deployment_id)
+                    if isinstance(response, GetDeploymentResponseContent):
+                        # Check if deployment is in a terminal state
+                        if response.status in [
+                            DeploymentStatus.ERROR,
+                            DeploymentStatus.FAILED,
+                            DeploymentStatus.SUCCEEDED,
+                        ]:
+                            return response
+
+                        # Check timeout
+                        if time.time() - start_time > timeout:
+                            msg = f"Timeout waiting for deployment {deployment_id} to reach terminal state"
+                            logger.error(msg)
+                            raise TimeoutError(msg)  # noqa: TRY301
+
+                        # Wait before next check
+                        await asyncio.sleep(1.0)
+                    else:
+                        msg = f"Unexpected response type: {type(response)}"
+                        logger.error(msg)
+                        raise TypeError(msg)  # noqa: TRY301
+            except Exception as e:
+                logger.error("Error waiting for structure deployment: %s", e)
+                raise
+
+    async def _wait_for_latest_structure_deployment(
+        self,
+        structure_id: str,
+        timeout: float = 300.0,  # noqa: ASYNC109
+    ) -> GetDeploymentResponseContent:
+        try:
+            response = await self._list_structure_deployments(structure_id=structure_id)
+            if isinstance(response, ListStructureDeploymentsResponseContent):
+                # Wait for the latest deployment to complete
+                latest_deployment = max(response.deployments, key=lambda d: d.created_at, default=None)
+                if latest_deployment:
+                    return await self._wait_for_structure_deployment(latest_deployment.deployment_id, timeout=timeout)
+            msg = f"Unexpected response type: {type(response)}"
+            logger.error(msg)
+            raise TypeError(msg)  # noqa: TRY301
+        except Exception as e:
+            logger.error("Error waiting for latest structure deployment: %s", e)
+            raise
+
+    async def _list_buckets(self, page: int = 1, page_size: int = DEFAULT_PAGE_SIZE) -> ListBucketsResponseContent:
+        try:
+            response = await list_buckets(
+                client=self.gtc_client,
+                page=page,
+                page_size=page_size,
+            )
+            if isinstance(response, ListBucketsResponseContent):
+                return response
+            msg = f"Unexpected response type: {type(response)}"
+            logger.error(msg)
+            raise TypeError(msg)  # noqa: TRY301
+        except Exception as e:
+            logger.error("Error listing buckets: %s", e)
+            raise
+
+    async def _get_bucket_choices_cached(self) -> IndexedChoices:
+        async def load() -> IndexedChoices:
+            return IndexedChoices.from_details([bucket async for bucket in self._iter_buckets()], id_attr="bucket_id")
+
+        return await self._get_cached_listing("buckets", load)
+
+    async def _iter_buckets(self) -> AsyncGenerator["BucketDetail", None]:
+        async for bucket in self._iter_paginated_listing(self._list_buckets, lambda response: response.buckets):
+            yield bucket
+
+    async def _get_bucket(self, bucket_id: str) -> GetBucketResponseContent:
+        try:
+            response = await get_bucket(bucket_id=bucket_id, client=self.gtc_client)
+            if isinstance(response, GetBucketResponseContent):
+                return response
+            msg = f"Unexpected response type: {type(response)}"
+            logger.error(msg)
+            raise TypeError(msg)  # noqa: TRY301
+        except Exception as e:
+            logger.error("Error getting bucket: %s", e)
+            raise
+
+    async def _create_bucket(self, name: str) -> CreateBucketResponseContent:
+        try:
+            response = await create_bucket(
+                body=CreateBucketRequestContent(name=name),
+                client=self.gtc_client,
+            )
+            self._invalidate_cached_listing("buckets")
+            if isinstance(response, CreateBucketResponseContent):
+                return response
+            msg = f"Unexpected response type: {type(response)}"
+            logger.error(msg)
+            raise TypeError(msg)  # noqa: TRY301
+        except Exception as e:
+            logger.error("Error creating bucket: %s", e)
+            raise
+
+    async def _update_bucket(self, bucket_id: str, name: str) -> UpdateBucketResponseContent:
+        try:
+            response = await update_bucket(
+                bucket_id=bucket_id,
+                body=UpdateBucketRequestContent(name=name),
+                client=self.gtc_client,
+            )
+            self._invalidate_cached_listing("buckets")
+            if isinstance(response, UpdateBucketResponseContent):
+                return response
+            msg = f"Unexpected response type: {type(response)}"
+            logger.error(msg)
+            raise TypeError(msg)  # noqa: TRY301
+        except Exception as e:
+            logger.error("Error updating bucket: %s", e)
+            raise
+
+    async def _delete_bucket(self, bucket_id: str) -> None:
+        try:
+            await delete_bucket(bucket_id=bucket_id, client=self.gtc_client)
+            AssetUrlCache.invalidate(bucket_id=bucket_id)
+            self._invalidate_cached_listing("buckets")
+        except Exception as e:
+            logger.error("Error deleting bucket: %s", e)
+            raise
+
+    async def _list_assistants(
+        self, page: int = 1, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> ListAssistantsResponseContent:
+        try:
+            response = await list_assistants(
+                client=self.gtc_client,
+                page=page,
+                page_size=page_size,
+            )
+            if isinstance(response, ListAssistantsResponseContent):
+                return response
+            msg = f"Unexpected response type: {type(response)}"
+            logger.error(msg)
+            raise TypeError(msg)  # noqa: TRY301
+        except Exception as e:
+            logger.error("Error listing assistants: %s", e)
+            raise
+
+    async def _get_assistant_choices_cached(self) -> IndexedChoices:
+        async def load() -> IndexedChoices:
+            return IndexedChoices.from_details(
+                [assistant async for assistant in self._iter_assistants()], id_attr="assistant_id"
+            )
+
+        return await self._get_cached_listing("assistants", load)
+
+    async def _iter_assistants(self) -> AsyncGenerator["AssistantDetail", None]:
+        async for assistant in self._iter_paginated_listing(
+            self._list_assistants, lambda response: response.assistants
+        ):
+            yield assistant
+
+    async def _get_assistant_run(self, assistant_run_id: str) -> GetAssistantRunResponseContent:
+        try:
+            response = await get_assistant_run(assistant_run_id=assistant_run_id, client=self.gtc_client)
+            if isinstance(response, GetAssistantRunResponseContent):
+                return response
+            msg = f"Unexpected response type: {type(response)}"
+            logger.error(msg)
+            raise TypeError(msg)  # noqa: TRY301
+        except Exception as e:
+            logger.error("Error getting assistant run: %s", e)
+            raise
+
+    async def _create_assistant_run(self, assistant_id: str, args: list[str]) -> CreateAssistantRunResponseContent:
+        try:
+            response = await create_assistant_run(
+                assistant_id=assistant_id,
+                body=CreateAssistantRunRequestContent(
+                    args=args,
+                ),
+                client=self.gtc_client,
+            )
+            if isinstance(response, CreateAssistantRunResponseContent):
+                return response
+            msg = f"Unexpected response type: {type(response)}"
+            logger.error(msg)
+            raise TypeError(msg)  # noqa: TRY301
+        except Exception as e:
+            logger.error("Error creating assistant run: %s", e)
+            raise
+
+    async def _list_assistant_run_events(
+        self, assistant_run_id: str, offset: float | None = None, event_filter: EventTypeFilter | None = None
+    ) -> ListAssistantEventsResponseContent:
+        event_filter = event_filter or EventTypeFilter()
+        try:
+            response = await list_assistant_events(
+                assistant_run_id=assistant_run_id,
+                offset=str(offset) if offset is not None else UNSET,
+                client=self.gtc_client,
+            )
+            if isinstance(response, ListAssistantEventsResponseContent):
+                response.events = event_filter.apply(response.events)
+                return response
+            msg = f"Unexpected response type: {type(response)}"
+            logger.error(msg)
+            raise TypeError(msg)  # noqa: TRY301
+        except Exception as e:
+            logger.error("Error listing events: %s", e)
+            raise
+
+    async def _is_assistant_run_finished(self, assistant_run_id: str) -> bool:
+        assistant_run = await self._get_assistant_run(assistant_run_id=assistant_run_id)
+        return str(assistant_run.status) in RUN_TERMINAL_STATUSES
+
+    async def _poll_assistant_run_events(
+        self,
+        assistant_run_id: str,
+        include_types: Iterable[str] | None = None,
+        exclude_types: Iterable[str] | None = None,
+    ) -> AsyncGenerator[list[AssistantEventDetail], None]:
+        """Yields batches of the assistant run's events until it finishes, optionally filtered by event type."""
+        event_filter = EventTypeFilter.create(include_types, exclude_types)
+        subscription = RunEventSubscription(
+            run_id=assistant_run_id,
+            fetch=lambda run_id, offset: self._list_assistant_run_events(
+                assistant_run_id=run_id, offset=offset, event_filter=event_filter
+            ),
+            is_completion_event=lambda event: (
+                event.type_ == ASSISTANT_RUN_COMPLETED_EVENT_TYPE and event.origin == "ASSISTANT"
+            ),
+            is_run_finished=self._is_assistant_run_finished if event_filter else None,
+        )
+        with GriptapeCloudInstrumentation.phase("assistant_run.wait", assistant_run_id=assistant_run_id):
+            async for events in self._poll_run_events(subscription):
+                yield events
+
+    async def _create_asset(
+        self,
+        asset_name: str,
+        bucket_id: str,
+    ) -> CreateAssetResponseContent:
+        try:
+            response = await create_asset(
+                bucket_id=bucket_id,
+                client=self.gtc_client,
+                body=CreateAssetRequestContent(
+                    name=asset_name,
+                ),
+            )
+            if isinstance(response, CreateAssetResponseContent):
+                return response
+            msg = f"Unexpected response type: {type(response)}"
+            logger.error(msg)
+            raise TypeError(msg)  # noqa: TRY301
+        except Exception as e:
+            logger.error("Error creating asset: %s", e)
+            raise
+
+    def _get_asset_url_cache_key(
+        self, asset_name: str, bucket_id: str, operation: AssertUrlOperation
+    ) -> AssetUrlCacheKey:
+        return AssetUrlCache.make_key(
+            base_url=self.gtc_client._base_url,
+            api_key=self.gtc_client.token,
+            bucket_id=bucket_id,
+            asset_name=asset_name,
+            operation=str(operation),
+        )
+
+    async def _create_asset_url(
+        self,
+        asset_name: str,
+        bucket_id: str,
+        operation: AssertUrlOperation = AssertUrlOperation.GET,
+        *,
+        use_cache: bool = True,
+    ) -> CreateAssetUrlResponseContent:
+        # Only download URLs are cached. An upload can run past the cache's expiry margin, and a URL that lapses
+        # mid-upload fails the remaining parts with 403s, so every upload gets a freshly signed URL.
+        cacheable = operation == AssertUrlOperation.GET
+        cache_key = self._get_asset_url_cache_key(asset_name, bucket_id, operation)
+        if use_cache and cacheable and (cached_response := AssetUrlCache.get(cache_key)) is not None:
+            return cached_response
+        try:
+            response = await create_asset_url(
+                bucket_id=bucket_id,
+                name=asset_name,
+                client=self.gtc_client,
+                body=CreateAssetUrlRequestContent(
+                    operation=operation,
+                ),
+            )
+            if isinstance(response, CreateAssetUrlResponseContent):
+                expires_at = getattr(response, "expires_at", None)
+                if cacheable:
+                    AssetUrlCache.put(
+                        cache_key,
+                        response,
+                        url=response.url,
+                        expires_at=expires_at if isinstance(expires_at, datetime) else None,
+                    )
+                return response
+            msg = f"Unexpected response type: {type(response)}"
+            logger.error(msg)
+            raise TypeError(msg)  # noqa: TRY301
+        except Exception as e:
+            logger.error("Error creating asset URL: %s", e)
+            raise
+
+    async def _get_asset(self, asset_name: str, bucket_id: str) -> GetAssetResponseContent:
+        try:
+            response = await get_asset(
+                bucket_id=bucket_id,
+                name=asset_name,
+                client=self.gtc_client,
+            )
+            if isinstance(response, GetAssetResponseContent):
+                return response
+            msg = f"Unexpected response type: {type(response)}"
+            logger.error(msg)
+            raise TypeError(msg)  # noqa: TRY301
+        except Exception as e:
+            logger.error("Error getting asset: %s", e)
+            raise
+
+    async def _upload_asset_file(
+        self, file_path: Path, asset_name: str, bucket_id: str, *, deduplicate: bool = True
+    ) -> UploadResult | None:
+        """See GriptapeCloudApiMixin._upload_asset_file."""
+        return await asyncio.to_thread(
+            self._get_blocking_api()._upload_asset_file, file_path, asset_name, bucket_id, deduplicate=deduplicate
+        )
+
+    async def _upload_asset_stream(self, chunks: Iterable[bytes], asset_name: str, bucket_id: str) -> UploadResult:
+        """See GriptapeCloudApiMixin._upload_asset_stream. `chunks` is consumed from a worker thread."""
+        return await asyncio.to_thread(self._get_blocking_api()._upload_asset_stream, chunks, asset_name, bucket_id)
+
+    async def _upload_asset_files(
+        self,
+        files: list[tuple[Path, str]],
+        bucket_id: str,
+        max_workers: int | None = None,
+        on_result: Callable[[BatchUploadFileResult], None] | None = None,
+    ) -> list[BatchUploadFileResult]:
+        """See GriptapeCloudApiMixin._upload_asset_files. `on_result` is called from a worker thread."""
+        return await asyncio.to_thread(
+            self._get_blocking_api()._upload_asset_files, files, bucket_id, max_workers=max_workers, on_result=on_result
+        )
+
+    async def _download_asset_file(
+        self, asset_name: str, bucket_id: str, destination: Path | None = None, *, use_cache: bool = True
+    ) -> Path:
+        """See GriptapeCloudApiMixin._download_asset_file."""
+        return await asyncio.to_thread(
+            self._get_blocking_api()._download_asset_file, asset_name, bucket_id, destination, use_cache=use_cache
+        )
+
+    async def _list_structures(
+        self, page: int = 1, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> ListStructuresResponseContent:
+        try:
+            response = await list_structures(
+                client=self.gtc_client,
+                page=page,
+                page_size=page_size,
+            )
+            if isinstance(response, ListStructuresResponseContent):
+                return response
+            msg = f"Unexpected response type: {type(response)}"
+            logger.error(msg)
+            raise TypeError(msg)  # noqa: TRY301
+        except Exception as e:
+            logger.error("Error listing structures: %s", e)
+            raise
+
+    async def _get_structure_choices_cached(self) -> IndexedChoices:
+        async def load() -> IndexedChoices:
+            return IndexedChoices.from_details(
+                [structure async for structure in self._iter_structures()], id_attr="structure_id"
+            )
+
+        return await self._get_cached_listing("structures", load)
+
+    async def _iter_structures(self) -> AsyncGenerator["StructureDetail", None]:
+        async for structure in self._iter_paginated_listing(
+            self._list_structures, lambda response: response.structures
+        ):
+            yield structure
+
+    async def _create_structure_run(self, structure_id: str, args: list[str]) -> CreateStructureRunResponseContent:
+        try:
+            response = await create_structure_run(
+                structure_id=structure_id,
+                body=CreateStructureRunRequestContent(
+                    args=args,
+                ),
+                client=self.gtc_client,
+            )
+            if isinstance(response, CreateStructureRunResponseContent):
+                return response
+            msg = f"Unexpected response type: {type(response)}"
+            logger.error(msg)
+            raise TypeError(msg)  # noqa: TRY301
+        except Exception as e:
+            logger.error("Error creating structure run: %s", e)
+            raise
+
+    async def _get_structure_run(self, structure_run_id: str) -> GetStructureRunResponseContent:
+        try:
+            response = await get_structure_run(structure_run_id=structure_run_id, client=self.gtc_client)
+            if isinstance(response, GetStructureRunResponseContent):
+                return response
+            msg = f"Unexpected response type: {type(response)}"
+            logger.error(msg)
+            raise TypeError(msg)  # noqa: TRY301
+        except Exception as e:
+            logger.error("Error getting structure run: %s", e)
+            raise
+
+    def _get_structure_run_bad_statuses(self) -> list[str]:
+        return [StructureRunStatus.FAILED, StructureRunStatus.CANCELLED, StructureRunStatus.ERROR]
+
+    def _get_structure_run_terminal_statuses(self) -> list[str]:
+        return [StructureRunStatus.SUCCEEDED, *self._get_structure_run_bad_statuses()]
+
+    async def _list_structure_run_events(
+        self, structure_run_id: str, offset: float | None = None, event_filter: EventTypeFilter | None = None
+    ) -> ListEventsResponseContent:
+        event_filter = event_filter or EventTypeFilter()
+        try:
+            response = await list_events(
+                structure_run_id=structure_run_id,
+                offset=str(offset) if offset is not None else UNSET,
+                client=self.gtc_client,
+            )
+            if isinstance(response, ListEventsResponseContent):
+                response.events = event_filter.apply(response.events)
+                return response
+            msg = f"Unexpected response type: {type(response)}"
+            logger.error(msg)
+            raise TypeError(msg)  # noqa: TRY301
+        except Exception as e:
+            logger.error("Error listing events: %s", e)
+            raise
+
+    async def _is_structure_run_finished(self, structure_run_id: str) -> bool:
+        structure_run = await self._get_structure_run(structure_run_id=structure_run_id)
+        return structure_run.status in self._get_structure_run_terminal_statuses()
+
+    async def _poll_structure_run_events(
+        self,
+        structure_run_id: str,
+        include_types: Iterable[str] | None = None,
+        exclude_types: Iterable[str] | None = None,
+    ) -> AsyncGenerator[list[EventDetail], None]:
+        """Yields batches of the structure run's events until it finishes, optionally filtered by event type."""
+        event_filter = EventTypeFilter.create(include_types, exclude_types)
+        subscription = RunEventSubscription(
+            run_id=structure_run_id,
+            fetch=lambda run_id, offset: self._list_structure_run_events(
+                structure_run_id=run_id, offset=offset, event_filter=event_filter
+            ),
+            is_completion_event=lambda event: (
+                event.type_ == STRUCTURE_RUN_COMPLETED_EVENT_TYPE and event.origin == "SYSTEM"
+            ),
+            is_run_finished=self._is_structure_run_finished if event_filter else None,
+        )
+        with GriptapeCloudInstrumentation.phase("structure_run.wait", structure_run_id=structure_run_id):
+            async for events in self._poll_run_events(subscription):
+                yield events
+
+    async def _wait_for_structure_runs(
+        self,
+        structure_run_ids: list[str],
+        timeout: float | None = None,  # noqa: ASYNC109
+    ) -> list[GetStructureRunResponseContent]:
+        """Waits for structure runs submitted earlier to reach a terminal status.
+
+        Unfinished runs are polled by status, backing off while none of them changes and polling quickly again as
+        soon as one finishes.
+
+        Returns:
+            The final state of each run, in the order of `structure_run_ids`.
+        """
+        with GriptapeCloudInstrumentation.phase("structure_run.wait", runs=len(structure_run_ids)):
+            try:
+                start_time = time.monotonic()
+                terminal_statuses = self._get_structure_run_terminal_statuses()
+                poll_interval = AdaptivePollInterval(max_interval=DEFAULT_RUN_STATUS_POLL_MAX_INTERVAL)
+                finished: dict[str, GetStructureRunResponseContent] = {}
+                while True:
+                    unfinished = [run_id for run_id in dict.fromkeys(structure_run_ids) if run_id not in finished]
+                    structure_runs = await asyncio.gather(
+                        *(self._get_structure_run(structure_run_id=run_id) for run_id in unfinished)
+                    )
+                    finished_any = False
+                    for structure_run_id, structure_run in zip(unfinished, structure_runs, strict=True):
+                        if structure_run.status in terminal_statuses:
+                            finished[structure_run_id] = structure_run
+                            finished_any = True
+                    if len(finished) == len(set(structure_run_ids)):
+                        return [finished[structure_run_id] for structure_run_id in structure_run_ids]
+
+                    if timeout is not None and time.monotonic() - start_time > timeout:
+                        msg = f"Timeout waiting for {len(set(structure_run_ids)) - len(finished)} structure run(s) to finish"
+                        logger.error(msg)
+                        raise TimeoutError(msg)  # noqa: TRY301
+
+                    await asyncio.sleep(poll_interval.next_interval(received_events=finished_any))
+            except Exception as e:
+                logger.error("Error waiting for structure runs: %s", e)
+                raise
+
+    async def _run_structure_batch(
+        self,
+        structure_id: str,
+        args_list: list[list[str]],
+        max_in_flight: int | None = None,
+        on_result: Callable[[StructureRunBatchResult], None] | None = None,
+        timeout: float | None = None,  # noqa: ASYNC109
+    ) -> list[StructureRunBatchResult]:
+        """See GriptapeCloudApiMixin._run_structure_batch. `on_result` is called from a worker thread."""
+        return await asyncio.to_thread(
+            self._get_blocking_api()._run_structure_batch,
+            structure_id,
+            args_list,
+            max_in_flight=max_in_flight,
+            on_result=on_result,
+            timeout=timeout,
+        )
+
+    def _is_deployment_ready(self, deployment: GetDeploymentResponseContent | StructureDeploymentDetail) -> bool:
+        return deployment.status in [
+            DeploymentStatus.SUCCEEDED,
+        ]
+
+
+class GriptapeCloudAsyncApi(GriptapeCloudAsyncApiMixin):
+    """GriptapeCloudAsyncApiMixin bound to a client, for nodes whose own API methods are the blocking ones."""
+
+    def __init__(self, gtc_client: "AuthenticatedClient") -> None:
+        self.gtc_client = gtc_client
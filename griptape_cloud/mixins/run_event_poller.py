@@ -0,0 +1,254 @@
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Generator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, ClassVar
+
+from base.griptape_cloud_settings import get_float_setting, get_int_setting
+from mixins.adaptive_poll_interval import AdaptivePollInterval
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_REQUESTS_PER_SECOND = 10.0
+DEFAULT_STATUS_CHECK_INTERVAL = 2.0
+DEFAULT_MAX_CONCURRENT_POLLS = 4
+STRUCTURE_RUN_COMPLETED_EVENT_TYPE = "StructureRunCompleted"
+ASSISTANT_RUN_COMPLETED_EVENT_TYPE = "FinishStructureRunEvent"
+RUN_TERMINAL_STATUSES = {"SUCCEEDED", "FAILED", "ERROR", "CANCELLED"}
+
+
+@dataclass(eq=False)
+class RunEventSubscription:
+    """A single run tracked by the RunEventPoller.
+
+    `fetch` is called with the run ID and the offset to read from, and must return a list-events response exposing
+    `events` and `next_offset`. Batches of events are delivered through the queue; the run is finished once None is
+    delivered, and an Exception is delivered instead if polling the run fails. Subscribers that only care about
+    completion can skip the event batches with `keep_events=False` and be called back through `on_finished`.
+
+    When the events are filtered, the completion event may never be delivered. `is_run_finished` is then used as a
+    status check while the run is idle, at most once per `status_check_interval`.
+
+    GriptapeCloudAsyncApiMixin drives the same state from a loop of its own, with `fetch` and `is_run_finished`
+    returning awaitables instead.
+    """
+
+    run_id: str
+    fetch: Callable[[str, float | None], Any]
+    is_completion_event: Callable[[Any], bool]
+    queue: "queue.Queue[list[Any] | Exception | None]" = field(default_factory=queue.Queue)
+    offset: float | None = None
+    poll_interval: AdaptivePollInterval = field(default_factory=AdaptivePollInterval.from_settings)
+    next_poll_at: float = 0.0
+    active: bool = True
+    keep_events: bool = True
+    on_finished: Callable[["RunEventSubscription"], None] | None = None
+    error: Exception | None = None
+    is_run_finished: Callable[[str], bool] | None = None
+    status_check_interval: float = DEFAULT_STATUS_CHECK_INTERVAL
+    next_status_check_at: float = 0.0
+    in_flight: bool = False
+
+    def receive(self, response: Any) -> list[Any]:
+        """Takes in a fetched page of the run's events, advancing the offset past it, and returns its events."""
+        self.offset = response.next_offset
+        return response.events
+
+    def is_completed_by(self, events: list[Any]) -> bool:
+        return any(self.is_completion_event(event) for event in events)
+
+    def is_status_check_due(self, events: list[Any]) -> bool:
+        """Returns whether to check the run's status after a poll returned `events`, scheduling the next check."""
+        now = time.monotonic()
+        if events or self.is_run_finished is None or now < self.next_status_check_at:
+            return False
+        self.next_status_check_at = now + self.status_check_interval
+        return True
+
+    def schedule_next_poll(self, *, received_events: bool) -> float:
+        """Backs off or speeds up according to the last poll, and returns the delay until the next one."""
+        delay = self.poll_interval.next_interval(received_events=received_events)
+        self.next_poll_at = time.monotonic() + delay
+        return delay
+
+    def iter_batches(self) -> Generator[list[Any], None, None]:
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+
+class RunEventPoller:
+    """Single background poller multiplexing the event streams of every active run in the process.
+
+    Runs are dispatched round-robin whenever they are due, and every request is spaced to stay within a global
+    request-rate budget. Each run backs off on its own while it is idle, so the total request volume follows
+    event activity rather than the number of open runs. Fetches run on a small pool of workers, one at a time per
+    run, so a run whose requests are slow or being retried does not hold up the events of every other run.
+    """
+
+    _instance: ClassVar["RunEventPoller | None"] = None
+    _instance_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        max_requests_per_second: float = DEFAULT_MAX_REQUESTS_PER_SECOND,
+        max_concurrent_polls: int = DEFAULT_MAX_CONCURRENT_POLLS,
+    ) -> None:
+        self._min_request_spacing = 1.0 / max_requests_per_second
+        self._condition = threading.Condition()
+        self._subscriptions: deque[RunEventSubscription] = deque()
+        self._budget_lock = threading.Lock()
+        self._next_request_at = 0.0
+        # Workers are only started as polls are submitted.
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_concurrent_polls), thread_name_prefix="griptape-cloud-run-event-poll"
+        )
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def get_instance(cls) -> "RunEventPoller":
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(
+                    max_requests_per_second=get_float_setting(
+                        "GT_CLOUD_EVENT_POLL_MAX_REQUESTS_PER_SECOND", DEFAULT_MAX_REQUESTS_PER_SECOND
+                    ),
+                    max_concurrent_polls=get_int_setting(
+                        "GT_CLOUD_EVENT_POLL_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENT_POLLS
+                    ),
+                )
+            return cls._instance
+
+    def subscribe(  # noqa: PLR0913
+        self,
+        run_id: str,
+        fetch: Callable[[str, float | None], Any],
+        is_completion_event: Callable[[Any], bool],
+        *,
+        keep_events: bool = True,
+        on_finished: Callable[[RunEventSubscription], None] | None = None,
+        is_run_finished: Callable[[str], bool] | None = None,
+    ) -> RunEventSubscription:
+        """Starts tracking a run, polling it as soon as the request budget allows.
+
+        Args:
+            run_id: The ID of the run to track.
+            fetch: Fetches the events of the run from an offset.
+            is_completion_event: Returns True for the event that marks the run as finished.
+            keep_events: Whether to deliver event batches through the subscription's queue.
+            on_finished: Called from a poller worker thread once the run finishes or polling it fails.
+            is_run_finished: Checks the run's status, for when filtering may hide the completion event.
+        """
+        subscription = RunEventSubscription(
+            run_id=run_id,
+            fetch=fetch,
+            is_completion_event=is_completion_event,
+            keep_events=keep_events,
+            on_finished=on_finished,
+            is_run_finished=is_run_finished,
+        )
+        with self._condition:
+            self._subscriptions.append(subscription)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="griptape-cloud-run-event-poller", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return subscription
+
+    def unsubscribe(self, subscription: RunEventSubscription) -> None:
+        with self._condition:
+            subscription.active = False
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+    def _next_due_subscription(self) -> RunEventSubscription:
+        """Waits for a run that is due and not already being polled, and marks it as being polled."""
+        with self._condition:
+            while True:
+                idle = [s for s in self._subscriptions if not s.in_flight]
+                if not idle:
+                    # Woken up by new subscriptions and by polls completing.
+                    self._condition.wait()
+                    continue
+                now = time.monotonic()
+                due = next((s for s in idle if s.next_poll_at <= now), None)
+                if due is not None:
+                    # Move to the back of the line so every run gets its turn.
+                    self._subscriptions.remove(due)
+                    self._subscriptions.append(due)
+                    due.in_flight = True
+                    return due
+                earliest = min(s.next_poll_at for s in idle)
+                self._condition.wait(timeout=earliest - now)
+
+    def _wait_for_request_budget(self) -> None:
+        with self._budget_lock:
+            now = time.monotonic()
+            wait = self._next_request_at - now
+            self._next_request_at = max(now, self._next_request_at) + self._min_request_spacing
+        if wait > 0:
+            time.sleep(wait)
+
+    def _run(self) -> None:
+        while True:
+            subscription = self._next_due_subscription()
+            self._wait_for_request_budget()
+            self._executor.submit(self._poll_subscription, subscription)
+
+    def _poll_subscription(self, subscription: RunEventSubscription) -> None:
+        try:
+            if not subscription.active:
+                return
+            try:
+                finished = self._poll(subscription)
+            except Exception as e:
+                logger.error("Error polling events for run %s: %s", subscription.run_id, e)
+                subscription.error = e
+                self._finish(subscription, e)
+                return
+            if finished:
+                self._finish(subscription, None)
+        finally:
+            with self._condition:
+                subscription.in_flight = False
+                self._condition.notify()
+
+    def _poll(self, subscription: RunEventSubscription) -> bool:
+        """Fetches the run's new events and returns whether the run has finished."""
+        events = self._fetch(subscription)
+        if subscription.is_completed_by(events):
+            return True
+
+        if subscription.is_status_check_due(events):
+            self._wait_for_request_budget()
+            if subscription.is_run_finished(subscription.run_id):
+                # Pick up any events emitted between the last poll and the run finishing.
+                self._wait_for_request_budget()
+                self._fetch(subscription)
+                return True
+
+        subscription.schedule_next_poll(received_events=bool(events))
+        return False
+
+    def _fetch(self, subscription: RunEventSubscription) -> list[Any]:
+        events = subscription.receive(subscription.fetch(subscription.run_id, subscription.offset))
+        if events and subscription.keep_events:
+            subscription.queue.put(events)
+        return events
+
+    def _finish(self, subscription: RunEventSubscription, item: Exception | None) -> None:
+        self.unsubscribe(subscription)
+        subscription.queue.put(item)
+        if subscription.on_finished is not None:
+            try:
+                subscription.on_finished(subscription)
+            except Exception as e:
+                logger.error("Error in completion callback for run %s: %s", subscription.run_id, e)
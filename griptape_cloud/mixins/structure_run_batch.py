@@ -0,0 +1,24 @@
+from dataclasses import asdict, dataclass
+from typing import Any
+
+RUN_SUCCEEDED = "succeeded"
+RUN_FAILED = "failed"
+
+
+@dataclass
+class StructureRunBatchResult:
+    index: int
+    args: list[str]
+    status: str
+    structure_run_id: str | None = None
+    run_status: str | None = None
+    output: Any | None = None
+    error: str | None = None
+    elapsed_seconds: float = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        return self.status == RUN_SUCCEEDED
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
@@ -0,0 +1,87 @@
+"""Downloads the layers of a layered workflow package from the Griptape Cloud data lake and extracts them here.
+
+The layers are listed in `layers.json` next to this script. Packages that were published whole have no
+`layers.json`, so there is nothing to fetch for them.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import urllib.parse
+import urllib.request
+import zipfile
+from pathlib import Path
+from typing import Any
+
+from dotenv import dotenv_values
+
+logging.basicConfig(
+    level=logging.INFO,
+)
+logger = logging.getLogger(__name__)
+
+LAYERS_FILE_NAME = "layers.json"
+CHUNK_SIZE = 1024 * 1024
+
+
+def get_api_key(root: Path) -> str:
+    """Returns the API key from the environment, or from the `.env` file the workflow was published with."""
+    api_key = os.environ.get("GT_CLOUD_API_KEY") or dotenv_values(root / ".env").get("GT_CLOUD_API_KEY")
+    if not api_key:
+        msg = "GT_CLOUD_API_KEY is required to download the layers of the workflow package."
+        raise ValueError(msg)
+    return api_key
+
+
+def get_download_url(base_url: str, api_key: str, bucket_id: str, asset_path: str) -> tuple[str, dict[str, str]]:
+    """Returns a presigned URL to download the asset from, along with the headers to send with it."""
+    request = urllib.request.Request(  # noqa: S310
+        f"{base_url.rstrip('/')}/buckets/{bucket_id}/asset-urls/{urllib.parse.quote(asset_path)}",
+        data=json.dumps({"operation": "GET"}).encode(),
+        headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
+        method="POST",
+    )
+    with urllib.request.urlopen(request) as response:  # noqa: S310
+        body = json.load(response)
+    return body["url"], body.get("headers") or {}
+
+
+def fetch_layer(root: Path, base_url: str, api_key: str, layer: dict[str, Any]) -> None:
+    """Downloads the layer, checks that it has the content it was published with, and extracts it into the root."""
+    url, headers = get_download_url(base_url, api_key, layer["bucket_id"], layer["asset_path"])
+    algorithm, _, expected_digest = layer["content_hash"].partition(":")
+    digest = hashlib.new(algorithm)
+    with tempfile.TemporaryFile() as file:
+        with urllib.request.urlopen(urllib.request.Request(url, headers=headers)) as response:  # noqa: S310
+            while chunk := response.read(CHUNK_SIZE):
+                digest.update(chunk)
+                file.write(chunk)
+        if digest.hexdigest() != expected_digest:
+            msg = f"Layer {layer['name']} does not have the content it was published with."
+            raise ValueError(msg)
+        file.seek(0)
+        with zipfile.ZipFile(file) as archive:
+            archive.extractall(root)
+            # zipfile does not restore permissions, so executable files would lose their executable bit.
+            for info in archive.infolist():
+                mode = info.external_attr >> 16
+                if mode & 0o111:
+                    (root / info.filename).chmod(mode & 0o777)
+    logger.info("Fetched layer %s", layer["name"])
+
+
+def fetch_layers(root: Path) -> None:
+    """Fetches every layer listed in the root's `layers.json`, if it has one."""
+    layers_file_path = root / LAYERS_FILE_NAME
+    if not layers_file_path.exists():
+        return
+    manifest = json.loads(layers_file_path.read_text(encoding="utf-8"))
+    api_key = get_api_key(root)
+    for layer in manifest["layers"]:
+        fetch_layer(root, manifest["base_url"], api_key, layer)
+
+
+if __name__ == "__main__":
+    fetch_layers(Path(__file__).parent)
@@ -5,6 +5,7 @@ from enum import StrEnum
 from typing import Any
 
 from base.base_griptape_cloud_node import BaseGriptapeCloudNode
+from base.run_event_buffer import RunEventBuffer
 from griptape_cloud_client.models.deployment_status import DeploymentStatus
 from griptape_cloud_client.types import Unset
 from griptape_nodes.exe_types.core_types import Parameter, ParameterGroup, ParameterMessage, ParameterMode
@@ -275,14 +276,27 @@ class GriptapeCloudPublishedWorkflow(SuccessFailureNode, BaseGriptapeCloudNode):
             # Create and run the structure
             structure_run = self._create_structure_run(structure_id=self.structure_id, args=args)
 
-            # Poll for events if requested
-            for events in self._poll_structure_run_events(structure_run_id=structure_run.structure_run_id):
-                self.append_value_to_parameter(
-                    parameter_name=self.status_component._result_details.name,
-                    value="\n".join(f"Structure Run Event: {event.payload!s}" for event in events),
+            # Stream recent events into the result details, and into the events parameter if requested
+            event_buffers = [
+                RunEventBuffer(
+                    flush=lambda text: self.publish_update_to_parameter(
+                        self.status_component._result_details.name, text
+                    ),
+                    format_event=lambda event: f"Structure Run Event: {event.payload!s}",
                 )
-                if include_events:
-                    self.append_value_to_parameter("events", "\n".join(str(event.payload) for event in events))
+            ]
+            if include_events:
+                event_buffers.append(
+                    RunEventBuffer(flush=lambda text: self.publish_update_to_parameter("events", text))
+                )
+            excluded_types = set.intersection(*(event_buffer.excluded_types for event_buffer in event_buffers))
+            for events in self._poll_structure_run_events(
+                structure_run_id=structure_run.structure_run_id, exclude_types=excluded_types
+            ):
+                for event_buffer in event_buffers:
+                    event_buffer.extend(events)
+            for event_buffer in event_buffers:
+                event_buffer.flush()
 
             # Get the final structure run result
             structure_run = self._get_structure_run(structure_run_id=structure_run.structure_run_id)
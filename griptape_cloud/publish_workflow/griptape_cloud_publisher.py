@@ -4,27 +4,22 @@ import importlib.metadata
 import json
 import logging
 import os
-import shutil
 import subprocess
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast
 from urllib.parse import urljoin
 
+from assets.asset_hash_index import AssetHashIndex
+from base.griptape_cloud_client_registry import GriptapeCloudClientRegistry
+from base.griptape_cloud_settings import get_bool_setting, get_list_setting
+from base.instrumentation import GriptapeCloudInstrumentation
 from dotenv import set_key
 from dotenv.main import DotEnv
-from griptape_cloud_client.api.assets.create_asset import sync as create_asset
-from griptape_cloud_client.api.assets.create_asset_url import sync as create_asset_url
 from griptape_cloud_client.api.structures.create_structure import sync as create_structure
 from griptape_cloud_client.api.structures.update_structure import sync as update_structure
-from griptape_cloud_client.client import AuthenticatedClient
-from griptape_cloud_client.models.assert_url_operation import AssertUrlOperation
-from griptape_cloud_client.models.create_asset_request_content import CreateAssetRequestContent
-from griptape_cloud_client.models.create_asset_response_content import (
-    CreateAssetResponseContent,
-)
-from griptape_cloud_client.models.create_asset_url_request_content import CreateAssetUrlRequestContent
-from griptape_cloud_client.models.create_asset_url_response_content import CreateAssetUrlResponseContent
 from griptape_cloud_client.models.create_structure_request_content import CreateStructureRequestContent
 from griptape_cloud_client.models.create_structure_response_content import (
     CreateStructureResponseContent,
@@ -55,15 +50,22 @@ from griptape_nodes.retained_mode.events.workflow_events import (
 from griptape_nodes.retained_mode.griptape_nodes import (
     GriptapeNodes,
 )
-from httpx import Client
 from mixins.griptape_cloud_api_mixin import GriptapeCloudApiMixin
 from publish_workflow import GRIPTAPE_CLOUD_LIBRARY_CONFIG_KEY
 from publish_workflow.griptape_cloud_workflow_builder import (
     GriptapeCloudWorkflowBuilder,
     GriptapeCloudWorkflowBuilderInput,
 )
+from publish_workflow.published_structure_index import PublishedStructure, PublishedStructureIndex
+from publish_workflow.requirements_lock import RequirementsLock
+from publish_workflow.workflow_package_builder import (
+    DEFAULT_IGNORE_PATTERNS,
+    PackageBuildResult,
+    WorkflowPackageBuilder,
+)
 
 if TYPE_CHECKING:
+    from griptape_cloud_client.client import AuthenticatedClient
     from griptape_nodes.retained_mode.events.base_events import ResultPayload
     from griptape_nodes.retained_mode.managers.library_manager import LibraryManager
 
@@ -74,6 +76,11 @@ T = TypeVar("T")
 logger = logging.getLogger("griptape_cloud_publisher")
 
 GRIPTAPE_SERVICE = "Griptape"
+LAYERS_FILE_NAME = "layers.json"
+# Default of GT_CLOUD_PUBLISH_EXCLUDE_PATTERNS, which is applied on top of DEFAULT_IGNORE_PATTERNS.
+DEFAULT_PUBLISH_EXCLUDE_PATTERNS = [".git"]
+# How many hex digits of a package's content hash go into its asset name.
+PACKAGE_DIGEST_LENGTH = 16
 
 
 class GriptapeCloudPublisher(GriptapeCloudApiMixin):
@@ -88,11 +95,9 @@ class GriptapeCloudPublisher(GriptapeCloudApiMixin):
         self._workflow_name = workflow_name
         self._published_workflow_file_name = published_workflow_file_name
         self.execute_on_publish = execute_on_publish
-        self._client = Client()
-        self._gtc_client = AuthenticatedClient(
+        self._gtc_client = GriptapeCloudClientRegistry.get_client(
             base_url=self._get_base_url(),
-            token=self._get_secret("GT_CLOUD_API_KEY"),
-            verify_ssl=False,
+            api_key=self._get_secret("GT_CLOUD_API_KEY"),
         )
         self._gt_cloud_bucket_id: str | None = None
         self.pickle_control_flow_result = pickle_control_flow_result
@@ -112,18 +117,25 @@ class GriptapeCloudPublisher(GriptapeCloudApiMixin):
 
             self._create_run_input = self._gather_griptape_cloud_start_flow_input(workflow_shape)
 
-            # Package the workflow
-            package_path = self._package_workflow(self._workflow_name)
-            logger.info("Workflow packaged to path: %s", package_path)
+            # Package the workflow. By default, the package is zipped while it is being uploaded instead of to disk.
+            package: WorkflowPackageBuilder | str
+            with GriptapeCloudInstrumentation.phase("publish.package", workflow=self._workflow_name):
+                if get_bool_setting("GT_CLOUD_PUBLISH_STREAM_PACKAGE", default=True):
+                    package = self._create_workflow_package(self._workflow_name)
+                else:
+                    package = self._package_workflow(self._workflow_name)
+                    logger.info("Workflow packaged to path: %s", package)
 
             # Deploy the workflow to Griptape Cloud
-            structure = self._deploy_workflow_to_cloud(package_path)
+            with GriptapeCloudInstrumentation.phase("publish.deploy", workflow=self._workflow_name):
+                structure = self._deploy_workflow_to_cloud(package)
             logger.info(
                 "Workflow '%s' published successfully to Structure: %s", self._workflow_name, structure.structure_id
             )
 
             # Generate an executor workflow that can invoke the published structure
-            executor_workflow_path = self._generate_executor_workflow(structure.structure_id, workflow_shape)
+            with GriptapeCloudInstrumentation.phase("publish.generate_executor", workflow=self._workflow_name):
+                executor_workflow_path = self._generate_executor_workflow(structure.structure_id, workflow_shape)
 
             return PublishWorkflowResultSuccess(
                 published_workflow_file_path=str(executor_workflow_path),
@@ -201,49 +213,147 @@ class GriptapeCloudPublisher(GriptapeCloudApiMixin):
 
         return workflow_input
 
-    def _upload_file_to_data_lake(self, name: str, value: bytes, bucket_id: str) -> None:
-        create_asset_response = create_asset(
-            client=self._gtc_client,
-            bucket_id=bucket_id,
-            body=CreateAssetRequestContent(
-                name=name,
-            ),
-        )
-        if not isinstance(create_asset_response, CreateAssetResponseContent):
-            msg = f"Unexpected response type when creating asset: {type(create_asset_response)}"
-            logger.error(msg)
-            raise TypeError(msg)
+    @property
+    def gtc_client(self) -> AuthenticatedClient:
+        return self._gtc_client
 
-        create_asset_url_response = create_asset_url(
-            client=self._gtc_client,
-            bucket_id=bucket_id,
-            name=name,
-            body=CreateAssetUrlRequestContent(operation=AssertUrlOperation.PUT),
+    def _get_package_asset_name(self, name_prefix: str, content_hash: str) -> str:
+        """Returns the content-addressed asset name of a package, e.g. `{structure_id}/{workflow}-{digest}.zip`."""
+        return f"{name_prefix}-{content_hash.partition(':')[2][:PACKAGE_DIGEST_LENGTH]}.zip"
+
+    def _find_uploaded_package(self, bucket_id: str, content_hash: str, structure_id: str) -> str | None:
+        """Returns an uploaded package asset with the same content, if there is one.
+
+        Only content-addressed assets are reused. An asset whose name does not carry its hash may be overwritten
+        when its own structure is republished, which would silently change the code of every structure pointing at it.
+        Assets of other structures that are updated in place are not reused either, since republishing those deletes
+        the assets they no longer use.
+        """
+        suffix = self._get_package_asset_name("", content_hash)
+        other_prefixes = tuple(
+            f"{other_structure_id}/"
+            for other_structure_id in PublishedStructureIndex.get_structure_ids()
+            if other_structure_id != structure_id
         )
-        if not isinstance(create_asset_url_response, CreateAssetUrlResponseContent):
-            msg = f"Unexpected response type when creating asset URL: {type(create_asset_url_response)}"
-            logger.error(msg)
-            raise TypeError(msg)
-        url = create_asset_url_response.url
-        headers = create_asset_url_response.headers
+        return self._find_uploaded_asset(
+            bucket_id,
+            content_hash,
+            name_filter=lambda name: name.endswith(suffix) and not name.startswith(other_prefixes),
+        )
+
+    def _upload_file_to_data_lake(self, file_path: Path, name_prefix: str, bucket_id: str, structure_id: str) -> str:
+        """Uploads the file to the bucket under a content-addressed name and returns its asset path.
+
+        If an identical package was already uploaded to the bucket, the existing asset is reused instead.
+        """
+        content_hash = AssetHashIndex.hash_file(file_path)
+        name = self._get_package_asset_name(name_prefix, content_hash)
         try:
-            response = self._client.put(
-                url=url,
-                headers=headers.to_dict(),
-                content=value,
-            )
-            response.raise_for_status()
+            with GriptapeCloudInstrumentation.phase("publish.upload", size=file_path.stat().st_size):
+                existing_asset_name = self._find_uploaded_package(bucket_id, content_hash, structure_id)
+                if existing_asset_name is not None:
+                    logger.info("Reusing identical asset %s instead of uploading %s", existing_asset_name, name)
+                    return existing_asset_name
+                self._upload_asset_file(file_path, name, bucket_id, deduplicate=False)
         except Exception:
             msg = "Failed to upload file to data lake"
             logger.exception(msg)
             raise
+        return name
 
-    def _deploy_workflow_to_cloud(self, package_path: str) -> UpdateStructureResponseContent:
-        if self._gt_cloud_bucket_id is None:
-            details = "GT_CLOUD_PUBLISH_BUCKET_ID is not set in the configuration."
-            logger.error(details)
-            raise ValueError(details)
+    def _upload_package_to_data_lake(
+        self,
+        package: WorkflowPackageBuilder,
+        name_prefix: str,
+        bucket_id: str,
+        structure_id: str,
+    ) -> str:
+        """Zips the package while uploading it to the bucket under a content-addressed name; returns its asset path.
+
+        The package is first produced without being stored to learn its hash, so that an identical package that was
+        already uploaded is reused instead. That pass fills the package cache, so the upload only reads it back.
+        """
+        try:
+            dry_run = package.dry_run()
+            name = self._get_package_asset_name(name_prefix, dry_run.content_hash)
+            with GriptapeCloudInstrumentation.phase("publish.upload", size=dry_run.size):
+                existing_asset_name = self._find_uploaded_package(bucket_id, dry_run.content_hash, structure_id)
+                if existing_asset_name is not None:
+                    logger.info("Reusing identical asset %s instead of uploading %s", existing_asset_name, name)
+                    return existing_asset_name
+                self._upload_asset_stream(package.iter_archive(), name, bucket_id)
+        except Exception:
+            msg = "Failed to upload package to data lake"
+            logger.exception(msg)
+            raise
+        return name
+
+    def _upload_layered_package(
+        self, package: WorkflowPackageBuilder, structure_id: str, bucket_id: str
+    ) -> tuple[str, list[str]]:
+        """Uploads each library of the package as a layer of its own; returns the asset paths of the rest and the layers.
+
+        Layers are named after their content hash and only uploaded when the bucket has no identical one yet, so
+        republishing a workflow after a small edit only uploads the few kilobytes of the workflow and its config.
+        The layers are listed in `layers.json`, which the structure's post-build script reads to fetch them. The
+        engine requirements stay in the package itself, since the structure build reads them from there.
+        """
+        layers: list[dict[str, str]] = []
+        for layer_name, layer in package.split("libraries").items():
+            asset_path = self._upload_package_to_data_lake(
+                layer, name_prefix=f"{structure_id}/layers/{layer_name}", bucket_id=bucket_id, structure_id=structure_id
+            )
+            layers.append(
+                {
+                    "name": layer_name,
+                    "bucket_id": bucket_id,
+                    "asset_path": asset_path,
+                    "content_hash": cast("PackageBuildResult", layer.result).content_hash,
+                }
+            )
+        package.add_bytes(LAYERS_FILE_NAME, json.dumps({"base_url": self._get_base_url(), "layers": layers}, indent=4))
 
+        asset_path = self._upload_package_to_data_lake(
+            package, name_prefix=f"{structure_id}/{self._workflow_name}", bucket_id=bucket_id, structure_id=structure_id
+        )
+        return asset_path, [layer["asset_path"] for layer in layers]
+
+    def _get_published_structure_key(self) -> str:
+        return PublishedStructureIndex.make_key(self._get_base_url(), self._workflow_name)
+
+    def _get_published_structure(self) -> PublishedStructure | None:
+        """Returns the structure the workflow was last published to from here, if it still exists."""
+        key = self._get_published_structure_key()
+        published_structure = PublishedStructureIndex.get(key)
+        if published_structure is None:
+            return None
+        if self._find_structure(published_structure.structure_id) is None:
+            logger.info(
+                "Structure %s that workflow '%s' was published to no longer exists. Creating a new one.",
+                published_structure.structure_id,
+                self._workflow_name,
+            )
+            PublishedStructureIndex.invalidate(key)
+            return None
+        return published_structure
+
+    def _delete_unused_assets(self, previous: PublishedStructure, current: PublishedStructure) -> None:
+        """Deletes the assets of the previous publish of a structure that its current code no longer uses.
+
+        Only assets under the structure's own `{structure_id}/` prefix are deleted; assets it reused from elsewhere
+        are left alone. Failing to delete one only leaves it behind in the bucket.
+        """
+        prefix = f"{previous.structure_id}/"
+        for asset_path in sorted(previous.asset_paths - current.asset_paths):
+            if previous.bucket_id != current.bucket_id or not asset_path.startswith(prefix):
+                continue
+            try:
+                self._delete_asset(asset_path, previous.bucket_id)
+                logger.info("Deleted asset %s, which structure %s no longer uses", asset_path, previous.structure_id)
+            except Exception as e:
+                logger.warning("Failed to delete unused asset %s: %s", asset_path, e)
+
+    def _create_structure(self) -> str:
         create_structure_response = create_structure(
             client=self._gtc_client,
             body=CreateStructureRequestContent(
@@ -256,17 +366,56 @@ class GriptapeCloudPublisher(GriptapeCloudApiMixin):
             msg = f"Unexpected response type when creating structure: {type(create_structure_response)}"
             logger.error(msg)
             raise TypeError(msg)
+        self._invalidate_cached_listing("structures")
+        return create_structure_response.structure_id
+
+    def _deploy_workflow_to_cloud(self, package: WorkflowPackageBuilder | str) -> UpdateStructureResponseContent:
+        """Points a structure for the workflow at the uploaded package.
+
+        By default, every publish creates a new structure. In update-in-place mode
+        (`GT_CLOUD_PUBLISH_UPDATE_IN_PLACE`), the structure the workflow was last published to is updated instead,
+        and a streamed package is uploaded in layers so that only the parts that changed are uploaded.
 
-        with Path(package_path).open("rb") as file:
-            file_contents = file.read()
-            file_name = Path(package_path).name
+        Args:
+            package: The package to stream to the bucket, or the path of an already built package file.
+        """
+        if self._gt_cloud_bucket_id is None:
+            details = "GT_CLOUD_PUBLISH_BUCKET_ID is not set in the configuration."
+            logger.error(details)
+            raise ValueError(details)
 
-        asset_name = f"{create_structure_response.structure_id}/{file_name}"
-        self._upload_file_to_data_lake(name=asset_name, value=file_contents, bucket_id=self._gt_cloud_bucket_id)
+        update_in_place = get_bool_setting("GT_CLOUD_PUBLISH_UPDATE_IN_PLACE", default=False)
+        previous = self._get_published_structure() if update_in_place else None
+        if previous is None:
+            structure_id = self._create_structure()
+        else:
+            structure_id = previous.structure_id
+            logger.info("Updating structure %s in place", structure_id)
+
+        layer_asset_paths: list[str] = []
+        if isinstance(package, WorkflowPackageBuilder):
+            if update_in_place:
+                asset_name, layer_asset_paths = self._upload_layered_package(
+                    package, structure_id, self._gt_cloud_bucket_id
+                )
+            else:
+                asset_name = self._upload_package_to_data_lake(
+                    package,
+                    name_prefix=f"{structure_id}/{self._workflow_name}",
+                    bucket_id=self._gt_cloud_bucket_id,
+                    structure_id=structure_id,
+                )
+        else:
+            asset_name = self._upload_file_to_data_lake(
+                file_path=Path(package),
+                name_prefix=f"{structure_id}/{Path(package).stem}",
+                bucket_id=self._gt_cloud_bucket_id,
+                structure_id=structure_id,
+            )
 
         update_structure_response = update_structure(
             client=self._gtc_client,
-            structure_id=create_structure_response.structure_id,
+            structure_id=structure_id,
             body=UpdateStructureRequestContent(
                 structure_config_file="structure_config.yaml",
                 code=StructureCodeType1(
@@ -281,50 +430,85 @@ class GriptapeCloudPublisher(GriptapeCloudApiMixin):
             msg = f"Unexpected response type when updating structure: {type(update_structure_response)}"
             logger.error(msg)
             raise TypeError(msg)
+        # Structure nodes list structures with their latest code and deployment, which this update changed.
+        self._invalidate_cached_listing("structures")
 
+        if update_in_place:
+            current = PublishedStructure(
+                structure_id=structure_id,
+                bucket_id=self._gt_cloud_bucket_id,
+                asset_path=asset_name,
+                layer_asset_paths=layer_asset_paths,
+            )
+            PublishedStructureIndex.record(self._get_published_structure_key(), current)
+            if previous is not None:
+                self._delete_unused_assets(previous, current)
         return update_structure_response
 
-    def _copy_libraries_to_path_for_workflow(
+    def _add_libraries_to_package(
         self,
+        builder: WorkflowPackageBuilder,
         node_libraries: list[LibraryNameAndVersion],
-        destination_path: Path,
         runtime_env_path: Path,
         workflow: Workflow,
     ) -> list[str]:
-        """Copies the libraries to the specified path for the workflow, returning the list of library paths.
+        """Adds the libraries to the workflow package under `libraries/`, returning the list of library paths.
 
-        This is used to package the workflow for publishing.
+        Libraries are resolved and their directories walked concurrently. Files and directories matching
+        `GT_CLOUD_PUBLISH_EXCLUDE_PATTERNS` are left out, in addition to virtual environments and bytecode caches.
         """
-        library_paths: list[str] = []
-
-        for library_ref in node_libraries:
-            library = GriptapeNodes.LibraryManager().get_library_info_by_library_name(library_ref.library_name)
+        start_time = time.monotonic()
+        with ThreadPoolExecutor() as executor:
+            collected = list(
+                executor.map(
+                    lambda library_ref: self._collect_library(library_ref, runtime_env_path, workflow), node_libraries
+                )
+            )
 
-            if library is None:
-                details = f"Attempted to publish workflow '{workflow.metadata.name}', but failed gathering library info for library '{library_ref.library_name}'."
-                logger.error(details)
-                raise ValueError(details)
+        ignore_patterns = [
+            *DEFAULT_IGNORE_PATTERNS,
+            *get_list_setting("GT_CLOUD_PUBLISH_EXCLUDE_PATTERNS", DEFAULT_PUBLISH_EXCLUDE_PATTERNS),
+        ]
+        builder.add_trees(
+            [(f"libraries/{common_root.name}", common_root) for _, common_root in collected if common_root],
+            ignore_patterns=ignore_patterns,
+        )
+        logger.info("Collected %d libraries in %.2fs", len(collected), time.monotonic() - start_time)
+        return [library_path for library_path, _ in collected]
 
-            library_data = LibraryRegistry.get_library(library_ref.library_name).get_library_data()
+    def _collect_library(
+        self, library_ref: LibraryNameAndVersion, runtime_env_path: Path, workflow: Workflow
+    ) -> tuple[str, Path | None]:
+        """Returns the path the library is registered from at runtime, and the directory to package, if any."""
+        library = GriptapeNodes.LibraryManager().get_library_info_by_library_name(library_ref.library_name)
 
-            if library.library_path.endswith(".json"):
-                library_path = Path(library.library_path)
-                absolute_library_path = library_path.resolve()
-                abs_paths = [absolute_library_path]
-                for node in library_data.nodes:
-                    p = (library_path.parent / Path(node.file_path)).resolve()
-                    abs_paths.append(p)
-                common_root = Path(os.path.commonpath([str(p) for p in abs_paths]))
-                dest = destination_path / common_root.name
-                shutil.copytree(
-                    common_root, dest, dirs_exist_ok=True, ignore=shutil.ignore_patterns(".venv", "__pycache__")
-                )
-                library_path_relative_to_common_root = absolute_library_path.relative_to(common_root)
-                library_paths.append(str(runtime_env_path / common_root.name / library_path_relative_to_common_root))
-            else:
-                library_paths.append(library.library_path)
+        if library is None:
+            details = f"Attempted to publish workflow '{workflow.metadata.name}', but failed gathering library info for library '{library_ref.library_name}'."
+            logger.error(details)
+            raise ValueError(details)
 
-        return library_paths
+        if not library.library_path.endswith(".json"):
+            return library.library_path, None
+
+        library_data = LibraryRegistry.get_library(library_ref.library_name).get_library_data()
+        library_path = Path(library.library_path)
+        absolute_library_path = library_path.resolve()
+        abs_paths = [absolute_library_path]
+        for node in library_data.nodes:
+            p = (library_path.parent / Path(node.file_path)).resolve()
+            abs_paths.append(p)
+        common_root = Path(os.path.commonpath([str(p) for p in abs_paths]))
+        library_path_relative_to_common_root = absolute_library_path.relative_to(common_root)
+        return str(runtime_env_path / common_root.name / library_path_relative_to_common_root), common_root
+
+    def _get_library_pip_dependencies(self, node_libraries: list[LibraryNameAndVersion]) -> list[str]:
+        """Returns the pip dependencies that the libraries declare in their metadata."""
+        pip_dependencies: list[str] = []
+        for library_ref in node_libraries:
+            library_data = LibraryRegistry.get_library(library_ref.library_name).get_library_data()
+            dependencies = getattr(library_data.metadata, "dependencies", None)
+            pip_dependencies.extend(getattr(dependencies, "pip_dependencies", None) or [])
+        return pip_dependencies
 
     def __get_install_source(self) -> tuple[Literal["git", "file", "pypi"], str | None]:
         """Determines the install source of the Griptape Nodes package.
@@ -397,7 +581,16 @@ class GriptapeCloudPublisher(GriptapeCloudApiMixin):
         for key, val in env_file_dict.items():
             set_key(env_file_path, key, str(val))
 
-    def _package_workflow(self, workflow_name: str) -> str:  # noqa: PLR0915
+    def _package_workflow(self, workflow_name: str) -> str:
+        """Builds the workflow package into the workspace and returns the path of the zip file."""
+        config_manager = GriptapeNodes.get_instance()._config_manager
+        result = self._create_workflow_package(workflow_name).build(
+            config_manager.workspace_path / f"{workflow_name}.zip"
+        )
+        return str(result.path)
+
+    def _create_workflow_package(self, workflow_name: str) -> WorkflowPackageBuilder:  # noqa: PLR0915
+        """Gathers the files of the workflow package, which can then be built to a file or streamed."""
         config_manager = GriptapeNodes.get_instance()._config_manager
         secrets_manager = GriptapeNodes.get_instance()._secrets_manager
         workflow = WorkflowRegistry.get_workflow_by_name(workflow_name)
@@ -427,6 +620,7 @@ class GriptapeCloudPublisher(GriptapeCloudApiMixin):
         structure_config_file_path = publish_workflow_path / "structure_config.yaml"
         pre_build_install_script_path = publish_workflow_path / "pre_build_install_script.sh"
         post_build_install_script_path = publish_workflow_path / "post_build_install_script.sh"
+        fetch_layers_script_path = publish_workflow_path / "fetch_layers_script.py"
         # Note: register_libraries_script.py might need to be created if it doesn't exist
         register_libraries_script_path = publish_workflow_path / "register_libraries_script.py"
         full_workflow_file_path = WorkflowRegistry.get_complete_file_path(workflow.file_path)
@@ -436,94 +630,84 @@ class GriptapeCloudPublisher(GriptapeCloudApiMixin):
         config = config_manager.user_config
         config["workspace_directory"] = packaged_top_level_dir
 
-        # Create a temporary directory to perform the packaging
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_dir_path = Path(tmp_dir)
-            temp_workflow_file_path = tmp_dir_path / "workflow.py"
-            temp_structure_path = tmp_dir_path / "structure.py"
-            temp_structure_workflow_executor_path = tmp_dir_path / "structure_workflow_executor.py"
-            temp_pre_build_install_script_path = tmp_dir_path / "pre_build_install_script.sh"
-            temp_post_build_install_script_path = tmp_dir_path / "post_build_install_script.sh"
-            temp_register_libraries_script_path = tmp_dir_path / "register_libraries_script.py"
-            config_file_path = tmp_dir_path / "GriptapeNodes" / "griptape_nodes_config.json"
-            init_file_path = tmp_dir_path / "__init__.py"
-
-            try:
-                # Copy the workflow file, libraries, and structure files to the temporary directory
-                shutil.copyfile(full_workflow_file_path, temp_workflow_file_path)
-                shutil.copyfile(structure_workflow_executor_file_path, temp_structure_workflow_executor_path)
-                shutil.copyfile(pre_build_install_script_path, temp_pre_build_install_script_path)
-                shutil.copyfile(post_build_install_script_path, temp_post_build_install_script_path)
-                shutil.copyfile(structure_config_file_path, tmp_dir_path / "structure_config.yaml")
-
-                # Write the environment variables to the .env file
-                self._write_env_file(tmp_dir_path / ".env", env_file_mapping)
-
-                # Get the library paths
-                library_paths: list[str] = self._copy_libraries_to_path_for_workflow(
-                    node_libraries=workflow.metadata.node_libraries_referenced,
-                    destination_path=tmp_dir_path / "libraries",
-                    runtime_env_path=Path(packaged_top_level_dir) / "libraries",
-                    workflow=workflow,
-                )
-                config["app_events"] = {
-                    "on_app_initialization_complete": {
-                        "workflows_to_register": [],
-                        "libraries_to_register": library_paths,
-                    }
+        # Files on disk are added where they are, so unchanged ones are reused from the package cache.
+        builder = WorkflowPackageBuilder()
+        try:
+            builder.add_file("workflow.py", Path(full_workflow_file_path))
+            builder.add_file("structure_workflow_executor.py", structure_workflow_executor_file_path)
+            builder.add_file("pre_build_install_script.sh", pre_build_install_script_path)
+            builder.add_file("post_build_install_script.sh", post_build_install_script_path)
+            builder.add_file("fetch_layers_script.py", fetch_layers_script_path)
+            builder.add_file("structure_config.yaml", structure_config_file_path)
+
+            # Write the environment variables to the .env file
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                env_file_path = Path(tmp_dir) / ".env"
+                self._write_env_file(env_file_path, env_file_mapping)
+                builder.add_bytes(".env", env_file_path.read_bytes())
+
+            # Get the library paths
+            library_paths: list[str] = self._add_libraries_to_package(
+                builder=builder,
+                node_libraries=workflow.metadata.node_libraries_referenced,
+                runtime_env_path=Path(packaged_top_level_dir) / "libraries",
+                workflow=workflow,
+            )
+            config["app_events"] = {
+                "on_app_initialization_complete": {
+                    "workflows_to_register": [],
+                    "libraries_to_register": library_paths,
                 }
-                library_paths_formatted = [f'"{library_path}"' for library_path in library_paths]
+            }
+            library_paths_formatted = [f'"{library_path}"' for library_path in library_paths]
 
-                with register_libraries_script_path.open("r", encoding="utf-8") as register_libraries_script_file:
-                    register_libraries_script_contents = register_libraries_script_file.read()
-                    register_libraries_script_contents = register_libraries_script_contents.replace(
-                        '["REPLACE_LIBRARY_PATHS"]',
-                        f"[{', '.join(library_paths_formatted)}]",
-                    )
-                with temp_register_libraries_script_path.open("w", encoding="utf-8") as register_libraries_script_file:
-                    register_libraries_script_file.write(register_libraries_script_contents)
-
-                with structure_file_path.open("r", encoding="utf-8") as structure_file:
-                    structure_file_contents = structure_file.read()
-                    structure_file_contents = structure_file_contents.replace(
-                        '["REPLACE_LIBRARIES"]',
-                        f"[{', '.join(library_paths_formatted)}]",
-                    )
-                    structure_file_contents = structure_file_contents.replace(
-                        '"REPLACE_PICKLE_DEFAULT"',
-                        "True" if self.pickle_control_flow_result else "False",
-                    )
-                with temp_structure_path.open("w", encoding="utf-8") as structure_file:
-                    structure_file.write(structure_file_contents)
+            register_libraries_script_contents = register_libraries_script_path.read_text(encoding="utf-8").replace(
+                '["REPLACE_LIBRARY_PATHS"]',
+                f"[{', '.join(library_paths_formatted)}]",
+            )
+            builder.add_bytes("register_libraries_script.py", register_libraries_script_contents)
 
-                config_file_path.parent.mkdir(parents=True, exist_ok=True)
-                with config_file_path.open("w", encoding="utf-8") as config_file:
-                    config_file.write(json.dumps(config, indent=4))
+            structure_file_contents = structure_file_path.read_text(encoding="utf-8")
+            structure_file_contents = structure_file_contents.replace(
+                '["REPLACE_LIBRARIES"]',
+                f"[{', '.join(library_paths_formatted)}]",
+            )
+            structure_file_contents = structure_file_contents.replace(
+                '"REPLACE_PICKLE_DEFAULT"',
+                "True" if self.pickle_control_flow_result else "False",
+            )
+            builder.add_bytes("structure.py", structure_file_contents)
 
-                init_file_path.parent.mkdir(parents=True, exist_ok=True)
-                with init_file_path.open("w", encoding="utf-8") as init_file:
-                    init_file.write('"""This is a temporary __init__.py file for the structure."""\n')
+            config_file_contents = json.dumps(config, indent=4)
+            builder.add_bytes("GriptapeNodes/griptape_nodes_config.json", config_file_contents)
+            builder.add_bytes("griptape_nodes_config.json", config_file_contents)
 
-                shutil.copyfile(config_file_path, tmp_dir_path / "griptape_nodes_config.json")
+            builder.add_bytes("__init__.py", '"""This is a temporary __init__.py file for the structure."""\n')
 
-            except Exception as e:
-                details = f"Failed to copy files to temporary directory. Error: {e}"
-                logger.exception(details)
-                raise
-
-            # Create the requirements.txt file using the correct engine version
-            source, commit_id = self.__get_install_source()
-            if source == "git" and commit_id is not None:
-                engine_version = commit_id
-            requirements_file_path = tmp_dir_path / "requirements.txt"
-            with requirements_file_path.open("w", encoding="utf-8") as requirements_file:
-                requirements_file.write(
-                    f"griptape-nodes @ git+https://github.com/griptape-ai/griptape-nodes.git@{engine_version}\n"
-                )
+        except Exception as e:
+            details = f"Failed to gather the files of the workflow package. Error: {e}"
+            logger.exception(details)
+            raise
+
+        # Create the requirements.txt file using the correct engine version
+        source, commit_id = self.__get_install_source()
+        if source == "git" and commit_id is not None:
+            engine_version = commit_id
+        engine_requirement = f"griptape-nodes @ git+https://github.com/griptape-ai/griptape-nodes.git@{engine_version}"
+        # Opt-in with GT_CLOUD_PUBLISH_LOCK_REQUIREMENTS; by default requirements.txt only holds the engine.
+        if get_bool_setting("GT_CLOUD_PUBLISH_LOCK_REQUIREMENTS", default=False):
+            # Library dependencies go into the structure's cached build instead of being installed on every deploy.
+            requirements = RequirementsLock.resolve(
+                [
+                    engine_requirement,
+                    *self._get_library_pip_dependencies(workflow.metadata.node_libraries_referenced),
+                ]
+            )
+        else:
+            requirements = f"{engine_requirement}\n"
+        builder.add_bytes("requirements.txt", requirements)
 
-            archive_base_name = config_manager.workspace_path / workflow_name
-            shutil.make_archive(str(archive_base_name), "zip", tmp_dir)
-            return str(archive_base_name) + ".zip"
+        return builder
 
     def _generate_executor_workflow(self, structure_id: str, workflow_shape: dict[str, Any]) -> Path:
         """Generate a new workflow file that can execute the published structure.
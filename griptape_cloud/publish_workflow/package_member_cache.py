@@ -0,0 +1,143 @@
+import logging
+import os
+import threading
+import time
+import zlib
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import ClassVar
+
+from base.constants import MEGABYTE
+from base.griptape_cloud_settings import get_cache_directory, get_int_setting
+from base.json_store import load_json, save_json
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PACKAGE_CACHE_MAX_SIZE_MB = 1024
+COMPRESSION_LEVEL = 6
+CHUNK_SIZE = MEGABYTE
+INDEX_FILE_NAME = "index.json"
+
+
+@dataclass
+class CompressedMember:
+    """A file's content, deflated as a raw zip member, along with what its zip headers need."""
+
+    crc32: int
+    size: int
+    compressed_size: int
+    last_used: float
+
+
+class PackageMemberCache:
+    """Content-addressed, size-bounded on-disk cache of pre-compressed workflow package members.
+
+    Each file is stored once per content hash as a raw deflate stream, so a package member whose content has not
+    changed since an earlier publish is copied into the archive as is instead of being compressed again. When the
+    cache grows past its size limit, the least recently used members are evicted, except those pinned by a build
+    that is still in progress.
+    """
+
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    _members: ClassVar[dict[str, CompressedMember] | None] = None
+    _pins: ClassVar[Counter[str]] = Counter()
+
+    @classmethod
+    @contextmanager
+    def pinned(cls, content_hashes: Iterable[str]) -> Iterator[None]:
+        """Keeps the members from being evicted until the block exits."""
+        pins = Counter(set(content_hashes))
+        with cls._lock:
+            cls._pins += pins
+        try:
+            yield
+        finally:
+            with cls._lock:
+                cls._pins -= pins
+
+    @classmethod
+    def get(cls, content_hash: str) -> tuple[CompressedMember, Path] | None:
+        """Returns the cached member and the path of its compressed data, or None if it is not cached."""
+        with cls._lock:
+            member = cls._load().get(content_hash)
+            if member is None:
+                return None
+            blob_path = cls._blob_path(content_hash)
+            # The archive's offsets are computed from the recorded size, so a damaged blob counts as a miss.
+            if not blob_path.exists() or blob_path.stat().st_size != member.compressed_size:
+                del cls._load()[content_hash]
+                return None
+            member.last_used = time.time()
+            return member, blob_path
+
+    @classmethod
+    def put(cls, content_hash: str, source_path: Path) -> tuple[CompressedMember, Path]:
+        """Compresses the file into the cache and returns the cached member and the path of its compressed data."""
+        blob_path = cls._blob_path(content_hash)
+        temp_path = blob_path.with_name(f".{blob_path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+        temp_path.parent.mkdir(parents=True, exist_ok=True)
+        compressor = zlib.compressobj(COMPRESSION_LEVEL, zlib.DEFLATED, -zlib.MAX_WBITS)
+        crc32 = 0
+        size = 0
+        try:
+            with source_path.open("rb") as source, temp_path.open("wb") as target:
+                while chunk := source.read(CHUNK_SIZE):
+                    crc32 = zlib.crc32(chunk, crc32)
+                    size += len(chunk)
+                    target.write(compressor.compress(chunk))
+                target.write(compressor.flush())
+            temp_path.replace(blob_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        member = CompressedMember(
+            crc32=crc32, size=size, compressed_size=blob_path.stat().st_size, last_used=time.time()
+        )
+        with cls._lock:
+            cls._load()[content_hash] = member
+        return member, blob_path
+
+    @classmethod
+    def save(cls) -> None:
+        """Evicts members past the size limit, keeping those used most recently, and persists the index."""
+        with cls._lock:
+            members = cls._load()
+            max_size = (
+                get_int_setting("GT_CLOUD_PACKAGE_CACHE_MAX_SIZE_MB", DEFAULT_PACKAGE_CACHE_MAX_SIZE_MB) * MEGABYTE
+            )
+            total_size = sum(member.compressed_size for member in members.values())
+            for content_hash, member in sorted(members.items(), key=lambda item: item[1].last_used):
+                if total_size <= max_size:
+                    break
+                if content_hash in cls._pins:
+                    continue
+                cls._blob_path(content_hash).unlink(missing_ok=True)
+                del members[content_hash]
+                total_size -= member.compressed_size
+            save_json(
+                cls._cache_directory() / INDEX_FILE_NAME,
+                {content_hash: asdict(member) for content_hash, member in members.items()},
+            )
+
+    @classmethod
+    def _cache_directory(cls) -> Path:
+        return get_cache_directory("package_members", f"deflate-{COMPRESSION_LEVEL}")
+
+    @classmethod
+    def _blob_path(cls, content_hash: str) -> Path:
+        algorithm, _, digest = content_hash.partition(":")
+        return cls._cache_directory() / "blobs" / algorithm / digest[:2] / digest
+
+    @classmethod
+    def _load(cls) -> dict[str, CompressedMember]:
+        if cls._members is None:
+            cls._members = {}
+            data = load_json(cls._cache_directory() / INDEX_FILE_NAME, "package cache index") or {}
+            try:
+                cls._members = {key: CompressedMember(**value) for key, value in data.items()}
+            except (AttributeError, TypeError) as e:
+                logger.warning("Ignoring unreadable package cache index: %s", e)
+        return cls._members
@@ -1,3 +1,4 @@
 #!/bin/bash
 
+python fetch_layers_script.py
 python register_libraries_script.py
\ No newline at end of file
@@ -0,0 +1,82 @@
+import logging
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import ClassVar
+
+from base.griptape_cloud_settings import get_cache_directory
+from base.json_store import load_json, save_json
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE_NAME = "index.json"
+
+
+@dataclass
+class PublishedStructure:
+    structure_id: str
+    bucket_id: str
+    asset_path: str
+    # The layers listed in the package's `layers.json`.
+    layer_asset_paths: list[str] = field(default_factory=list)
+
+    @property
+    def asset_paths(self) -> set[str]:
+        """Returns every asset the structure's code is made of."""
+        return {self.asset_path, *self.layer_asset_paths}
+
+
+class PublishedStructureIndex:
+    """Persistent index of the structure each workflow was last published to from this machine.
+
+    Workflows are keyed by base URL and workflow name, so publishing a workflow again in update-in-place mode
+    updates its structure instead of creating a new one.
+    """
+
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    _structures: ClassVar[dict[str, PublishedStructure] | None] = None
+
+    @classmethod
+    def make_key(cls, base_url: str, workflow_name: str) -> str:
+        return f"{base_url.rstrip('/')}|{workflow_name}"
+
+    @classmethod
+    def get(cls, key: str) -> PublishedStructure | None:
+        with cls._lock:
+            return cls._load().get(key)
+
+    @classmethod
+    def get_structure_ids(cls) -> set[str]:
+        with cls._lock:
+            return {structure.structure_id for structure in cls._load().values()}
+
+    @classmethod
+    def record(cls, key: str, structure: PublishedStructure) -> None:
+        with cls._lock:
+            cls._load()[key] = structure
+            cls._save()
+
+    @classmethod
+    def invalidate(cls, key: str) -> None:
+        with cls._lock:
+            if cls._load().pop(key, None) is not None:
+                cls._save()
+
+    @classmethod
+    def _index_path(cls) -> Path:
+        return get_cache_directory("published_structures") / INDEX_FILE_NAME
+
+    @classmethod
+    def _load(cls) -> dict[str, PublishedStructure]:
+        if cls._structures is None:
+            cls._structures = {}
+            data = load_json(cls._index_path(), "published structure index") or {}
+            try:
+                cls._structures = {key: PublishedStructure(**value) for key, value in data.items()}
+            except (AttributeError, TypeError) as e:
+                logger.warning("Ignoring unreadable published structure index: %s", e)
+        return cls._structures
+
+    @classmethod
+    def _save(cls) -> None:
+        save_json(cls._index_path(), {key: asdict(structure) for key, structure in (cls._structures or {}).items()})
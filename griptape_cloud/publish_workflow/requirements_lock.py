@@ -0,0 +1,107 @@
+import hashlib
+import logging
+import shutil
+import subprocess
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from base.griptape_cloud_settings import get_cache_directory, get_float_setting
+from base.json_store import write_text_atomically
+
+logger = logging.getLogger(__name__)
+
+# Must match `runtime_version` in structure_config.yaml, so that the lock resolves for the interpreter it runs on.
+STRUCTURE_PYTHON_VERSION = "3.12"
+STRUCTURE_PYTHON_PLATFORM = "x86_64-unknown-linux-gnu"
+DEFAULT_LOCK_TTL_HOURS = 24.0
+DEFAULT_RESOLVE_TIMEOUT_SECONDS = 120.0
+
+
+class RequirementsLock:
+    """Resolves the requirements of a published structure into a pinned, sorted requirements file.
+
+    Structures cache their build dependencies for as long as `requirements.txt` does not change, so a lock that
+    comes out byte-identical for the same inputs lets redeploys skip installing dependencies entirely. Locks are
+    resolved with `uv pip compile` for the structure's Python version and platform, and kept in the local cache for
+    `GT_CLOUD_REQUIREMENTS_LOCK_TTL_HOURS`, after which moving references such as branches are resolved again.
+    Resolving needs network access and may clone git requirements, so it gives up after
+    `GT_CLOUD_REQUIREMENTS_LOCK_TIMEOUT_SECONDS`. When uv is not available or resolution fails or times out, the
+    last lock resolved for the same requirements is reused even past its TTL, so a flaky network does not change the
+    file and invalidate the structure's cached build. Only requirements that were never resolved are written sorted
+    and unpinned instead.
+    """
+
+    @classmethod
+    def resolve(cls, requirements: Iterable[str]) -> str:
+        """Returns the contents of a requirements file that pins the requirements and all of their dependencies."""
+        requirements = sorted({requirement.strip() for requirement in requirements if requirement.strip()})
+        unpinned = "".join(f"{requirement}\n" for requirement in requirements)
+
+        lock_path = cls._lock_path(unpinned)
+        previous_lock, lock_age = cls._read_lock(lock_path)
+        ttl_seconds = get_float_setting("GT_CLOUD_REQUIREMENTS_LOCK_TTL_HOURS", DEFAULT_LOCK_TTL_HOURS) * 3600
+        if previous_lock is not None and lock_age < ttl_seconds:
+            return previous_lock
+
+        lock = cls._compile(unpinned)
+        if lock is None:
+            if previous_lock is not None:
+                logger.warning("Reusing the requirements lock resolved %.1f hours ago.", lock_age / 3600)
+                return previous_lock
+            logger.warning("Publishing requirements without pinning their versions.")
+            return unpinned
+
+        write_text_atomically(lock_path, lock)
+        logger.info("Resolved %d requirements into %d pinned packages", len(requirements), len(lock.splitlines()))
+        return lock
+
+    @classmethod
+    def _read_lock(cls, lock_path: Path) -> tuple[str | None, float]:
+        """Returns the lock resolved earlier for the same requirements and its age in seconds, if there is one."""
+        try:
+            return lock_path.read_text(encoding="utf-8"), time.time() - lock_path.stat().st_mtime
+        except OSError:
+            return None, 0.0
+
+    @classmethod
+    def _compile(cls, unpinned: str) -> str | None:
+        """Resolves the requirements with uv, or returns None if uv is not installed or resolution fails."""
+        uv_path = shutil.which("uv")
+        if uv_path is None:
+            logger.warning("uv is not installed, so the requirements cannot be resolved.")
+            return None
+        try:
+            result = subprocess.run(  # noqa: S603
+                [
+                    uv_path,
+                    "pip",
+                    "compile",
+                    "-",
+                    "--python-version",
+                    STRUCTURE_PYTHON_VERSION,
+                    "--python-platform",
+                    STRUCTURE_PYTHON_PLATFORM,
+                    "--no-header",
+                    "--no-annotate",
+                    "--quiet",
+                ],
+                input=unpinned,
+                capture_output=True,
+                text=True,
+                check=True,
+                timeout=get_float_setting(
+                    "GT_CLOUD_REQUIREMENTS_LOCK_TIMEOUT_SECONDS", DEFAULT_RESOLVE_TIMEOUT_SECONDS
+                ),
+            )
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as e:
+            logger.warning("Failed to resolve the requirements. Error: %s", getattr(e, "stderr", None) or e)
+            return None
+        # uv writes the pinned packages sorted by name, so the same resolution always gives the same file.
+        return "".join(f"{line}\n" for line in result.stdout.splitlines() if line.strip())
+
+    @classmethod
+    def _lock_path(cls, unpinned: str) -> Path:
+        fingerprint = f"{STRUCTURE_PYTHON_VERSION}|{STRUCTURE_PYTHON_PLATFORM}|{unpinned}"
+        digest = hashlib.sha256(fingerprint.encode()).hexdigest()
+        return get_cache_directory("requirements_locks") / f"{digest}.txt"
@@ -0,0 +1,400 @@
+import fnmatch
+import hashlib
+import logging
+import os
+import stat
+import struct
+import threading
+import time
+import zlib
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, cast
+
+from assets.asset_hash_index import AssetHashIndex
+from publish_workflow.package_member_cache import CHUNK_SIZE, COMPRESSION_LEVEL, CompressedMember, PackageMemberCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IGNORE_PATTERNS = (".venv", "__pycache__")
+
+ZIP64_LIMIT = 0xFFFFFFFF
+ZIP64_COUNT_LIMIT = 0xFFFF
+DEFLATED = 8
+VERSION_DEFAULT = 20
+VERSION_ZIP64 = 45
+UNIX_SYSTEM = 3
+UTF8_FLAG = 0x800
+# Every member gets the earliest timestamp a zip can hold, 1980-01-01 00:00, so identical inputs produce
+# byte-identical archives.
+DOS_DATE = (1 << 5) | 1
+DOS_TIME = 0
+FILE_MODE = 0o100644
+EXECUTABLE_MODE = 0o100755
+
+LOCAL_HEADER = struct.Struct("<IHHHHHIIIHH")
+CENTRAL_HEADER = struct.Struct("<IHHHHHHIIIHHHHHII")
+END_OF_CENTRAL_DIRECTORY = struct.Struct("<IHHHHIIH")
+ZIP64_END_OF_CENTRAL_DIRECTORY = struct.Struct("<IQHHIIQQQQ")
+ZIP64_END_OF_CENTRAL_DIRECTORY_LOCATOR = struct.Struct("<IIQI")
+
+
+@dataclass
+class PackageBuildResult:
+    # None when the package was streamed rather than written to a file.
+    path: Path | None
+    content_hash: str
+    size: int
+    members: int
+    reused: int
+    compressed: int
+    elapsed_seconds: float
+    # Uncompressed bytes of every member, and of the files that had to be read and compressed for this build.
+    input_bytes: int = 0
+    compressed_bytes: int = 0
+
+
+@dataclass
+class _Member:
+    arcname: str
+    mode: int
+    compressed: CompressedMember
+    blob_path: Path | None = None
+    # The file and content hash the cached blob was compressed from, to compress it again if it goes missing.
+    source_path: Path | None = None
+    content_hash: str | None = None
+    # Compressed data of generated contents, which are not cached.
+    data: bytes | None = None
+
+
+def _list_tree(arcname: str, root: Path, ignore_patterns: tuple[str, ...]) -> list[tuple[str, Path]]:
+    def is_ignored(name: str) -> bool:
+        return any(fnmatch.fnmatch(name, pattern) for pattern in ignore_patterns)
+
+    files: list[tuple[str, Path]] = []
+    for directory, directory_names, file_names in os.walk(root, followlinks=True):
+        directory_names[:] = [name for name in directory_names if not is_ignored(name)]
+        relative_directory = Path(directory).relative_to(root)
+        files.extend(
+            ((Path(arcname) / relative_directory / file_name).as_posix(), Path(directory) / file_name)
+            for file_name in file_names
+            if not is_ignored(file_name)
+        )
+    return files
+
+
+def _compress_bytes(content: bytes) -> tuple[CompressedMember, bytes]:
+    compressor = zlib.compressobj(COMPRESSION_LEVEL, zlib.DEFLATED, -zlib.MAX_WBITS)
+    data = compressor.compress(content) + compressor.flush()
+    member = CompressedMember(crc32=zlib.crc32(content), size=len(content), compressed_size=len(data), last_used=0.0)
+    return member, data
+
+
+class WorkflowPackageBuilder:
+    """Builds a deterministic zip of a workflow package from files on disk and generated contents.
+
+    Files are compressed once per content hash into the PackageMemberCache and later builds copy the compressed
+    data straight into the archive, so only files that changed since an earlier publish are read and compressed.
+    Members are written in name order with fixed timestamps, so the same inputs always produce the same archive.
+    Generated contents, such as the `.env` file, are compressed in memory and never cached.
+    """
+
+    def __init__(self) -> None:
+        self._files: dict[str, Path] = {}
+        self._contents: dict[str, bytes] = {}
+        self.result: PackageBuildResult | None = None
+
+    def add_file(self, arcname: str, path: Path) -> None:
+        self._contents.pop(arcname, None)
+        self._files[arcname] = path
+
+    def add_bytes(self, arcname: str, content: bytes | str) -> None:
+        self._files.pop(arcname, None)
+        self._contents[arcname] = content.encode("utf-8") if isinstance(content, str) else content
+
+    def add_tree(self, arcname: str, root: Path, ignore_patterns: Iterable[str] = DEFAULT_IGNORE_PATTERNS) -> None:
+        """Adds every file under the directory, skipping files and directories whose name matches a pattern."""
+        self.add_trees([(arcname, root)], ignore_patterns=ignore_patterns)
+
+    def add_trees(
+        self,
+        trees: Iterable[tuple[str, Path]],
+        ignore_patterns: Iterable[str] = DEFAULT_IGNORE_PATTERNS,
+        max_workers: int | None = None,
+    ) -> None:
+        """Adds every file under each (arcname, directory) pair, walking the directories concurrently."""
+        trees = list(trees)
+        ignore_patterns = tuple(ignore_patterns)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            listings = list(executor.map(lambda tree: _list_tree(*tree, ignore_patterns), trees))
+        for files in listings:
+            for file_arcname, path in files:
+                self.add_file(file_arcname, path)
+
+    def split(self, directory: str) -> dict[str, "WorkflowPackageBuilder"]:
+        """Moves each subdirectory of the directory into a package of its own, keyed by the subdirectory's path.
+
+        Members keep their full path, so extracting the packages into the same directory gives back the original.
+        """
+        prefix = f"{directory.rstrip('/')}/"
+        packages: dict[str, WorkflowPackageBuilder] = {}
+
+        def get_package(arcname: str) -> WorkflowPackageBuilder | None:
+            relative_name = arcname.removeprefix(prefix)
+            if relative_name == arcname or "/" not in relative_name:
+                return None
+            return packages.setdefault(prefix + relative_name.split("/", 1)[0], WorkflowPackageBuilder())
+
+        for arcname in list(self._files):
+            if (package := get_package(arcname)) is not None:
+                package.add_file(arcname, self._files.pop(arcname))
+        for arcname in list(self._contents):
+            if (package := get_package(arcname)) is not None:
+                package.add_bytes(arcname, self._contents.pop(arcname))
+        return dict(sorted(packages.items()))
+
+    def build(self, archive_path: Path, max_workers: int | None = None) -> PackageBuildResult:
+        """Writes the package to the archive path, replacing any existing file, and returns what went into it."""
+        archive_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = archive_path.with_name(f".{archive_path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+        try:
+            with temp_path.open("wb") as file:
+                for chunk in self.iter_archive(max_workers=max_workers):
+                    file.write(chunk)
+            temp_path.replace(archive_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        result = cast("PackageBuildResult", self.result)
+        result.path = archive_path
+        return result
+
+    def iter_archive(self, max_workers: int | None = None) -> Iterator[bytes]:
+        """Yields the package's bytes as they are produced, without holding more than one chunk in memory.
+
+        `result` is set once the last chunk has been yielded.
+        """
+        start_time = time.monotonic()
+        self.result = None
+        content_hashes = AssetHashIndex.hash_files(self._files.values(), max_workers=max_workers)
+        digest = hashlib.sha256()
+        size = 0
+        # Other builds saving the cache must not evict the members of this one before it has copied them.
+        with PackageMemberCache.pinned(content_hashes.values()):
+            members, compressed, reused, compressed_bytes = self._prepare_members(content_hashes, max_workers)
+            for chunk in self._iter_archive(members):
+                digest.update(chunk)
+                size += len(chunk)
+                yield chunk
+        PackageMemberCache.save()
+
+        self.result = PackageBuildResult(
+            path=None,
+            content_hash=f"sha256:{digest.hexdigest()}",
+            size=size,
+            members=len(members),
+            reused=reused,
+            compressed=compressed,
+            elapsed_seconds=time.monotonic() - start_time,
+            input_bytes=sum(member.compressed.size for member in members),
+            compressed_bytes=compressed_bytes,
+        )
+        logger.info(
+            "Packaged %d files (%d bytes, %d zipped) in %.2fs (%d files and %d bytes compressed, %d files reused "
+            "from the package cache)",
+            self.result.members,
+            self.result.input_bytes,
+            self.result.size,
+            self.result.elapsed_seconds,
+            self.result.compressed,
+            self.result.compressed_bytes,
+            self.result.reused,
+        )
+
+    def dry_run(self, max_workers: int | None = None) -> PackageBuildResult:
+        """Produces the package without writing it anywhere and returns what would go into it, e.g. its hash.
+
+        Files are compressed into the package cache on the way, so producing the package again right after only
+        reads the compressed members back.
+        """
+        for _ in self.iter_archive(max_workers=max_workers):
+            pass
+        return cast("PackageBuildResult", self.result)
+
+    def _prepare_members(
+        self, content_hashes: dict[Path, str], max_workers: int | None
+    ) -> tuple[list[_Member], int, int, int]:
+        """Returns the members in archive order, how many files were compressed and reused, and the bytes compressed."""
+        cached: dict[str, tuple[CompressedMember, Path]] = {}
+        misses: dict[str, Path] = {}
+        for path in self._files.values():
+            content_hash = content_hashes[path]
+            if content_hash in cached or content_hash in misses:
+                continue
+            if (hit := PackageMemberCache.get(content_hash)) is not None:
+                cached[content_hash] = hit
+            else:
+                misses[content_hash] = path
+        # zlib releases the GIL while compressing, so changed files are compressed in parallel.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            compressed = dict(zip(misses, executor.map(PackageMemberCache.put, misses, misses.values()), strict=True))
+
+        members: list[_Member] = []
+        for arcname, path in self._files.items():
+            member, blob_path = cached.get(content_hashes[path]) or compressed[content_hashes[path]]
+            members.append(
+                _Member(
+                    arcname=arcname,
+                    mode=self._get_mode(path),
+                    compressed=member,
+                    blob_path=blob_path,
+                    source_path=path,
+                    content_hash=content_hashes[path],
+                )
+            )
+        for arcname, content in self._contents.items():
+            member, data = _compress_bytes(content)
+            members.append(_Member(arcname=arcname, mode=FILE_MODE, compressed=member, data=data))
+        members.sort(key=lambda member: member.arcname)
+        reused = sum(1 for path in self._files.values() if content_hashes[path] in cached)
+        compressed_bytes = sum(member.size for member, _ in compressed.values())
+        return members, len(misses), reused, compressed_bytes
+
+    def _get_mode(self, path: Path) -> int:
+        return EXECUTABLE_MODE if path.stat().st_mode & (stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH) else FILE_MODE
+
+    def _open_blob(self, member: _Member) -> BinaryIO:
+        """Opens the member's compressed data, compressing its file again if another process evicted it meanwhile."""
+        blob_path = cast("Path", member.blob_path)
+        try:
+            blob = blob_path.open("rb")
+        except FileNotFoundError:
+            pass
+        else:
+            if os.fstat(blob.fileno()).st_size == member.compressed.compressed_size:
+                return blob
+            blob.close()
+        logger.info("Compressing %s again, as its cached copy was evicted during the build", member.source_path)
+        recompressed, blob_path = PackageMemberCache.put(
+            cast("str", member.content_hash), cast("Path", member.source_path)
+        )
+        # The archive's headers were computed from the first copy, so the new one must match it exactly.
+        if (recompressed.crc32, recompressed.compressed_size) != (
+            member.compressed.crc32,
+            member.compressed.compressed_size,
+        ):
+            msg = f"File '{member.source_path}' changed while the package was being built"
+            raise RuntimeError(msg)
+        return blob_path.open("rb")
+
+    def _iter_archive(self, members: list[_Member]) -> Iterator[bytes]:
+        offset = 0
+        central_directory: list[bytes] = []
+        for member in members:
+            local_header = self._local_header(member)
+            central_directory.append(self._central_header(member, offset))
+            offset += len(local_header) + member.compressed.compressed_size
+            yield local_header
+            if member.data is not None:
+                yield member.data
+            elif member.blob_path is not None:
+                with self._open_blob(member) as blob:
+                    while chunk := blob.read(CHUNK_SIZE):
+                        yield chunk
+
+        central_directory_offset = offset
+        central_directory_size = sum(len(header) for header in central_directory)
+        yield b"".join(central_directory)
+        offset += central_directory_size
+
+        count = len(members)
+        if (
+            count >= ZIP64_COUNT_LIMIT
+            or central_directory_offset >= ZIP64_LIMIT
+            or central_directory_size >= ZIP64_LIMIT
+        ):
+            yield ZIP64_END_OF_CENTRAL_DIRECTORY.pack(
+                0x06064B50,
+                ZIP64_END_OF_CENTRAL_DIRECTORY.size - 12,
+                (UNIX_SYSTEM << 8) | VERSION_ZIP64,
+                VERSION_ZIP64,
+                0,
+                0,
+                count,
+                count,
+                central_directory_size,
+                central_directory_offset,
+            )
+            yield ZIP64_END_OF_CENTRAL_DIRECTORY_LOCATOR.pack(0x07064B50, 0, offset, 1)
+        yield END_OF_CENTRAL_DIRECTORY.pack(
+            0x06054B50,
+            0,
+            0,
+            min(count, ZIP64_COUNT_LIMIT),
+            min(count, ZIP64_COUNT_LIMIT),
+            min(central_directory_size, ZIP64_LIMIT),
+            min(central_directory_offset, ZIP64_LIMIT),
+            0,
+        )
+
+    def _local_header(self, member: _Member) -> bytes:
+        name = member.arcname.encode("utf-8")
+        compressed = member.compressed
+        zip64 = compressed.size >= ZIP64_LIMIT or compressed.compressed_size >= ZIP64_LIMIT
+        extra = struct.pack("<HHQQ", 1, 16, compressed.size, compressed.compressed_size) if zip64 else b""
+        return (
+            LOCAL_HEADER.pack(
+                0x04034B50,
+                VERSION_ZIP64 if zip64 else VERSION_DEFAULT,
+                self._flags(member),
+                DEFLATED,
+                DOS_TIME,
+                DOS_DATE,
+                compressed.crc32,
+                ZIP64_LIMIT if zip64 else compressed.compressed_size,
+                ZIP64_LIMIT if zip64 else compressed.size,
+                len(name),
+                len(extra),
+            )
+            + name
+            + extra
+        )
+
+    def _central_header(self, member: _Member, offset: int) -> bytes:
+        name = member.arcname.encode("utf-8")
+        compressed = member.compressed
+        zip64_sizes = compressed.size >= ZIP64_LIMIT or compressed.compressed_size >= ZIP64_LIMIT
+        zip64_offset = offset >= ZIP64_LIMIT
+        fields = [compressed.size, compressed.compressed_size] if zip64_sizes else []
+        if zip64_offset:
+            fields.append(offset)
+        extra = struct.pack(f"<HH{len(fields)}Q", 1, 8 * len(fields), *fields) if fields else b""
+        version = VERSION_ZIP64 if fields else VERSION_DEFAULT
+        return (
+            CENTRAL_HEADER.pack(
+                0x02014B50,
+                (UNIX_SYSTEM << 8) | version,
+                version,
+                self._flags(member),
+                DEFLATED,
+                DOS_TIME,
+                DOS_DATE,
+                compressed.crc32,
+                ZIP64_LIMIT if zip64_sizes else compressed.compressed_size,
+                ZIP64_LIMIT if zip64_sizes else compressed.size,
+                len(name),
+                len(extra),
+                0,
+                0,
+                0,
+                member.mode << 16,
+                ZIP64_LIMIT if zip64_offset else offset,
+            )
+            + name
+            + extra
+        )
+
+    def _flags(self, member: _Member) -> int:
+        return 0 if member.arcname.isascii() else UTF8_FLAG
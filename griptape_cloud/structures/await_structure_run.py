@@ -0,0 +1,110 @@
+import logging
+
+from base.base_griptape_cloud_node import BaseGriptapeCloudNode
+from griptape_cloud_client.types import Unset
+from griptape_nodes.exe_types.core_types import Parameter, ParameterList, ParameterMode
+from griptape_nodes.exe_types.node_types import AsyncResult, ControlNode
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+class AwaitStructureRun(BaseGriptapeCloudNode, ControlNode):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+
+        self.add_parameter(
+            ParameterList(
+                name="structure_run_ids",
+                input_types=["str"],
+                output_type="str",
+                type="str",
+                default_value=None,
+                tooltip="The IDs of the structure runs to wait for",
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="timeout",
+                input_types=["float"],
+                type="float",
+                output_type="float",
+                default_value=0.0,
+                tooltip="How many seconds to wait for the runs to finish. 0 waits indefinitely.",
+                allowed_modes={ParameterMode.INPUT, ParameterMode.PROPERTY},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="output",
+                output_type="dict",
+                default_value=None,
+                tooltip="The output of the first structure run",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="outputs",
+                output_type="list",
+                default_value=None,
+                tooltip="The output of every structure run, in the order of the structure run IDs",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="statuses",
+                output_type="list",
+                default_value=None,
+                tooltip="The final status of every structure run, in the order of the structure run IDs",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        )
+
+    def validate_before_workflow_run(self) -> list[Exception] | None:
+        exceptions = super().validate_before_workflow_run() or []
+
+        try:
+            if not self._get_structure_run_ids():
+                msg = "Structure run IDs are not set. Connect the Node to the structure run ID of a Run Structure Node."
+                exceptions.append(ValueError(msg))
+
+        except Exception as e:
+            exceptions.append(e)
+
+        return exceptions if exceptions else None
+
+    def _get_structure_run_ids(self) -> list[str]:
+        structure_run_ids = self.get_parameter_value("structure_run_ids") or []
+        if isinstance(structure_run_ids, str):
+            structure_run_ids = [structure_run_ids]
+        return [str(structure_run_id) for structure_run_id in structure_run_ids if structure_run_id]
+
+    def _process(self) -> None:
+        structure_run_ids = self._get_structure_run_ids()
+        timeout = self.get_parameter_value("timeout")
+
+        structure_runs = self._wait_for_structure_runs(structure_run_ids, timeout=timeout or None)
+
+        outputs = [run.output if not isinstance(run.output, Unset) else None for run in structure_runs]
+        self.parameter_output_values["outputs"] = outputs
+        self.parameter_output_values["output"] = outputs[0] if outputs else None
+        self.parameter_output_values["statuses"] = [str(run.status) for run in structure_runs]
+
+        bad_statuses = self._get_structure_run_bad_statuses()
+        failed = [
+            structure_run_id
+            for structure_run_id, run in zip(structure_run_ids, structure_runs, strict=True)
+            if run.status in bad_statuses
+        ]
+        if failed:
+            msg = f"{len(failed)} of {len(structure_runs)} structure runs did not succeed: {', '.join(failed[:10])}"
+            raise RuntimeError(msg)
+
+    def process(self) -> AsyncResult[None]:
+        yield lambda: self._process()
@@ -2,6 +2,8 @@ import logging
 from typing import Any
 
 from base.base_griptape_cloud_node import BaseGriptapeCloudNode
+from base.griptape_cloud_options import is_headless, use_lazy_options
+from base.indexed_choices import IndexedChoices
 from griptape_nodes.exe_types.core_types import Parameter, ParameterMode
 from griptape_nodes.exe_types.node_types import DataNode
 from structures.structure_options import StructureOptions
@@ -14,8 +16,15 @@ class GetStructure(BaseGriptapeCloudNode, DataNode):
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
 
-        self.structures = self._list_structures().structures
-        self.choices = list(map(StructureOptions._structure_to_name_and_id, self.structures))
+        # In lazy mode, only a listing that is already cached is used; otherwise the choices are loaded in the
+        # background, or when the node is validated or run if it runs headless, so the node can be built from its
+        # saved ID without a network round trip.
+        self.lazy_options = use_lazy_options()
+        if self.lazy_options:
+            self.structure_choices = self._peek_cached_listing("structures") or IndexedChoices()
+        else:
+            self.structure_choices = self._get_structure_choices_cached()
+        self.choices_loaded = bool(self.structure_choices) or not self.lazy_options
 
         self.add_parameter(
             Parameter(
@@ -23,15 +32,8 @@ class GetStructure(BaseGriptapeCloudNode, DataNode):
                 input_types=["str"],
                 output_type="str",
                 type="str",
-                default_value=self.structures[0].structure_id if self.structures else None,
-                traits={
-                    StructureOptions(
-                        choices=self.choices,
-                        choices_value_lookup={
-                            StructureOptions._structure_to_name_and_id(s): s for s in self.structures
-                        },
-                    )
-                },
+                default_value=self.structure_choices.first_id(),
+                traits={StructureOptions(indexed_choices=self.structure_choices)},
                 tooltip="The ID of the structure",
                 allowed_modes={ParameterMode.INPUT, ParameterMode.PROPERTY, ParameterMode.OUTPUT},
             )
@@ -61,13 +63,20 @@ class GetStructure(BaseGriptapeCloudNode, DataNode):
             )
         )
 
+        if not self.choices_loaded and not is_headless():
+            # Fill the dropdown as soon as the listing arrives rather than on the first run.
+            self._load_choices_in_background(self._resolve_structure)
+
     def validate_before_workflow_run(self) -> list[Exception] | None:
         exceptions = super().validate_before_workflow_run() or []
 
         try:
-            if not self.get_parameter_value("structure_id"):
+            structure_id = self.get_parameter_value("structure_id")
+            if not structure_id:
                 msg = "Structure ID is not set. Configure the Node with a valid Griptape Cloud Structure ID before running."
                 exceptions.append(ValueError(msg))
+            else:
+                self._resolve_structure()
 
         except Exception as e:
             # Add any exceptions to your list to return
@@ -81,16 +90,39 @@ class GetStructure(BaseGriptapeCloudNode, DataNode):
     ) -> None:
         """Callback after a value has been set on this Node."""
         if parameter.name == "structure_id" and value is not None:
-            structure = next((s for s in self.structures if s.structure_id == value), None)
-            if structure is None:
-                msg = f"Structure with ID '{value}' not found."
-                logger.error(msg)
-                raise ValueError(msg)
-            self.set_parameter_value("structure", structure)
-            self.set_parameter_value("name", structure.name)
+            if not self.choices_loaded:
+                # Resolved once the choices are loaded.
+                return
+            self._set_structure(value)
             if modified_parameters_set is not None:
                 modified_parameters_set.add("structure")
                 modified_parameters_set.add("name")
 
+    def _set_structure(self, structure_id: str) -> None:
+        structure = self.structure_choices.by_id.get(structure_id)
+        if structure is None:
+            msg = f"Structure with ID '{structure_id}' not found."
+            logger.error(msg)
+            raise ValueError(msg)
+        self.set_parameter_value("structure", structure)
+        self.set_parameter_value("name", structure.name)
+
+    def _load_structure_choices(self) -> None:
+        self.structure_choices = self._get_structure_choices_cached()
+        parameter = self.get_parameter_by_name("structure_id")
+        if parameter is not None:
+            for trait in parameter.find_elements_by_type(StructureOptions):
+                trait.set_indexed_choices(self.structure_choices)
+        self.choices_loaded = True
+
+    def _resolve_structure(self) -> None:
+        """Loads the choices if they are not loaded yet, and sets the structure if it was selected before they were."""
+        if not self.choices_loaded:
+            self._load_structure_choices()
+        structure = self.get_parameter_value("structure")
+        structure_id = self.get_parameter_value("structure_id")
+        if structure is None or structure.structure_id != structure_id:
+            self._set_structure(structure_id)
+
     def process(self) -> None:
-        pass
+        self._resolve_structure()
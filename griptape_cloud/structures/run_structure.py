@@ -2,9 +2,11 @@ import logging
 from typing import TYPE_CHECKING, Any, cast
 
 from base.base_griptape_cloud_node import BaseGriptapeCloudNode
+from base.run_event_buffer import RunEventBuffer
 from griptape_cloud_client.types import Unset
 from griptape_nodes.exe_types.core_types import Parameter, ParameterGroup, ParameterList, ParameterMode
 from griptape_nodes.exe_types.node_types import AsyncResult, ControlNode
+from mixins.run_event_poller import STRUCTURE_RUN_COMPLETED_EVENT_TYPE
 
 if TYPE_CHECKING:
     from griptape_cloud_client.models.structure_detail import StructureDetail
@@ -40,6 +42,21 @@ class RunStructure(BaseGriptapeCloudNode, ControlNode):
             )
         )
 
+        self.add_parameter(
+            Parameter(
+                name="wait_for_completion",
+                input_types=["bool"],
+                type="bool",
+                output_type="bool",
+                default_value=True,
+                tooltip=(
+                    "Wait for the run to finish. If disabled, the node only submits the run and outputs its ID, "
+                    "which an Await Structure Run node can join later."
+                ),
+                allowed_modes={ParameterMode.INPUT, ParameterMode.PROPERTY},
+            )
+        )
+
         self.add_parameter(
             Parameter(
                 name="structure_run_id",
@@ -97,23 +114,47 @@ class RunStructure(BaseGriptapeCloudNode, ControlNode):
         # if there are exceptions, they will display when the user tries to run the flow with the node.
         return exceptions if exceptions else None
 
-    def _process(self) -> None:
+    async def _process(self) -> None:
+        api = self.gtc_async_api
         include_events = self.get_parameter_value("include_events")
         structure = cast("StructureDetail", self.get_parameter_value("structure"))
         args = self.get_parameter_value("args")
-        structure_run = self._create_structure_run(structure_id=structure.structure_id, args=args)
+        structure_run = await api._create_structure_run(structure_id=structure.structure_id, args=args)
+        self.parameter_output_values["structure_run_id"] = structure_run.structure_run_id
 
-        output: Any | None = None
+        if self.get_parameter_value("wait_for_completion") is False:
+            logger.info("Submitted structure run %s without waiting for it", structure_run.structure_run_id)
+            # Clear the output of an earlier run, which would otherwise pass for the output of this one.
+            self.parameter_output_values["output"] = None
+            return
 
-        for events in self._poll_structure_run_events(structure_run_id=structure_run.structure_run_id):
-            if include_events:
-                self.append_value_to_parameter("events", "\n".join(str(event.payload) for event in events))
+        output: Any | None = None
 
-        structure_run = self._get_structure_run(structure_run_id=structure_run.structure_run_id)
+        event_buffer = (
+            RunEventBuffer(flush=lambda text: self.publish_update_to_parameter("events", text))
+            if include_events
+            else None
+        )
+        # Without an events parameter to fill, only the completion event is needed
+        events_filter = (
+            {"exclude_types": event_buffer.excluded_types}
+            if event_buffer is not None
+            else {"include_types": [STRUCTURE_RUN_COMPLETED_EVENT_TYPE]}
+        )
+        async for events in api._poll_structure_run_events(
+            structure_run_id=structure_run.structure_run_id, **events_filter
+        ):
+            if event_buffer is not None:
+                event_buffer.extend(events)
+        if event_buffer is not None:
+            event_buffer.flush()
+
+        structure_run = await api._get_structure_run(structure_run_id=structure_run.structure_run_id)
         output = structure_run.output if not isinstance(structure_run.output, Unset) else None
         self.parameter_output_values["output"] = output
 
     def process(
         self,
     ) -> AsyncResult[None]:
-        yield lambda: self._process()
+        # Runs are awaited on the event loop rather than in a worker thread, so many of them can wait at once.
+        yield self._process()
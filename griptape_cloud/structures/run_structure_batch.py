@@ -0,0 +1,167 @@
+import logging
+from typing import TYPE_CHECKING, Any, cast
+
+from base.base_griptape_cloud_node import BaseGriptapeCloudNode
+from griptape_nodes.exe_types.core_types import Parameter, ParameterMode
+from griptape_nodes.exe_types.node_types import AsyncResult, ControlNode
+from mixins.griptape_cloud_api_mixin import DEFAULT_STRUCTURE_RUN_MAX_IN_FLIGHT
+
+if TYPE_CHECKING:
+    from griptape_cloud_client.models.structure_detail import StructureDetail
+    from mixins.structure_run_batch import StructureRunBatchResult
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+class RunStructureBatch(BaseGriptapeCloudNode, ControlNode):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+
+        self.add_parameter(
+            Parameter(
+                name="structure",
+                input_types=["StructureDetail"],
+                type="StructureDetail",
+                output_type="StructureDetail",
+                default_value=None,
+                tooltip="The structure to run",
+                allowed_modes={ParameterMode.INPUT},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="args_list",
+                input_types=["list"],
+                type="list",
+                output_type="list",
+                default_value=None,
+                tooltip="A list with the arguments of each run, e.g. [['-p', 'a'], ['-p', 'b']]",
+                allowed_modes={ParameterMode.INPUT},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="max_in_flight",
+                input_types=["int"],
+                type="int",
+                output_type="int",
+                default_value=DEFAULT_STRUCTURE_RUN_MAX_IN_FLIGHT,
+                tooltip="How many runs may be in progress at once",
+                allowed_modes={ParameterMode.INPUT, ParameterMode.PROPERTY},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="timeout",
+                input_types=["float"],
+                type="float",
+                output_type="float",
+                default_value=0.0,
+                tooltip=(
+                    "How many seconds to wait for the whole batch. 0 waits indefinitely. Runs that time out are "
+                    "reported as failed but keep running on Griptape Cloud."
+                ),
+                allowed_modes={ParameterMode.INPUT, ParameterMode.PROPERTY},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="outputs",
+                output_type="list",
+                default_value=None,
+                tooltip="The output of each run, in the order of the argument lists (None for failed runs)",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="results",
+                output_type="list",
+                default_value=None,
+                tooltip="The result of each run: its structure run ID, status, output, duration and error, if any",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="progress",
+                type="str",
+                default_value=None,
+                tooltip="How many runs have finished",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        )
+
+    def validate_before_workflow_run(self) -> list[Exception] | None:
+        exceptions = super().validate_before_workflow_run() or []
+
+        try:
+            if not self.get_parameter_value("structure"):
+                msg = "Structure is not set. Configure the Node with a valid Griptape Cloud Structure before running."
+                exceptions.append(ValueError(msg))
+
+            args_list = self.get_parameter_value("args_list")
+            if not isinstance(args_list, list) or not args_list:
+                msg = "Args list is not set. Configure the Node with a list of argument lists before running."
+                exceptions.append(ValueError(msg))
+
+            max_in_flight = self.get_parameter_value("max_in_flight")
+            if max_in_flight is not None and max_in_flight < 1:
+                msg = "Max in flight must be at least 1."
+                exceptions.append(ValueError(msg))
+
+            structure = cast("StructureDetail", self.get_parameter_value("structure"))
+
+            deployment = self._get_deployment(structure.latest_deployment_id)
+            if not self._is_deployment_ready(deployment):
+                msg = f"Structure '{structure.name}' is not ready. Deployment status: {deployment.status}"
+                exceptions.append(ValueError(msg))
+
+        except Exception as e:
+            exceptions.append(e)
+
+        return exceptions if exceptions else None
+
+    def _normalize_args(self, args: Any) -> list[str]:
+        if args is None:
+            return []
+        if isinstance(args, (list, tuple)):
+            return [str(arg) for arg in args]
+        return [str(args)]
+
+    def _process(self) -> None:
+        structure = cast("StructureDetail", self.get_parameter_value("structure"))
+        args_list = [self._normalize_args(args) for args in self.get_parameter_value("args_list")]
+        finished = 0
+
+        def on_result(_result: "StructureRunBatchResult") -> None:
+            nonlocal finished
+            finished += 1
+            self.publish_update_to_parameter("progress", f"{finished} of {len(args_list)} runs finished")
+
+        results = self._run_structure_batch(
+            structure_id=structure.structure_id,
+            args_list=args_list,
+            max_in_flight=self.get_parameter_value("max_in_flight"),
+            on_result=on_result,
+            timeout=self.get_parameter_value("timeout") or None,
+        )
+
+        self.parameter_output_values["outputs"] = [result.output for result in results]
+        self.parameter_output_values["results"] = [result.to_dict() for result in results]
+
+        failed = [result for result in results if not result.succeeded]
+        logger.info("Finished %d runs of structure %s (%d failed)", len(results), structure.structure_id, len(failed))
+        if failed:
+            msg = f"{len(failed)} of {len(results)} structure runs failed. First error: {failed[0].error}"
+            raise RuntimeError(msg)
+
+    def process(self) -> AsyncResult[None]:
+        yield lambda: self._process()
@@ -0,0 +1,71 @@
+import hashlib
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from assets.asset_hash_index import AssetHashEntry, AssetHashIndex
+
+BASE_URL = "https://cloud.griptape.ai/api"
+
+
+@pytest.fixture(autouse=True)
+def index(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[type[AssetHashIndex]]:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setattr(AssetHashIndex, "_assets", None)
+    monkeypatch.setattr(AssetHashIndex, "_files", {})
+    yield AssetHashIndex
+    AssetHashIndex.flush()
+
+
+def reload(index: type[AssetHashIndex]) -> None:
+    """Writes the index and forgets it, so that the next lookup reads it back from disk."""
+    index.flush()
+    index._assets = None
+    index._files = {}
+
+
+def test_hashes_files_with_the_algorithm_prefix(index: type[AssetHashIndex], tmp_path: Path):
+    file_path = tmp_path / "asset.txt"
+    file_path.write_bytes(b"content")
+
+    assert index.hash_file(file_path) == f"sha256:{hashlib.sha256(b'content').hexdigest()}"
+
+
+def test_rehashes_files_that_changed(index: type[AssetHashIndex], tmp_path: Path):
+    file_path = tmp_path / "asset.txt"
+    file_path.write_bytes(b"old")
+    old_hash = index.hash_file(file_path)
+
+    file_path.write_bytes(b"new content")
+
+    assert index.hash_file(file_path) != old_hash
+    assert index.hash_files([file_path]) == {file_path: index.hash_file(file_path)}
+
+
+def test_recorded_assets_survive_a_reload(index: type[AssetHashIndex]):
+    key = index.make_key(f"{BASE_URL}/", "bucket", "asset")
+    index.record(key, AssetHashEntry(content_hash="sha256:abc", size=3, remote_updated_at="2030-01-01"))
+
+    reload(index)
+
+    assert index.get(index.make_key(BASE_URL, "bucket", "asset")) == AssetHashEntry(
+        content_hash="sha256:abc", size=3, remote_updated_at="2030-01-01"
+    )
+
+
+def test_finds_assets_by_hash_within_a_bucket(index: type[AssetHashIndex]):
+    index.record(index.make_key(BASE_URL, "bucket", "a"), AssetHashEntry(content_hash="sha256:abc", size=3))
+    index.record(index.make_key(BASE_URL, "bucket", "b"), AssetHashEntry(content_hash="sha256:def", size=3))
+    index.record(index.make_key(BASE_URL, "other", "c"), AssetHashEntry(content_hash="sha256:abc", size=3))
+
+    assert index.find_by_hash(BASE_URL, "bucket", "sha256:abc") == ["a"]
+
+
+def test_invalidated_assets_are_forgotten(index: type[AssetHashIndex]):
+    key = index.make_key(BASE_URL, "bucket", "asset")
+    index.record(key, AssetHashEntry(content_hash="sha256:abc", size=3))
+
+    index.invalidate(key)
+    reload(index)
+
+    assert index.get(key) is None
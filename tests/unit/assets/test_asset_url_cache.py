@@ -0,0 +1,52 @@
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from assets.asset_url_cache import AssetUrlCache, AssetUrlCacheKey, parse_presigned_url_expiry
+
+SAS_URL = "https://account.blob.core.windows.net/container/asset?sv=2021-08-06&se=2030-01-01T00:00:00Z&sig=abc"
+S3_URL = "https://bucket.s3.amazonaws.com/asset?X-Amz-Date=20300101T000000Z&X-Amz-Expires=3600&X-Amz-Signature=abc"
+
+
+@pytest.fixture(autouse=True)
+def empty_cache() -> Iterator[None]:
+    AssetUrlCache.invalidate()
+    yield
+    AssetUrlCache.invalidate()
+
+
+def make_key(asset_name: str = "asset", bucket_id: str = "bucket") -> AssetUrlCacheKey:
+    return AssetUrlCache.make_key("https://cloud.griptape.ai/api/", "key", bucket_id, asset_name, "GET")
+
+
+def test_parses_the_expiry_of_sas_and_s3_urls():
+    assert parse_presigned_url_expiry(SAS_URL) == datetime(2030, 1, 1, tzinfo=UTC)
+    assert parse_presigned_url_expiry(S3_URL) == datetime(2030, 1, 1, 1, tzinfo=UTC)
+    assert parse_presigned_url_expiry("https://example.com/asset") is None
+
+
+def test_caches_urls_until_shortly_before_they_expire():
+    AssetUrlCache.put(make_key(), "response", url=SAS_URL)
+    AssetUrlCache.put(make_key("soon"), "response", url="", expires_at=datetime.now(UTC) + timedelta(seconds=30))
+
+    assert AssetUrlCache.get(make_key()) == "response"
+    # Within the expiry margin, so never cached.
+    assert AssetUrlCache.get(make_key("soon")) is None
+
+
+def test_keys_ignore_a_trailing_slash_and_separate_api_keys():
+    assert make_key() == AssetUrlCache.make_key("https://cloud.griptape.ai/api", "key", "bucket", "asset", "GET")
+    assert make_key() != AssetUrlCache.make_key("https://cloud.griptape.ai/api", "other", "bucket", "asset", "GET")
+
+
+def test_invalidates_an_asset_or_a_bucket():
+    for key in (make_key("a"), make_key("b"), make_key("a", bucket_id="other")):
+        AssetUrlCache.put(key, "response", url=SAS_URL)
+
+    AssetUrlCache.invalidate(bucket_id="bucket", asset_name="a")
+    assert AssetUrlCache.get(make_key("a")) is None
+    assert AssetUrlCache.get(make_key("b")) == "response"
+
+    AssetUrlCache.invalidate(bucket_id="bucket")
+    assert AssetUrlCache.get(make_key("b")) is None
+    assert AssetUrlCache.get(make_key("a", bucket_id="other")) == "response"
@@ -0,0 +1,130 @@
+from pathlib import Path
+
+import httpx
+import pytest
+from assets import multipart_uploader
+from assets.multipart_uploader import MultipartUploader
+
+S3_URL = "https://bucket.s3.amazonaws.com/asset.zip?X-Amz-Signature=abc"
+
+
+class RecordingStorage:
+    """Serves presigned PUTs, failing the first `failures` requests with a 503, and records what was received."""
+
+    def __init__(self, failures: int = 0) -> None:
+        self.failures = failures
+        self.requests: list[httpx.Request] = []
+        self.bodies: list[bytes] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        self.bodies.append(request.read())
+        if self.failures:
+            self.failures -= 1
+            return httpx.Response(503)
+        return httpx.Response(201)
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(multipart_uploader.time, "sleep", lambda _: None)
+
+
+def make_uploader(storage: RecordingStorage) -> MultipartUploader:
+    return MultipartUploader(client=httpx.Client(transport=httpx.MockTransport(storage)), part_size=1024)
+
+
+def test_single_put_sends_the_file_with_its_length(tmp_path: Path):
+    storage = RecordingStorage()
+    file_path = tmp_path / "asset.zip"
+    file_path.write_bytes(b"x" * 4096)
+
+    result = make_uploader(storage).upload(file_path, S3_URL, {}, manifest_key="asset")
+
+    assert not result.multipart
+    assert storage.bodies == [b"x" * 4096]
+    assert storage.requests[0].headers["Content-Length"] == "4096"
+    assert "Transfer-Encoding" not in storage.requests[0].headers
+
+
+def test_single_put_is_retried_from_the_start(tmp_path: Path):
+    storage = RecordingStorage(failures=2)
+    file_path = tmp_path / "asset.zip"
+    file_path.write_bytes(b"0123456789")
+
+    make_uploader(storage).upload(file_path, S3_URL, {}, manifest_key="asset")
+
+    assert storage.bodies == [b"0123456789"] * 3
+
+
+def test_streamed_single_put_is_spooled_and_retried():
+    storage = RecordingStorage(failures=1)
+
+    result = make_uploader(storage).upload_stream(iter([b"abc", b"def"]), S3_URL, {}, name="package")
+
+    assert result.bytes_uploaded == 6
+    assert storage.bodies == [b"abcdef"] * 2
+    assert all(request.headers["Content-Length"] == "6" for request in storage.requests)
+    assert all("Transfer-Encoding" not in request.headers for request in storage.requests)
+
+
+def test_single_put_gives_up_after_the_retries(tmp_path: Path):
+    storage = RecordingStorage(failures=10)
+    file_path = tmp_path / "asset.zip"
+    file_path.write_bytes(b"data")
+
+    with pytest.raises(httpx.HTTPStatusError):
+        make_uploader(storage).upload(file_path, S3_URL, {}, manifest_key="asset")
+    assert len(storage.requests) == multipart_uploader.TRANSFER_MAX_RETRIES + 1
+
+
+AZURE_URL = "https://account.blob.core.windows.net/container/asset.zip?sig=abc"
+
+
+def get_block_ids(storage: RecordingStorage) -> list[str]:
+    return [request.url.params["blockid"] for request in storage.requests if request.url.params.get("comp") == "block"]
+
+
+def test_large_files_are_uploaded_in_blocks_and_committed_in_order(tmp_path: Path):
+    storage = RecordingStorage()
+    file_path = tmp_path / "asset.zip"
+    file_path.write_bytes(b"a" * 1024 + b"b" * 1024 + b"c" * 10)
+    uploader = make_uploader(storage)
+
+    result = uploader.upload(file_path, AZURE_URL, {"x-ms-blob-type": "BlockBlob"}, manifest_key="asset")
+
+    assert result.multipart
+    assert result.parts == 3
+    assert sorted(get_block_ids(storage)) == [uploader._block_id(i) for i in range(3)]
+    commit = storage.requests[-1]
+    assert commit.url.params["comp"] == "blocklist"
+    assert commit.url.params["sig"] == "abc"
+    assert storage.bodies[-1].decode().count("<Latest>") == 3
+    assert all("x-ms-blob-type" not in request.headers for request in storage.requests)
+    assert not uploader._manifest_path("asset", file_path, file_path.stat().st_size).exists()
+
+
+def test_interrupted_block_upload_resumes_from_the_manifest(tmp_path: Path):
+    storage = RecordingStorage()
+    file_path = tmp_path / "asset.zip"
+    file_path.write_bytes(b"x" * 3000)
+    uploader = make_uploader(storage)
+    uploader._write_manifest(uploader._manifest_path("asset", file_path, 3000), {0, 2})
+
+    result = uploader.upload(file_path, AZURE_URL, {}, manifest_key="asset")
+
+    assert result.parts == 3
+    assert get_block_ids(storage) == [uploader._block_id(1)]
+    assert storage.bodies[0] == b"x" * 1024
+
+
+def test_unreadable_manifest_uploads_every_block(tmp_path: Path):
+    storage = RecordingStorage()
+    file_path = tmp_path / "asset.zip"
+    file_path.write_bytes(b"x" * 2048)
+    uploader = make_uploader(storage)
+    uploader._manifest_path("asset", file_path, 2048).write_text("{not json")
+
+    uploader.upload(file_path, AZURE_URL, {}, manifest_key="asset")
+
+    assert len(get_block_ids(storage)) == 2
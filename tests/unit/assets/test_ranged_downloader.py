@@ -0,0 +1,142 @@
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import httpx
+import pytest
+from assets import ranged_downloader
+from assets.ranged_downloader import RangedDownloader
+
+CONTENT = bytes(range(256)) * 40
+URL = "https://storage.example.com/asset.bin?sig=old"
+REFRESHED_URL = "https://storage.example.com/asset.bin?sig=new"
+
+
+class RangeStorage:
+    """Serves byte ranges of the content, like presigned storage URLs do."""
+
+    def __init__(self, content: bytes = CONTENT, *, honor_ranges: bool = True) -> None:
+        self.content = content
+        self.honor_ranges = honor_ranges
+        self.lock = threading.Lock()
+        self.ranges: list[str] = []
+        # Requests for URLs whose `sig` is in here are rejected with a 403, as expired URLs are.
+        self.expired: set[str] = set()
+        # How many more responses are cut off halfway through their body.
+        self.drops = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        with self.lock:
+            self.ranges.append(request.headers.get("Range", ""))
+            if request.url.params["sig"] in self.expired:
+                return httpx.Response(403)
+            drop = self.drops > 0
+            self.drops -= drop
+        if not self.honor_ranges:
+            return httpx.Response(200, content=self.body(self.content, drop=drop))
+        start, end = (int(value) for value in request.headers["Range"].removeprefix("bytes=").split("-"))
+        if start >= len(self.content):
+            return httpx.Response(416)
+        end = min(end, len(self.content) - 1)
+        return httpx.Response(
+            206,
+            headers={"Content-Range": f"bytes {start}-{end}/{len(self.content)}"},
+            content=self.body(self.content[start : end + 1], drop=drop),
+        )
+
+    def body(self, data: bytes, *, drop: bool) -> Iterator[bytes]:
+        half = len(data) // 2
+        yield data[:half]
+        if drop:
+            msg = "connection reset"
+            raise httpx.ReadError(msg)
+        yield data[half:]
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ranged_downloader.time, "sleep", lambda _: None)
+
+
+def make_downloader(storage: RangeStorage, part_size: int = 1024) -> RangedDownloader:
+    client = httpx.Client(transport=httpx.MockTransport(storage))
+    return RangedDownloader(client=client, part_size=part_size, max_concurrency=4)
+
+
+def test_downloads_large_objects_in_concurrent_parts(tmp_path: Path):
+    storage = RangeStorage()
+
+    result = make_downloader(storage).download(URL, tmp_path / "asset.bin")
+
+    assert result.parts == 10
+    assert (tmp_path / "asset.bin").read_bytes() == CONTENT
+    assert result.content_hash.startswith("sha256:")
+    assert not list(tmp_path.glob(".*.part"))
+
+
+def test_small_objects_arrive_in_one_request(tmp_path: Path):
+    storage = RangeStorage(b"small")
+
+    result = make_downloader(storage).download(URL, tmp_path / "asset.bin")
+
+    assert result.parts == 1
+    assert storage.ranges == ["bytes=0-1023"]
+    assert (tmp_path / "asset.bin").read_bytes() == b"small"
+
+
+def test_empty_objects(tmp_path: Path):
+    result = make_downloader(RangeStorage(b"")).download(URL, tmp_path / "asset.bin")
+
+    assert result.bytes_downloaded == 0
+    assert (tmp_path / "asset.bin").read_bytes() == b""
+
+
+def test_servers_that_ignore_ranges_are_streamed_whole(tmp_path: Path):
+    storage = RangeStorage(honor_ranges=False)
+    storage.drops = 1
+
+    result = make_downloader(storage).download(URL, tmp_path / "asset.bin")
+
+    assert result.parts == 1
+    assert (tmp_path / "asset.bin").read_bytes() == CONTENT
+
+
+def test_dropped_connections_resume_from_the_last_byte_written(tmp_path: Path):
+    storage = RangeStorage(b"x" * 1000)
+    storage.drops = 1
+
+    make_downloader(storage).download(URL, tmp_path / "asset.bin")
+
+    assert storage.ranges == ["bytes=0-1023", "bytes=500-1023"]
+    assert (tmp_path / "asset.bin").read_bytes() == b"x" * 1000
+
+
+def test_expired_urls_are_signed_again_once_and_resumed(tmp_path: Path):
+    storage = RangeStorage()
+    refreshes: list[str] = []
+
+    def refresh_url() -> tuple[str, dict[str, str]]:
+        refreshes.append(REFRESHED_URL)
+        return REFRESHED_URL, {}
+
+    downloader = make_downloader(storage)
+    original_write = downloader._write_response
+
+    def expire_after_first_part(*args: object) -> None:
+        original_write(*args)
+        storage.expired.add("old")
+
+    downloader._write_response = expire_after_first_part
+    downloader.download(URL, tmp_path / "asset.bin", refresh_url=refresh_url)
+
+    assert refreshes == [REFRESHED_URL]
+    assert (tmp_path / "asset.bin").read_bytes() == CONTENT
+
+
+def test_rejected_urls_fail_without_a_way_to_sign_them_again(tmp_path: Path):
+    storage = RangeStorage()
+    storage.expired.add("old")
+
+    with pytest.raises(httpx.HTTPStatusError):
+        make_downloader(storage).download(URL, tmp_path / "asset.bin")
+    assert not (tmp_path / "asset.bin").exists()
@@ -0,0 +1,98 @@
+import httpx
+import pytest
+from base import circuit_breaker
+from base.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+
+REQUEST = httpx.Request("GET", "https://cloud.griptape.ai/api/structures")
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(circuit_breaker.time, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def breaker(clock: FakeClock) -> CircuitBreaker:  # noqa: ARG001
+    return CircuitBreaker("GET host/api/structures", failure_threshold=3, reset_timeout=30.0)
+
+
+def open_circuit(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+
+def test_opens_after_consecutive_failures(breaker: CircuitBreaker):
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+
+    breaker.record_failure()
+
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(REQUEST)
+
+
+def test_success_resets_the_failure_count(breaker: CircuitBreaker):
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+
+    assert breaker.state == CLOSED
+
+
+def test_lets_a_single_trial_through_after_the_reset_timeout(breaker: CircuitBreaker, clock: FakeClock):
+    open_circuit(breaker)
+    clock.now += 30.0
+
+    breaker.before_request(REQUEST)
+
+    assert breaker.state == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(REQUEST)
+
+
+def test_successful_trial_closes_the_circuit(breaker: CircuitBreaker, clock: FakeClock):
+    open_circuit(breaker)
+    clock.now += 30.0
+    breaker.before_request(REQUEST)
+
+    breaker.record_success()
+
+    assert breaker.state == CLOSED
+    breaker.before_request(REQUEST)
+
+
+def test_failed_trial_opens_the_circuit_again(breaker: CircuitBreaker, clock: FakeClock):
+    open_circuit(breaker)
+    clock.now += 30.0
+    breaker.before_request(REQUEST)
+
+    breaker.record_failure()
+
+    assert breaker.state == OPEN
+    clock.now += 29.0
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(REQUEST)
+
+
+def test_threshold_of_zero_disables_the_breaker(clock: FakeClock):  # noqa: ARG001
+    breaker = CircuitBreaker("GET host/api/structures", failure_threshold=0, reset_timeout=30.0)
+
+    for _ in range(10):
+        breaker.record_failure()
+
+    assert breaker.state == CLOSED
+    breaker.before_request(REQUEST)
@@ -0,0 +1,65 @@
+import httpx
+import pytest
+from base.endpoints import (
+    ASSETS,
+    DEFAULT,
+    EVENTS,
+    LISTINGS,
+    RUNS,
+    get_endpoint_class,
+    get_endpoint_key,
+    is_run_creation,
+)
+
+BASE_URL = "https://cloud.griptape.ai/api"
+ID = "3f1c2a9e-7b4d-4e8a-9c2f-5d6e7f8a9b0c"
+
+
+@pytest.mark.parametrize(
+    ("method", "path", "expected"),
+    [
+        ("GET", "/structures", "GET cloud.griptape.ai/api/structures"),
+        ("GET", f"/structures/{ID}", "GET cloud.griptape.ai/api/structures/{id}"),
+        ("GET", f"/structure-runs/{ID}/events", "GET cloud.griptape.ai/api/structure-runs/{id}/events"),
+        ("GET", f"/buckets/{ID}/assets", "GET cloud.griptape.ai/api/buckets/{id}/assets"),
+        ("GET", f"/buckets/{ID}/assets/report.pdf", "GET cloud.griptape.ai/api/buckets/{id}/assets/{name}"),
+        ("POST", f"/buckets/{ID}/asset-urls/a/b/c.txt", "POST cloud.griptape.ai/api/buckets/{id}/asset-urls/{name}"),
+        ("GET", "/deployments/12345", "GET cloud.griptape.ai/api/deployments/{id}"),
+    ],
+)
+def test_get_endpoint_key(method: str, path: str, expected: str):
+    assert get_endpoint_key(httpx.Request(method, f"{BASE_URL}{path}")) == expected
+
+
+def test_get_endpoint_key_collapses_asset_names_into_one_route():
+    keys = {
+        get_endpoint_key(httpx.Request("GET", f"{BASE_URL}/buckets/{ID}/assets/{name}"))
+        for name in ["a.txt", "b.txt", "nested/c.txt", "nested/deeper/d.txt"]
+    }
+
+    assert len(keys) == 1
+
+
+@pytest.mark.parametrize(
+    ("method", "path", "expected"),
+    [
+        ("GET", f"/structure-runs/{ID}/events", EVENTS),
+        ("GET", f"/assistant-runs/{ID}/events", EVENTS),
+        ("POST", f"/structures/{ID}/runs", RUNS),
+        ("GET", f"/structure-runs/{ID}", RUNS),
+        ("POST", f"/buckets/{ID}/asset-urls/report.pdf", ASSETS),
+        ("GET", f"/buckets/{ID}/assets", ASSETS),
+        ("GET", "/structures", LISTINGS),
+        ("GET", f"/structures/{ID}", DEFAULT),
+        ("POST", "/buckets", DEFAULT),
+    ],
+)
+def test_get_endpoint_class(method: str, path: str, expected: str):
+    assert get_endpoint_class(httpx.Request(method, f"{BASE_URL}{path}")) == expected
+
+
+def test_is_run_creation():
+    assert is_run_creation(httpx.Request("POST", f"{BASE_URL}/structures/{ID}/runs"))
+    assert is_run_creation(httpx.Request("POST", f"{BASE_URL}/assistants/{ID}/runs/"))
+    assert not is_run_creation(httpx.Request("GET", f"{BASE_URL}/structures/{ID}/runs"))
+    assert not is_run_creation(httpx.Request("POST", f"{BASE_URL}/structures"))
@@ -0,0 +1,79 @@
+from collections.abc import Iterator
+
+import httpx
+import pytest
+from base.griptape_cloud_client_registry import GriptapeCloudClientRegistry
+from base.resilient_transport import ResilientTransport
+
+BASE_URL = "https://cloud.griptape.ai/api"
+
+
+class ClosingMockTransport(httpx.MockTransport):
+    def __init__(self) -> None:
+        super().__init__(lambda _: httpx.Response(200, json={"structures": []}))
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def registry() -> Iterator[type[GriptapeCloudClientRegistry]]:
+    GriptapeCloudClientRegistry.close_all()
+    yield GriptapeCloudClientRegistry
+    GriptapeCloudClientRegistry.close_all()
+
+
+def get_transport(client: object) -> ResilientTransport:
+    return client._httpx_args["transport"]
+
+
+def mock_pool(transport: ResilientTransport) -> ClosingMockTransport:
+    transport._transport = ClosingMockTransport()
+    return transport._transport
+
+
+def test_shares_one_client_per_base_url_and_api_key(registry: type[GriptapeCloudClientRegistry]):
+    client = registry.get_client(BASE_URL, "key")
+
+    assert registry.get_client(f"{BASE_URL}/", "key") is client
+    assert registry.get_client("https://other.example.com/api", "key") is not client
+
+
+def test_rotating_the_api_key_builds_a_new_client(registry: type[GriptapeCloudClientRegistry]):
+    old_client = registry.get_client(BASE_URL, "old-key")
+    pool = mock_pool(get_transport(old_client))
+
+    new_client = registry.get_client(BASE_URL, "new-key")
+
+    assert new_client is not old_client
+    assert new_client.token == "new-key"  # noqa: S105
+    assert registry.get_client(BASE_URL, "new-key") is new_client
+    # Nothing was in flight on the retired client, so its connections are closed right away.
+    assert pool.closed
+
+
+def test_retired_transport_waits_for_open_responses(registry: type[GriptapeCloudClientRegistry]):
+    old_client = registry.get_client(BASE_URL, "old-key")
+    pool = mock_pool(get_transport(old_client))
+
+    with old_client.get_httpx_client().stream("GET", "/structures") as response:
+        registry.get_client(BASE_URL, "new-key")
+        assert not pool.closed
+        response.read()
+
+    assert pool.closed
+
+
+def test_close_all_closes_clients_and_rebuilds_them_on_demand(registry: type[GriptapeCloudClientRegistry]):
+    retired_client = registry.get_client(BASE_URL, "old-key")
+    retired_pool = mock_pool(get_transport(retired_client))
+
+    with retired_client.get_httpx_client().stream("GET", "/structures"):
+        client = registry.get_client(BASE_URL, "new-key")
+        httpx_client = client.get_httpx_client()
+        registry.close_all()
+
+        assert retired_pool.closed
+    assert httpx_client.is_closed
+    assert registry.get_client(BASE_URL, "new-key") is not client
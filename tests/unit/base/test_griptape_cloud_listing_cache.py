@@ -0,0 +1,116 @@
+import asyncio
+import threading
+import time
+from collections.abc import Iterator
+
+import pytest
+from base.griptape_cloud_listing_cache import GriptapeCloudListingCache, ListingCacheKey
+
+
+@pytest.fixture
+def key() -> Iterator[ListingCacheKey]:
+    GriptapeCloudListingCache.invalidate()
+    yield GriptapeCloudListingCache.make_key("https://cloud.griptape.ai/api/", "key", "structures")
+    GriptapeCloudListingCache.invalidate()
+
+
+class Loader:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.calls = 0
+        self.delay = delay
+
+    def __call__(self) -> int:
+        self.calls += 1
+        time.sleep(self.delay)
+        return self.calls
+
+    async def load_async(self) -> int:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.calls
+
+
+def test_keys_by_organization_without_keeping_the_api_key():
+    key = GriptapeCloudListingCache.make_key("https://cloud.griptape.ai/api/", "secret", "buckets")
+
+    assert key == GriptapeCloudListingCache.make_key("https://cloud.griptape.ai/api", "secret", "buckets")
+    assert key != GriptapeCloudListingCache.make_key("https://cloud.griptape.ai/api", "other", "buckets")
+    assert "secret" not in repr(key)
+
+
+def test_serves_fresh_entries_from_memory(key: ListingCacheKey):
+    loader = Loader()
+
+    assert GriptapeCloudListingCache.get(key, loader) == 1
+    assert GriptapeCloudListingCache.get(key, loader) == 1
+    assert GriptapeCloudListingCache.peek(key) == 1
+    assert loader.calls == 1
+
+
+def test_concurrent_misses_share_one_load(key: ListingCacheKey):
+    loader = Loader(delay=0.05)
+    results: list[int] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(GriptapeCloudListingCache.get(key, loader))) for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert results == [1] * 5
+    assert loader.calls == 1
+
+
+def test_serves_stale_entries_while_refreshing_them(key: ListingCacheKey):
+    loader = Loader()
+    GriptapeCloudListingCache.get(key, loader)
+
+    assert GriptapeCloudListingCache.get(key, loader, ttl=0) == 1
+    deadline = time.monotonic() + 5
+    while GriptapeCloudListingCache.peek(key) != 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert GriptapeCloudListingCache.peek(key) == 2
+
+
+def test_failed_refreshes_keep_the_stale_entry(key: ListingCacheKey):
+    GriptapeCloudListingCache.get(key, Loader())
+
+    def fail() -> int:
+        msg = "unavailable"
+        raise RuntimeError(msg)
+
+    assert GriptapeCloudListingCache.get(key, fail, ttl=0) == 1
+    time.sleep(0.05)
+    assert GriptapeCloudListingCache.peek(key) == 1
+
+
+def test_invalidate_drops_entries(key: ListingCacheKey):
+    GriptapeCloudListingCache.get(key, Loader())
+
+    GriptapeCloudListingCache.invalidate(resource="structures")
+
+    assert GriptapeCloudListingCache.peek(key) is None
+
+
+def test_async_misses_share_one_load_on_the_running_loop(key: ListingCacheKey):
+    loader = Loader(delay=0.05)
+
+    async def load_concurrently() -> list[int]:
+        return await asyncio.gather(*(GriptapeCloudListingCache.get_async(key, loader.load_async) for _ in range(5)))
+
+    assert asyncio.run(load_concurrently()) == [1] * 5
+    assert loader.calls == 1
+
+
+def test_async_refreshes_stale_entries_on_the_running_loop(key: ListingCacheKey):
+    loader = Loader()
+
+    async def refresh() -> tuple[int, int]:
+        first = await GriptapeCloudListingCache.get_async(key, loader.load_async)
+        stale = await GriptapeCloudListingCache.get_async(key, loader.load_async, ttl=0)
+        await asyncio.sleep(0.05)
+        return first, stale
+
+    assert asyncio.run(refresh()) == (1, 1)
+    assert GriptapeCloudListingCache.peek(key) == 2
@@ -0,0 +1,25 @@
+import threading
+from pathlib import Path
+
+from base.instrumentation import PhaseRecord, PrometheusTextfileSink
+
+
+def test_prometheus_textfile_is_replaced_whole_by_concurrent_flushes(tmp_path: Path):
+    path = tmp_path / "metrics" / "griptape_cloud.prom"
+    sink = PrometheusTextfileSink(path, flush_interval=0.0)
+
+    def record_phases(name: str) -> None:
+        for _ in range(50):
+            sink.record_phase(PhaseRecord(name=name, start_time_ns=0, duration=0.1))
+
+    threads = [threading.Thread(target=record_phases, args=(f"phase-{i}",)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    sink.flush()
+
+    text = path.read_text()
+    assert text.startswith("# TYPE griptape_cloud_phase_duration_seconds histogram\n")
+    assert all(f'griptape_cloud_phase_duration_seconds_count{{phase="phase-{i}"}} 50' in text for i in range(8))
+    assert list(path.parent.iterdir()) == [path]
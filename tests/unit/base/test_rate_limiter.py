@@ -0,0 +1,102 @@
+import threading
+import time
+from collections.abc import Iterator
+
+import httpx
+import pytest
+from base.endpoints import LISTINGS, RUNS
+from base.rate_limiter import (
+    TOTAL,
+    GriptapeCloudRateLimiter,
+    RequestPriority,
+    TokenBucket,
+    request_priority,
+)
+
+BASE_URL = "https://cloud.griptape.ai/api"
+ID = "3f1c2a9e-7b4d-4e8a-9c2f-5d6e7f8a9b0c"
+
+
+@pytest.fixture
+def rate_limiter() -> Iterator[type[GriptapeCloudRateLimiter]]:
+    GriptapeCloudRateLimiter.reset_all()
+    yield GriptapeCloudRateLimiter
+    GriptapeCloudRateLimiter.reset_all()
+
+
+def test_takes_tokens_up_to_the_burst_without_waiting():
+    bucket = TokenBucket(rate=1.0, burst=3)
+
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.stats.requests == 3
+    assert bucket.stats.throttled == 0
+
+
+def test_zero_rate_disables_the_bucket():
+    bucket = TokenBucket(rate=0.0, burst=1)
+
+    assert all(bucket.acquire() == 0.0 for _ in range(100))
+
+
+def test_waiters_of_a_higher_priority_go_first():
+    bucket = TokenBucket(rate=100.0, burst=5)
+    bucket._waiting[RequestPriority.HIGH] += 1
+
+    assert bucket._try_acquire(RequestPriority.LOW) > 0
+    assert bucket._try_acquire(RequestPriority.NORMAL) > 0
+    assert bucket._try_acquire(RequestPriority.HIGH) == 0
+
+
+def test_high_priority_waiter_overtakes_a_queued_low_priority_one():
+    bucket = TokenBucket(rate=4.0, burst=1)
+    bucket.acquire()
+    order: list[RequestPriority] = []
+
+    def acquire(priority: RequestPriority) -> None:
+        bucket.acquire(priority)
+        order.append(priority)
+
+    low = threading.Thread(target=acquire, args=(RequestPriority.LOW,))
+    low.start()
+    # Let the low priority waiter queue up before the high priority one arrives.
+    time.sleep(0.05)
+    high = threading.Thread(target=acquire, args=(RequestPriority.HIGH,))
+    high.start()
+    low.join(timeout=5)
+    high.join(timeout=5)
+
+    assert order == [RequestPriority.HIGH, RequestPriority.LOW]
+    assert bucket.stats.throttled == 2
+
+
+def test_run_creation_overtakes_queued_listing_refreshes_across_endpoint_classes(
+    rate_limiter: type[GriptapeCloudRateLimiter],
+):
+    # Only the total bucket limits, so the requests compete there rather than in their own class.
+    rate_limiter._buckets[RUNS] = TokenBucket(rate=0.0, burst=1)
+    rate_limiter._buckets[LISTINGS] = TokenBucket(rate=0.0, burst=1)
+    rate_limiter._buckets[TOTAL] = TokenBucket(rate=10.0, burst=1)
+    rate_limiter.get_bucket(TOTAL).acquire()
+    order: list[str] = []
+
+    def refresh_listing(name: str) -> None:
+        with request_priority(RequestPriority.LOW):
+            rate_limiter.acquire(httpx.Request("GET", f"{BASE_URL}/structures"))
+        order.append(name)
+
+    def create_run() -> None:
+        rate_limiter.acquire(httpx.Request("POST", f"{BASE_URL}/structures/{ID}/runs"))
+        order.append("run")
+
+    refreshes = [threading.Thread(target=refresh_listing, args=(f"listing-{i}",)) for i in range(2)]
+    for thread in refreshes:
+        thread.start()
+    # Let the listing refreshes queue up before the run is created.
+    time.sleep(0.03)
+    run = threading.Thread(target=create_run)
+    run.start()
+    for thread in [*refreshes, run]:
+        thread.join(timeout=5)
+
+    assert order[0] == "run"
+    assert sorted(order[1:]) == ["listing-0", "listing-1"]
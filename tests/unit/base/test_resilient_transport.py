@@ -0,0 +1,97 @@
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import httpx
+import pytest
+from base.resilient_transport import IDEMPOTENCY_KEY_HEADER, RetryPolicy, parse_retry_after
+
+URL = "https://cloud.griptape.ai/api/structures"
+
+
+def make_response(status_code: int, headers: dict[str, str] | None = None) -> httpx.Response:
+    return httpx.Response(status_code, headers=headers)
+
+
+class TestParseRetryAfter:
+    @pytest.mark.parametrize(("value", "expected"), [("5", 5.0), ("0.5", 0.5), ("-3", 0.0)])
+    def test_seconds(self, value: str, expected: float):
+        assert parse_retry_after(value) == expected
+
+    @pytest.mark.parametrize("value", [None, "", "soon"])
+    def test_missing_or_invalid(self, value: str | None):
+        assert parse_retry_after(value) is None
+
+    def test_http_date(self):
+        retry_at = datetime.now(UTC) + timedelta(seconds=30)
+
+        assert 25 < parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 30
+
+    def test_http_date_in_the_past(self):
+        retry_at = datetime.now(UTC) - timedelta(seconds=30)
+
+        assert parse_retry_after(format_datetime(retry_at, usegmt=True)) == 0.0
+
+
+class TestRetryPolicy:
+    @pytest.fixture
+    def policy(self) -> RetryPolicy:
+        return RetryPolicy(max_retries=2, backoff_base=1.0, backoff_max=8.0, retry_after_max=60.0)
+
+    @pytest.mark.parametrize("method", ["GET", "PUT", "DELETE"])
+    def test_retries_idempotent_requests_on_server_errors(self, policy: RetryPolicy, method: str):
+        request = httpx.Request(method, URL)
+
+        assert 0 <= policy.get_retry_delay(request, 0, response=make_response(503)) <= 1.0
+        assert 0 <= policy.get_retry_delay(request, 1, response=make_response(503)) <= 2.0
+
+    def test_does_not_retry_client_errors(self, policy: RetryPolicy):
+        assert policy.get_retry_delay(httpx.Request("GET", URL), 0, response=make_response(404)) is None
+
+    def test_stops_after_max_retries(self, policy: RetryPolicy):
+        assert policy.get_retry_delay(httpx.Request("GET", URL), 2, response=make_response(503)) is None
+
+    def test_does_not_retry_post_on_server_errors(self, policy: RetryPolicy):
+        request = httpx.Request("POST", URL)
+
+        assert policy.get_retry_delay(request, 0, response=make_response(503)) is None
+        assert policy.get_retry_delay(request, 0, error=httpx.ReadTimeout("timed out")) is None
+
+    def test_retries_post_when_it_was_not_acted_on(self, policy: RetryPolicy):
+        request = httpx.Request("POST", URL)
+
+        assert policy.get_retry_delay(request, 0, response=make_response(429)) is not None
+        assert policy.get_retry_delay(request, 0, error=httpx.ConnectError("refused")) is not None
+
+    def test_retries_idempotent_requests_on_transport_errors(self, policy: RetryPolicy):
+        assert policy.get_retry_delay(httpx.Request("GET", URL), 0, error=httpx.ReadTimeout("timed out")) is not None
+
+    def test_honors_retry_after(self, policy: RetryPolicy):
+        response = make_response(429, {"Retry-After": "12"})
+
+        assert policy.get_retry_delay(httpx.Request("GET", URL), 0, response=response) == 12.0
+
+    def test_gives_up_when_retry_after_is_too_long(self, policy: RetryPolicy):
+        response = make_response(503, {"Retry-After": "61"})
+
+        assert policy.get_retry_delay(httpx.Request("GET", URL), 0, response=response) is None
+
+    def test_backoff_is_capped(self, policy: RetryPolicy):
+        assert all(0 <= policy.get_backoff(10) <= policy.backoff_max for _ in range(100))
+
+    def test_idempotency_keys_are_off_by_default(self, policy: RetryPolicy):
+        request = httpx.Request("POST", URL)
+
+        policy.prepare(request)
+
+        assert IDEMPOTENCY_KEY_HEADER not in request.headers
+
+    def test_idempotency_keys_make_post_retryable(self):
+        policy = RetryPolicy(idempotency_keys=True)
+        request = httpx.Request("POST", URL)
+
+        policy.prepare(request)
+        key = request.headers[IDEMPOTENCY_KEY_HEADER]
+        policy.prepare(request)
+
+        assert request.headers[IDEMPOTENCY_KEY_HEADER] == key
+        assert policy.get_retry_delay(request, 0, response=make_response(503)) is not None
@@ -0,0 +1,65 @@
+from types import SimpleNamespace
+from typing import Any
+
+from base.run_event_buffer import RunEventBuffer
+
+
+def make_event(payload: str, type_: str = "TextEvent") -> Any:
+    return SimpleNamespace(payload=payload, type_=type_)
+
+
+def make_buffer(flushed: list[str], **kwargs) -> RunEventBuffer:
+    options = {"max_events": 100, "max_bytes": 1024, "flush_interval": 0.0, "excluded_types": [], **kwargs}
+    return RunEventBuffer(flushed.append, **options)
+
+
+def test_keeps_only_the_most_recent_events():
+    flushed: list[str] = []
+    buffer = make_buffer(flushed, max_events=3)
+
+    buffer.extend(make_event(str(i)) for i in range(5))
+
+    assert buffer.text == "[2 earlier events omitted]\n2\n3\n4"
+    assert flushed == [buffer.text]
+
+
+def test_keeps_within_the_byte_limit():
+    flushed: list[str] = []
+    buffer = make_buffer(flushed, max_bytes=10)
+
+    buffer.extend([make_event("aaaa"), make_event("bbbb"), make_event("cccc")])
+
+    assert buffer.text == "[1 earlier events omitted]\nbbbb\ncccc"
+
+
+def test_keeps_the_tail_of_an_oversized_event():
+    flushed: list[str] = []
+    buffer = make_buffer(flushed, max_bytes=8)
+
+    buffer.extend([make_event("0123456789")])
+
+    assert buffer.text == "3456789"
+
+
+def test_drops_excluded_event_types():
+    flushed: list[str] = []
+    buffer = make_buffer(flushed, excluded_types=["TextChunkEvent"])
+
+    buffer.extend([make_event("chunk", "TextChunkEvent"), make_event("done")])
+
+    assert buffer.text == "done"
+
+
+def test_throttles_flushes():
+    flushed: list[str] = []
+    buffer = make_buffer(flushed, flush_interval=60.0)
+
+    buffer.extend([make_event("first")])
+    buffer.extend([make_event("second")])
+
+    assert flushed == ["first"]
+
+    buffer.flush()
+    buffer.flush()
+
+    assert flushed == ["first", "first\nsecond"]
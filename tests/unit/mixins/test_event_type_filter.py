@@ -0,0 +1,27 @@
+from types import SimpleNamespace
+
+from mixins.event_type_filter import EventTypeFilter
+
+
+def test_empty_filter_allows_everything():
+    event_filter = EventTypeFilter.create()
+    events = [SimpleNamespace(type_="A"), SimpleNamespace(type_="B")]
+
+    assert not event_filter
+    assert event_filter.apply(events) is events
+
+
+def test_include_and_exclude():
+    event_filter = EventTypeFilter.create(include_types=["A", "B"], exclude_types=["B"])
+
+    assert event_filter
+    assert event_filter.allows("A")
+    assert not event_filter.allows("B")
+    assert not event_filter.allows("C")
+
+
+def test_apply_filters_events_by_type():
+    event_filter = EventTypeFilter.create(exclude_types=["TextChunkEvent"])
+    events = [SimpleNamespace(type_="TextChunkEvent"), SimpleNamespace(type_="FinishStructureRunEvent")]
+
+    assert [event.type_ for event in event_filter.apply(events)] == ["FinishStructureRunEvent"]
@@ -0,0 +1,104 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+from mixins.run_event_poller import RunEventPoller, RunEventSubscription
+
+DONE = "done"
+
+
+def make_fetch(pages: list[list[str]]):
+    """Returns a fetch serving the pages in order, then empty pages, and the offsets it was called with."""
+    offsets: list[float | None] = []
+
+    def fetch(_run_id: str, offset: float | None) -> SimpleNamespace:
+        offsets.append(offset)
+        events = pages.pop(0) if pages else []
+        return SimpleNamespace(events=events, next_offset=len(offsets))
+
+    return fetch, offsets
+
+
+@pytest.fixture
+def poller() -> RunEventPoller:
+    return RunEventPoller(max_requests_per_second=1000.0)
+
+
+def test_delivers_event_batches_until_the_completion_event(poller: RunEventPoller):
+    fetch, offsets = make_fetch([["a"], [], ["b", DONE]])
+
+    subscription = poller.subscribe("run", fetch, lambda event: event == DONE)
+
+    assert list(subscription.iter_batches()) == [["a"], ["b", DONE]]
+    assert offsets == [None, 1, 2]
+
+
+def test_checks_the_status_of_idle_runs_whose_completion_event_is_filtered(poller: RunEventPoller):
+    fetch, _ = make_fetch([["a"]])
+    status_checks: list[str] = []
+
+    def is_run_finished(run_id: str) -> bool:
+        status_checks.append(run_id)
+        return True
+
+    subscription = poller.subscribe("run", fetch, lambda _: False, is_run_finished=is_run_finished)
+
+    assert list(subscription.iter_batches()) == [["a"]]
+    assert status_checks == ["run"]
+
+
+def test_delivers_polling_errors(poller: RunEventPoller):
+    def fetch(_run_id: str, _offset: float | None) -> SimpleNamespace:
+        msg = "boom"
+        raise RuntimeError(msg)
+
+    subscription = poller.subscribe("run", fetch, lambda _: False)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        list(subscription.iter_batches())
+    assert isinstance(subscription.error, RuntimeError)
+
+
+def test_calls_back_runs_that_do_not_keep_their_events(poller: RunEventPoller):
+    finished = threading.Event()
+    fetch, _ = make_fetch([["a"], [DONE]])
+
+    subscription = poller.subscribe(
+        "run", fetch, lambda event: event == DONE, keep_events=False, on_finished=lambda _: finished.set()
+    )
+
+    assert finished.wait(timeout=5)
+    assert list(subscription.iter_batches()) == []
+
+
+def test_polls_many_runs_together(poller: RunEventPoller):
+    subscriptions = [
+        poller.subscribe(f"run-{i}", make_fetch([[f"event-{i}"], [DONE]])[0], lambda event: event == DONE)
+        for i in range(20)
+    ]
+
+    assert [list(subscription.iter_batches()) for subscription in subscriptions] == [
+        [[f"event-{i}"], [DONE]] for i in range(20)
+    ]
+
+
+def test_unsubscribed_runs_are_no_longer_polled(poller: RunEventPoller):
+    fetch, offsets = make_fetch([])
+    subscription = poller.subscribe("run", fetch, lambda _: False)
+
+    poller.unsubscribe(subscription)
+
+    assert not subscription.active
+    polled = len(offsets)
+    threading.Event().wait(0.3)
+    assert len(offsets) == polled
+
+
+def test_subscription_backs_off_while_idle():
+    subscription = RunEventSubscription(run_id="run", fetch=lambda *_: None, is_completion_event=lambda _: False)
+
+    delays = [subscription.schedule_next_poll(received_events=False) for _ in range(3)]
+
+    assert delays == sorted(delays)
+    assert delays[0] < delays[-1]
+    assert subscription.schedule_next_poll(received_events=True) == subscription.poll_interval.min_interval
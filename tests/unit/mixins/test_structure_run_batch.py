@@ -0,0 +1,109 @@
+import threading
+import time
+from types import SimpleNamespace
+
+from griptape_cloud_client.models.structure_run_status import StructureRunStatus
+from mixins.griptape_cloud_api_mixin import GriptapeCloudApi
+from mixins.run_event_poller import STRUCTURE_RUN_COMPLETED_EVENT_TYPE, RunEventPoller
+from mixins.structure_run_batch import RUN_FAILED, RUN_SUCCEEDED
+
+COMPLETED_EVENT = SimpleNamespace(type_=STRUCTURE_RUN_COMPLETED_EVENT_TYPE, origin="SYSTEM")
+
+
+class FakeStructureRuns(GriptapeCloudApi):
+    """Runs that finish `duration` seconds after they are created, failing when their first argument is "fail"."""
+
+    def __init__(self, duration: float = 0.05, create_delay: float = 0.0) -> None:
+        super().__init__(gtc_client=None)
+        self.duration = duration
+        self.create_delay = create_delay
+        self.lock = threading.Lock()
+        self.created: dict[str, tuple[float, list[str]]] = {}
+        self.running = 0
+        self.max_running = 0
+
+    def _create_structure_run(self, structure_id: str, args: list[str]) -> SimpleNamespace:  # noqa: ARG002
+        time.sleep(self.create_delay)
+        with self.lock:
+            structure_run_id = f"run-{len(self.created)}-{args[0]}"
+            self.created[structure_run_id] = (time.monotonic(), args)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        return SimpleNamespace(structure_run_id=structure_run_id)
+
+    def _is_done(self, structure_run_id: str) -> bool:
+        return time.monotonic() - self.created[structure_run_id][0] >= self.duration
+
+    def _list_structure_run_events(
+        self,
+        structure_run_id: str,
+        offset: float | None = None,
+        event_filter: object = None,  # noqa: ARG002
+    ) -> SimpleNamespace:
+        events = [COMPLETED_EVENT] if self._is_done(structure_run_id) else []
+        if events:
+            with self.lock:
+                self.running -= 1
+        return SimpleNamespace(events=events, next_offset=offset)
+
+    def _get_structure_run(self, structure_run_id: str) -> SimpleNamespace:
+        args = self.created[structure_run_id][1]
+        if not self._is_done(structure_run_id):
+            return SimpleNamespace(status=StructureRunStatus.RUNNING, output=None)
+        if args[0] == "fail":
+            return SimpleNamespace(status=StructureRunStatus.FAILED, output=None)
+        return SimpleNamespace(status=StructureRunStatus.SUCCEEDED, output={"value": args[0]})
+
+
+def test_runs_every_argument_list_and_keeps_their_order():
+    api = FakeStructureRuns()
+    reported = []
+
+    results = api._run_structure_batch("structure", [[str(i)] for i in range(10)], on_result=reported.append)
+
+    assert [result.index for result in results] == list(range(10))
+    assert [result.status for result in results] == [RUN_SUCCEEDED] * 10
+    assert [result.output for result in results] == [{"value": str(i)} for i in range(10)]
+    assert sorted(result.index for result in reported) == list(range(10))
+
+
+def test_bounds_the_runs_in_flight():
+    api = FakeStructureRuns(duration=0.1)
+
+    api._run_structure_batch("structure", [[str(i)] for i in range(12)], max_in_flight=3)
+
+    assert api.max_running <= 3
+
+
+def test_failed_runs_do_not_stop_the_batch():
+    api = FakeStructureRuns()
+
+    results = api._run_structure_batch("structure", [["ok"], ["fail"], ["ok"]])
+
+    assert [result.status for result in results] == [RUN_SUCCEEDED, RUN_FAILED, RUN_SUCCEEDED]
+    assert "FAILED" in str(results[1].error)
+
+
+def test_timed_out_runs_are_reported_and_no_longer_tracked():
+    api = FakeStructureRuns(duration=60.0)
+
+    results = api._run_structure_batch("structure", [["a"], ["b"]], timeout=0.3)
+
+    assert [result.status for result in results] == [RUN_FAILED, RUN_FAILED]
+    assert all("Timed out" in str(result.error) for result in results)
+    assert all(result.structure_run_id in api.created for result in results)
+    tracked = {subscription.run_id for subscription in RunEventPoller.get_instance()._subscriptions}
+    assert tracked.isdisjoint(api.created)
+
+
+def test_runs_created_after_a_timeout_are_not_tracked():
+    api = FakeStructureRuns(duration=60.0, create_delay=0.3)
+
+    results = api._run_structure_batch("structure", [["late"]], timeout=0.1)
+    # Let the submission that was already in flight create its run.
+    time.sleep(0.5)
+
+    assert results[0].status == RUN_FAILED
+    assert len(api.created) == 1
+    tracked = {subscription.run_id for subscription in RunEventPoller.get_instance()._subscriptions}
+    assert tracked.isdisjoint(api.created)
@@ -0,0 +1,74 @@
+import zipfile
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from publish_workflow import package_member_cache
+from publish_workflow.package_member_cache import PackageMemberCache
+from publish_workflow.workflow_package_builder import WorkflowPackageBuilder
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setattr(PackageMemberCache, "_members", None)
+    yield
+    PackageMemberCache._members = None
+
+
+def write_files(directory: Path, count: int) -> list[Path]:
+    directory.mkdir()
+    paths = [directory / f"file-{i}.txt" for i in range(count)]
+    for i, path in enumerate(paths):
+        path.write_text(f"content {i}\n" * 1000)
+    return paths
+
+
+def test_save_evicts_the_least_recently_used_members(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(package_member_cache, "DEFAULT_PACKAGE_CACHE_MAX_SIZE_MB", 0)
+    paths = write_files(tmp_path / "files", 2)
+    blob_paths = [PackageMemberCache.put(f"sha256:{i:064x}", path)[1] for i, path in enumerate(paths)]
+
+    PackageMemberCache.save()
+
+    assert not any(blob_path.exists() for blob_path in blob_paths)
+    assert PackageMemberCache.get(f"sha256:{0:064x}") is None
+
+
+def test_save_keeps_pinned_members(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(package_member_cache, "DEFAULT_PACKAGE_CACHE_MAX_SIZE_MB", 0)
+    paths = write_files(tmp_path / "files", 2)
+    pinned_hash, other_hash = f"sha256:{0:064x}", f"sha256:{1:064x}"
+    PackageMemberCache.put(pinned_hash, paths[0])
+    PackageMemberCache.put(other_hash, paths[1])
+
+    with PackageMemberCache.pinned([pinned_hash]):
+        PackageMemberCache.save()
+        assert PackageMemberCache.get(pinned_hash) is not None
+        assert PackageMemberCache.get(other_hash) is None
+
+    PackageMemberCache.save()
+    assert PackageMemberCache.get(pinned_hash) is None
+
+
+def test_build_compresses_members_evicted_by_another_process_again(tmp_path: Path):
+    paths = write_files(tmp_path / "files", 3)
+    builder = WorkflowPackageBuilder()
+    for path in paths:
+        builder.add_file(path.name, path)
+    expected = builder.dry_run().content_hash
+
+    chunks = builder.iter_archive()
+    first_chunk = next(chunks)
+    # Another process evicts every blob while the archive is being streamed.
+    for blob_path in (PackageMemberCache._cache_directory() / "blobs").rglob("*"):
+        if blob_path.is_file():
+            blob_path.unlink()
+    archive = first_chunk + b"".join(chunks)
+
+    assert builder.result is not None
+    assert builder.result.content_hash == expected
+    (tmp_path / "package.zip").write_bytes(archive)
+    with zipfile.ZipFile(tmp_path / "package.zip") as package:
+        assert package.testzip() is None
+        assert package.read("file-2.txt") == paths[2].read_bytes()
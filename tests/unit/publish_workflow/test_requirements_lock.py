@@ -0,0 +1,63 @@
+import subprocess
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from publish_workflow import requirements_lock
+from publish_workflow.requirements_lock import RequirementsLock
+
+REQUIREMENTS = ["requests", "griptape-nodes", "requests"]
+LOCK = "certifi==2024.1.1\ngriptape-nodes==1.0.0\nrequests==2.32.0\n"
+
+
+class FakeUv:
+    """Stands in for `uv pip compile`, printing the lock or failing like it does without network access."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.fail = False
+
+    def __call__(self, _args: list[str], *, input: str, **_kwargs: object) -> SimpleNamespace:  # noqa: A002
+        self.calls.append(input)
+        if self.fail:
+            raise subprocess.CalledProcessError(1, "uv", stderr="network unreachable")
+        return SimpleNamespace(stdout=f"\n{LOCK}")
+
+
+@pytest.fixture
+def uv(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> FakeUv:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    fake_uv = FakeUv()
+    monkeypatch.setattr(requirements_lock.shutil, "which", lambda _: "/usr/bin/uv")
+    monkeypatch.setattr(requirements_lock.subprocess, "run", fake_uv)
+    return fake_uv
+
+
+def test_resolves_sorted_unique_requirements_once_within_the_ttl(uv: FakeUv):
+    assert RequirementsLock.resolve(REQUIREMENTS) == LOCK
+    assert RequirementsLock.resolve(reversed(REQUIREMENTS)) == LOCK
+
+    assert uv.calls == ["griptape-nodes\nrequests\n"]
+
+
+def test_resolves_again_past_the_ttl(uv: FakeUv, monkeypatch: pytest.MonkeyPatch):
+    RequirementsLock.resolve(REQUIREMENTS)
+    monkeypatch.setattr(requirements_lock, "DEFAULT_LOCK_TTL_HOURS", 0.0)
+
+    assert RequirementsLock.resolve(REQUIREMENTS) == LOCK
+    assert len(uv.calls) == 2
+
+
+def test_reuses_the_expired_lock_when_resolution_fails(uv: FakeUv, monkeypatch: pytest.MonkeyPatch):
+    RequirementsLock.resolve(REQUIREMENTS)
+    monkeypatch.setattr(requirements_lock, "DEFAULT_LOCK_TTL_HOURS", 0.0)
+    uv.fail = True
+
+    assert RequirementsLock.resolve(REQUIREMENTS) == LOCK
+
+
+def test_falls_back_to_unpinned_requirements_that_were_never_resolved(uv: FakeUv, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(requirements_lock.shutil, "which", lambda _: None)
+
+    assert RequirementsLock.resolve(REQUIREMENTS) == "griptape-nodes\nrequests\n"
+    assert uv.calls == []
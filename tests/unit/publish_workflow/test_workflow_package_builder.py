@@ -0,0 +1,73 @@
+import zipfile
+from pathlib import Path
+
+import pytest
+from publish_workflow.workflow_package_builder import WorkflowPackageBuilder
+
+
+@pytest.fixture
+def workflow_directory(tmp_path: Path) -> Path:
+    directory = tmp_path / "workflow"
+    (directory / "library" / "__pycache__").mkdir(parents=True)
+    (directory / "workflow.py").write_text("print('hello')\n")
+    (directory / "library" / "nodes.py").write_text("NODES = []\n" * 100)
+    (directory / "library" / "__pycache__" / "nodes.cpython-312.pyc").write_bytes(b"\0")
+    script = directory / "install.sh"
+    script.write_text("#!/bin/sh\necho installed\n")
+    script.chmod(0o755)
+    return directory
+
+
+def make_builder(directory: Path, *, reverse: bool = False) -> WorkflowPackageBuilder:
+    builder = WorkflowPackageBuilder()
+    steps = [
+        lambda: builder.add_file("workflow.py", directory / "workflow.py"),
+        lambda: builder.add_file("install.sh", directory / "install.sh"),
+        lambda: builder.add_tree("libraries/library", directory / "library"),
+        lambda: builder.add_bytes(".env", "GT_CLOUD_API_KEY=key\n"),
+    ]
+    for step in reversed(steps) if reverse else steps:
+        step()
+    return builder
+
+
+def test_same_inputs_build_identical_archives(workflow_directory: Path, tmp_path: Path):
+    first = make_builder(workflow_directory).build(tmp_path / "first.zip")
+    second = make_builder(workflow_directory, reverse=True).build(tmp_path / "second.zip")
+
+    assert (tmp_path / "first.zip").read_bytes() == (tmp_path / "second.zip").read_bytes()
+    assert first.content_hash == second.content_hash
+    assert second.reused == 3
+    assert second.compressed == 0
+
+
+def test_streamed_archive_matches_the_built_file(workflow_directory: Path, tmp_path: Path):
+    result = make_builder(workflow_directory).build(tmp_path / "package.zip")
+    builder = make_builder(workflow_directory)
+
+    assert b"".join(builder.iter_archive()) == (tmp_path / "package.zip").read_bytes()
+    assert builder.result is not None
+    assert builder.result.content_hash == result.content_hash
+
+
+def test_archive_contents(workflow_directory: Path, tmp_path: Path):
+    make_builder(workflow_directory).build(tmp_path / "package.zip")
+
+    with zipfile.ZipFile(tmp_path / "package.zip") as archive:
+        assert archive.testzip() is None
+        assert archive.namelist() == [".env", "install.sh", "libraries/library/nodes.py", "workflow.py"]
+        assert archive.read("libraries/library/nodes.py") == b"NODES = []\n" * 100
+        assert archive.read(".env") == b"GT_CLOUD_API_KEY=key\n"
+        assert all(info.date_time == (1980, 1, 1, 0, 0, 0) for info in archive.infolist())
+        assert archive.getinfo("install.sh").external_attr >> 16 == 0o100755
+        assert archive.getinfo("workflow.py").external_attr >> 16 == 0o100644
+
+
+def test_changed_file_changes_the_archive(workflow_directory: Path):
+    before = make_builder(workflow_directory).dry_run()
+    (workflow_directory / "workflow.py").write_text("print('changed')\n")
+
+    after = make_builder(workflow_directory).dry_run()
+
+    assert after.content_hash != before.content_hash
+    assert after.compressed == 1